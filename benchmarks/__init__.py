@@ -0,0 +1,23 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Benchmark harness for puck-bot: fake upstreams and a poll-cycle benchmark.
+Not shipped in the container image; run from the repository root.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
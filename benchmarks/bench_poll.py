@@ -0,0 +1,254 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Poll-cycle benchmark. Drives StreamMonitor.poll_once end to end against the
+fake upstreams at several roster sizes and reports cycle latency, memory
+allocations, HTTP calls per upstream, YouTube quota spend and role writes.
+Results are written as JSON (tagged with the git commit) and can be
+compared against a previous run:
+
+    python -m benchmarks.bench_poll --sizes 10,100,1000 --output new.json
+    python -m benchmarks.bench_poll --compare old.json
+----------------------------------------------------------------------------
+FILE VERSION: v1.1.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from benchmarks.fakes import HELIX_BUCKET_SIZE, FakeBot, FakeUpstreams, FaultProfile, make_roster
+from benchmarks.pipeline import REPO_ROOT, build_pipeline
+from src.utils.stats import percentile
+
+# Metrics compared by --compare (lower is better for all of them)
+COMPARED = (
+    ("cold_seconds", "cold cycle (s)"),
+    ("warm_p50_seconds", "warm p50 (s)"),
+    ("warm_p95_seconds", "warm p95 (s)"),
+    ("alloc_peak_kib", "alloc peak (KiB)"),
+    ("http_calls_per_cycle", "HTTP calls/cycle"),
+    ("quota_units", "quota units"),
+)
+REGRESSION_THRESHOLD = 0.10  # Flag changes worse than +10%
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, timeout=30
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def run_environment() -> dict[str, Any]:
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+# ---------------------------------------------------------------------------
+# One Roster Size
+# ---------------------------------------------------------------------------
+async def bench_size(size: int, args: argparse.Namespace) -> dict[str, Any]:
+    """Run the timed cycles, then the allocation cycles, for one roster size."""
+    channels = make_roster(size, seed=args.seed)
+    fault = FaultProfile(args.latency_ms, args.jitter_ms, args.error_rate)
+    total_cycles = args.cycles + args.alloc_cycles
+    # Each cycle stands in for a full poll interval, during which the real
+    # Helix bucket would refill — size the fake bucket to cover the run
+    upstreams = FakeUpstreams(
+        channels,
+        default_fault=fault,
+        seed=args.seed,
+        helix_bucket=HELIX_BUCKET_SIZE * (total_cycles + 1),
+    )
+    bot = FakeBot(FaultProfile(args.gateway_latency_ms, 0.0, args.error_rate), seed=args.seed)
+    rng = random.Random(args.seed)
+    for channel in rng.sample(channels, int(size * args.live_fraction)):
+        upstreams.set_live(channel, True)
+
+    with tempfile.TemporaryDirectory(prefix="puck-bench-") as tmp:
+        pipe = build_pipeline(Path(tmp), channels, upstreams.transport(), bot, log_level=args.log_level)
+        try:
+            timings: list[float] = []
+            for cycle in range(args.cycles):
+                if cycle:
+                    upstreams.churn(args.churn)
+                started = time.perf_counter()
+                await pipe.monitor.poll_once()
+                timings.append(time.perf_counter() - started)
+
+            # Allocations are measured separately — tracemalloc slows
+            # everything down and would distort the latency figures
+            peaks: list[int] = []
+            retained = 0
+            tracemalloc.start()
+            try:
+                for _ in range(args.alloc_cycles):
+                    upstreams.churn(args.churn)
+                    before, _ = tracemalloc.get_traced_memory()
+                    tracemalloc.reset_peak()
+                    await pipe.monitor.poll_once()
+                    after, peak = tracemalloc.get_traced_memory()
+                    peaks.append(peak - before)
+                    retained += after - before
+            finally:
+                tracemalloc.stop()
+
+            state_bytes = sum(p.stat().st_size for p in Path(tmp).glob("*.json"))
+            stages = {
+                row["name"]: {"p50": round(row["p50"], 6), "max": round(row["max"], 6)}
+                for row in pipe.tracer.slowest_stages(12)
+            }
+            quota = pipe.youtube_quota.used_today
+        finally:
+            await pipe.close()
+
+    warm = sorted(timings[1:]) or sorted(timings)
+    http_calls = upstreams.calls_by_upstream()
+    return {
+        "size": size,
+        "twitch_streams": sum(1 for c in channels if c.twitch_login),
+        "youtube_channels": sum(1 for c in channels if c.youtube_channel_id),
+        "cycles": total_cycles,
+        "cold_seconds": round(timings[0], 6),
+        "warm_p50_seconds": round(percentile(warm, 50), 6),
+        "warm_p95_seconds": round(percentile(warm, 95), 6),
+        "warm_max_seconds": round(warm[-1], 6),
+        "warm_mean_seconds": round(statistics.fmean(warm), 6),
+        "alloc_peak_kib": round(max(peaks, default=0) / 1024, 1),
+        "alloc_retained_kib": round(retained / 1024, 1),
+        "http_calls": http_calls,
+        "http_calls_per_cycle": round(sum(http_calls.values()) / total_cycles, 1),
+        "http_errors_injected": dict(upstreams.errors),
+        "quota_units": quota,
+        "gateway_calls": dict(bot.calls),
+        "role_writes": bot.calls["add_role"] + bot.calls["remove_role"],
+        "state_file_bytes": state_bytes,
+        "live_at_end": upstreams.live_count,
+        "stages": stages,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+def _print_row(row: dict[str, Any]) -> None:
+    print(
+        f"{row['size']:>7}  {row['cold_seconds']:>8.3f}  {row['warm_p50_seconds']:>8.3f}  "
+        f"{row['warm_p95_seconds']:>8.3f}  {row['alloc_peak_kib']:>10.1f}  "
+        f"{row['http_calls_per_cycle']:>9.1f}  {row['quota_units']:>6}  {row['role_writes']:>6}"
+    )
+
+
+def compare_reports(current: dict[str, Any], baseline: dict[str, Any]) -> int:
+    """Print per-size deltas against a baseline run; returns regressions found."""
+    base_env, env = baseline.get("environment", {}), current["environment"]
+    print(f"\nComparing {env['commit']} against baseline {base_env.get('commit', '?')}")
+    if baseline.get("params") != current["params"]:
+        print("⚠️ Run parameters differ from the baseline — deltas may not be meaningful")
+
+    base_rows = {row["size"]: row for row in baseline.get("results", [])}
+    regressions = 0
+    for row in current["results"]:
+        base = base_rows.get(row["size"])
+        if base is None:
+            continue
+        print(f"\n  roster {row['size']}")
+        for key, label in COMPARED:
+            old, new = base.get(key), row.get(key)
+            if old is None or new is None:
+                continue
+            delta = (new - old) / old if old else 0.0
+            flag = ""
+            if delta > REGRESSION_THRESHOLD:
+                flag = "  ← regression"
+                regressions += 1
+            print(f"    {label:<18} {old:>12} → {new:<12} {delta:+7.1%}{flag}")
+    return regressions
+
+
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark Puck's poll cycle against fake upstreams")
+    parser.add_argument("--sizes", default="10,100,1000,10000",
+                        help="Comma-separated roster sizes (default: 10,100,1000,10000)")
+    parser.add_argument("--cycles", type=int, default=6,
+                        help="Timed cycles per size; the first is reported as cold (default: 6)")
+    parser.add_argument("--alloc-cycles", type=int, default=3,
+                        help="Extra cycles measured under tracemalloc (default: 3)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Upstream HTTP latency")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="± latency jitter")
+    parser.add_argument("--gateway-latency-ms", type=float, default=30.0,
+                        help="Fluxer gateway latency per member/role call")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Share of upstream calls answered with an injected failure")
+    parser.add_argument("--live-fraction", type=float, default=0.05,
+                        help="Share of channels live before the first cycle")
+    parser.add_argument("--churn", type=float, default=0.02,
+                        help="Share of channels flipping live/offline between cycles")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--log-level", default="CRITICAL")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = _parse_args(argv)
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    params = {k: v for k, v in vars(args).items() if k not in ("output", "compare", "log_level")}
+    report: dict[str, Any] = {"environment": run_environment(), "params": params, "results": []}
+
+    print(f"Puck poll benchmark @ {report['environment']['commit']}")
+    print(f"{'roster':>7}  {'cold s':>8}  {'p50 s':>8}  {'p95 s':>8}  "
+          f"{'peak KiB':>10}  {'HTTP/cyc':>9}  {'quota':>6}  {'roles':>6}")
+    for size in sizes:
+        row = asyncio.run(bench_size(size, args))
+        report["results"].append(row)
+        _print_row(row)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if compare_reports(report, baseline):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
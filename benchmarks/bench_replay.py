@@ -0,0 +1,184 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Fixture replay benchmark. Replays a captured HTTP archive (PUCK_HTTP_CAPTURE
+or soak --capture) through the full pipeline under a virtual clock pinned
+to the recorded cycle times. There is no network latency, so cycle and stage
+times are the CPU cost of request handling, parsing and state diffing on
+real payloads. Results use the bench_poll format and compare the same way:
+
+    python -m benchmarks.bench_replay http_capture.jsonl.gz --output new.json
+    python -m benchmarks.bench_replay http_capture.jsonl.gz --compare old.json
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Optional
+
+from benchmarks.bench_poll import compare_reports, run_environment
+from benchmarks.clock import VirtualClock
+from benchmarks.fakes import FakeBot
+from benchmarks.pipeline import build_pipeline
+from benchmarks.replay import FixtureReplay
+from src.utils.stats import percentile
+
+
+def _digest(path: str) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()[:16]
+
+
+async def bench_replay(args: argparse.Namespace) -> dict[str, Any]:
+    """Replay the archive's cycles, timed, then a few more under tracemalloc."""
+    clock = VirtualClock(0.0)
+    replay = FixtureReplay.from_archive(args.fixtures, clock=clock)
+    clock.now = replay.started_at
+    cycles = args.cycles or replay.cycles
+    channels = replay.roster()
+    bot = FakeBot(seed=0)
+
+    timings: list[float] = []
+    stage_times: dict[str, list[float]] = {}
+    peaks: list[int] = []
+    with tempfile.TemporaryDirectory(prefix="puck-replay-") as tmp, clock.install():
+        pipe = build_pipeline(Path(tmp), channels, replay.transport(), bot, log_level=args.log_level)
+
+        async def one_cycle(index: int) -> float:
+            if index:
+                replay.advance()
+                clock.now = max(clock.now, replay.started_at)
+            started = time.perf_counter()
+            await pipe.monitor.poll_once()
+            return time.perf_counter() - started
+
+        try:
+            for index in range(cycles):
+                timings.append(await one_cycle(index))
+                for span in pipe.tracer.recent(1)[0].spans[1:]:
+                    if not span.name.startswith(("http:", "role_", "embed_")):
+                        stage_times.setdefault(span.name, []).append(span.duration)
+
+            tracemalloc.start()
+            try:
+                for index in range(cycles, cycles + args.alloc_cycles):
+                    before, _ = tracemalloc.get_traced_memory()
+                    tracemalloc.reset_peak()
+                    await one_cycle(index)
+                    peaks.append(tracemalloc.get_traced_memory()[1] - before)
+            finally:
+                tracemalloc.stop()
+            quota = pipe.youtube_quota.used_today
+        finally:
+            await pipe.close()
+
+    warm = sorted(timings[1:]) or sorted(timings)
+    served = dict(replay.served)
+    stages = {}
+    for name, values in sorted(stage_times.items(), key=lambda kv: -sum(kv[1])):
+        values.sort()
+        stages[name] = {
+            "p50": round(percentile(values, 50), 6),
+            "p95": round(percentile(values, 95), 6),
+            "total": round(sum(values), 6),
+        }
+    return {
+        "size": len(channels),
+        "twitch_streams": sum(1 for c in channels if c.twitch_login),
+        "youtube_channels": sum(1 for c in channels if c.youtube_channel_id),
+        "recorded_cycles": replay.cycles,
+        "recorded_responses": replay.records,
+        "cycles": cycles + args.alloc_cycles,
+        "cold_seconds": round(timings[0], 6),
+        "warm_p50_seconds": round(percentile(warm, 50), 6),
+        "warm_p95_seconds": round(percentile(warm, 95), 6),
+        "warm_max_seconds": round(warm[-1], 6),
+        "warm_mean_seconds": round(statistics.fmean(warm), 6),
+        "alloc_peak_kib": round(max(peaks, default=0) / 1024, 1),
+        "http_calls_per_cycle": round(sum(served.values()) / (cycles + args.alloc_cycles), 1),
+        "served": served,
+        "misses": served.get("miss", 0),
+        "quota_units": quota,
+        "role_writes": bot.calls["add_role"] + bot.calls["remove_role"],
+        "stages": stages,
+    }
+
+
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay a captured HTTP archive through Puck's poll cycle")
+    parser.add_argument("fixtures", help="Fixture archive (.jsonl.gz) written by the capture manager")
+    parser.add_argument("--cycles", type=int, default=0,
+                        help="Timed cycles (default: one per recorded cycle; more loop the archive)")
+    parser.add_argument("--alloc-cycles", type=int, default=3,
+                        help="Extra cycles measured under tracemalloc (default: 3)")
+    parser.add_argument("--log-level", default="CRITICAL")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = _parse_args(argv)
+    params = {
+        "fixtures_sha256": _digest(args.fixtures),
+        "cycles": args.cycles,
+        "alloc_cycles": args.alloc_cycles,
+    }
+    report: dict[str, Any] = {"environment": run_environment(), "params": params, "results": []}
+    print(f"Puck fixture replay @ {report['environment']['commit']} ({args.fixtures})")
+
+    row = asyncio.run(bench_replay(args))
+    report["results"].append(row)
+    print(
+        f"{row['size']} streams · {row['recorded_responses']} responses in "
+        f"{row['recorded_cycles']} recorded cycle(s) · served {row['served']}"
+    )
+    print(
+        f"cold {row['cold_seconds']:.3f}s · p50 {row['warm_p50_seconds']:.3f}s · "
+        f"p95 {row['warm_p95_seconds']:.3f}s · peak {row['alloc_peak_kib']:.1f} KiB"
+    )
+    for name, stage in list(row["stages"].items())[:8]:
+        print(f"  {name:<22} p50 {stage['p50'] * 1000:8.2f} ms  p95 {stage['p95'] * 1000:8.2f} ms")
+    if row["misses"]:
+        print(f"⚠️ {row['misses']} request(s) had no recorded answer — the roster or code has drifted")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if compare_reports(report, baseline):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Virtual clock for soak runs. While installed, every loaded src.* module
+sees simulated time through its own `time`, `datetime` and `asyncio`
+globals: time.time/time_ns/time.monotonic and datetime.now read the clock,
+and asyncio.sleep advances it instead of blocking. The event loop itself,
+and time.perf_counter, stay on real time so durations remain real.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+import datetime as _datetime
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+PATCHED_PREFIX = "src."
+
+
+class VirtualClock:
+    """Simulated wall clock, in Unix epoch seconds."""
+
+    def __init__(self, start: float) -> None:
+        self.now = float(start)
+        self.slept = 0.0  # Simulated seconds spent in asyncio.sleep
+
+    def advance(self, seconds: float) -> None:
+        if seconds > 0:
+            self.now += seconds
+
+    def __call__(self) -> float:
+        return self.now
+
+    @contextmanager
+    def install(self) -> Iterator["VirtualClock"]:
+        """Point every loaded src.* module at this clock for the duration."""
+        replacements = {
+            "time": (time, _VirtualTime(self)),
+            "datetime": (_datetime.datetime, _virtual_datetime(self)),
+            "asyncio": (asyncio, _VirtualAsyncio(self)),
+        }
+        patched: list[tuple[Any, str, Any]] = []
+        for name, module in list(sys.modules.items()):
+            if not name.startswith(PATCHED_PREFIX) or module is None:
+                continue
+            for attr, (original, virtual) in replacements.items():
+                if module.__dict__.get(attr) is original:
+                    patched.append((module, attr, original))
+                    setattr(module, attr, virtual)
+        try:
+            yield self
+        finally:
+            for module, attr, original in patched:
+                setattr(module, attr, original)
+
+
+class _VirtualTime:
+    """Stand-in for the time module."""
+
+    def __init__(self, clock: VirtualClock) -> None:
+        self._clock = clock
+
+    def time(self) -> float:
+        return self._clock.now
+
+    def time_ns(self) -> int:
+        return int(self._clock.now * 1e9)
+
+    def monotonic(self) -> float:
+        return self._clock.now
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(time, name)
+
+
+class _VirtualAsyncio:
+    """Stand-in for the asyncio module: sleeping advances simulated time.
+
+    Concurrent sleepers each advance the clock, so simulated time runs a
+    little fast under heavy retrying — close enough for soak accounting.
+    """
+
+    def __init__(self, clock: VirtualClock) -> None:
+        self._clock = clock
+
+    async def sleep(self, delay: float, result: Optional[Any] = None) -> Any:
+        if delay > 0:
+            self._clock.advance(delay)
+            self._clock.slept += delay
+        return await asyncio.sleep(0, result)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(asyncio, name)
+
+
+def _virtual_datetime(clock: VirtualClock) -> type:
+    class VirtualDatetime(_datetime.datetime):
+        @classmethod
+        def now(cls, tz: Optional[_datetime.tzinfo] = None) -> _datetime.datetime:
+            return _datetime.datetime.fromtimestamp(clock.now, tz)
+
+        @classmethod
+        def utcnow(cls) -> _datetime.datetime:
+            return _datetime.datetime.fromtimestamp(clock.now, _datetime.timezone.utc).replace(tzinfo=None)
+
+    return VirtualDatetime
+
+
+__all__ = ["VirtualClock"]
@@ -0,0 +1,456 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+In-process stand-ins for every upstream Puck talks to. FakeUpstreams is an
+httpx transport handler answering Twitch OAuth + Helix, YouTube RSS + the
+Data API and Fluxer REST; FakeBot stands in for the Fluxer gateway (guild
+and member role writes). Both take a per-call latency and an error rate
+drawn from a seeded RNG, so runs are repeatable. Upstream rules that only
+bite over time are modelled too: app tokens expire, YouTube quota resets at
+midnight Pacific, and channel renames are limited to 2 per 10 minutes.
+----------------------------------------------------------------------------
+FILE VERSION: v1.1.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+from xml.sax.saxutils import escape
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import httpx
+
+# Host → upstream name (matches http_transport_manager's pools)
+HOSTS = {
+    "id.twitch.tv": "twitch_auth",
+    "api.twitch.tv": "twitch",
+    "www.youtube.com": "youtube_rss",
+    "www.googleapis.com": "youtube_api",
+    "api.fluxer.app": "fluxer",
+}
+
+HELIX_BUCKET_SIZE = 800   # Points per window, as Twitch grants app tokens
+HELIX_BUCKET_WINDOW = 60
+RSS_BACKLOG_ENTRIES = 15  # Real feeds carry the 15 most recent uploads
+RSS_BACKLOG_AGE_SECONDS = 7 * 86400
+TOKEN_TTL_SECONDS = 5_000_000  # Twitch app tokens last ~60 days
+RENAME_LIMIT = 2               # Fluxer channel renames per window
+RENAME_WINDOW_SECONDS = 600
+YOUTUBE_COSTS = {"/youtube/v3/videos": 1, "/youtube/v3/search": 100}
+
+try:
+    QUOTA_TZ = ZoneInfo("America/Los_Angeles")  # Google resets quota at midnight PT
+except ZoneInfoNotFoundError:
+    QUOTA_TZ = timezone.utc
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass
+class FakeChannel:
+    """One simulated streamer, present on Twitch and/or YouTube."""
+
+    index: int
+    twitch_login: Optional[str]
+    youtube_channel_id: Optional[str]
+    live_since: Optional[float] = None           # Epoch seconds; None = offline
+    live_video_id: Optional[str] = None
+    uploads: list[tuple[str, float]] = field(default_factory=list)  # Newest first
+
+    @property
+    def twitch_user_id(self) -> str:
+        return str(10_000_000 + self.index)
+
+
+@dataclass
+class FaultProfile:
+    """Latency and failure injection for one upstream."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+
+class FakeUpstreams:
+    """Serves every Puck upstream from one in-memory world."""
+
+    def __init__(
+        self,
+        channels: list[FakeChannel],
+        default_fault: Optional[FaultProfile] = None,
+        faults: Optional[dict[str, FaultProfile]] = None,
+        seed: int = 0,
+        clock: Callable[[], float] = time.time,
+        helix_bucket: int = HELIX_BUCKET_SIZE,
+        token_ttl_seconds: int = TOKEN_TTL_SECONDS,
+        youtube_daily_quota: Optional[int] = None,
+    ) -> None:
+        self.channels = channels
+        self._by_login = {c.twitch_login: c for c in channels if c.twitch_login}
+        self._by_user_id = {c.twitch_user_id: c for c in channels if c.twitch_login}
+        self._by_youtube = {c.youtube_channel_id: c for c in channels if c.youtube_channel_id}
+        self._by_video: dict[str, FakeChannel] = {}
+        self._default_fault = default_fault or FaultProfile()
+        self._faults = faults or {}
+        self._rng = random.Random(seed)
+        self._clock = clock
+        self._video_seq = 0
+        self._message_seq = 0
+        self._helix_bucket = helix_bucket
+        self._helix_remaining = helix_bucket
+        self._helix_reset = 0.0
+        self._token_ttl = token_ttl_seconds
+        self._tokens: dict[str, float] = {}     # Issued token → expires at
+        self._youtube_quota = youtube_daily_quota
+        self._youtube_used: dict[tuple[str, str], int] = {}  # (key, PT date) → units
+        self._renames: dict[str, list[float]] = {}
+        self.calls: Counter[str] = Counter()    # "upstream METHOD /path" → count
+        self.errors: Counter[str] = Counter()   # upstream → injected failures
+        self.statuses: Counter[str] = Counter() # "upstream status" → responses
+        now = clock()
+        for channel in channels:
+            if channel.youtube_channel_id:
+                for n in range(RSS_BACKLOG_ENTRIES):
+                    age = RSS_BACKLOG_AGE_SECONDS * (n + 1) / RSS_BACKLOG_ENTRIES
+                    channel.uploads.append((self._new_video(channel), now - age))
+
+    # -------------------------------------------------------------------------
+    # World Simulation
+    # -------------------------------------------------------------------------
+    def _new_video(self, channel: FakeChannel) -> str:
+        self._video_seq += 1
+        video_id = f"v{self._video_seq:010d}"
+        self._by_video[video_id] = channel
+        return video_id
+
+    def set_live(
+        self, channel: FakeChannel, live: bool, started_at: Optional[float] = None
+    ) -> None:
+        """Start or end a broadcast; YouTube starts publish a new feed entry."""
+        if live == (channel.live_since is not None):
+            return
+        now = self._clock()
+        if live:
+            channel.live_since = started_at if started_at is not None else now - self._rng.uniform(5, 60)
+            if channel.youtube_channel_id:
+                channel.live_video_id = self._new_video(channel)
+                channel.uploads.insert(0, (channel.live_video_id, now))
+                del channel.uploads[RSS_BACKLOG_ENTRIES:]
+        else:
+            channel.live_since = None
+            channel.live_video_id = None
+
+    def churn(self, fraction: float) -> int:
+        """Flip the live state of a random `fraction` of channels."""
+        count = int(round(len(self.channels) * fraction))
+        for channel in self._rng.sample(self.channels, count):
+            self.set_live(channel, channel.live_since is None)
+        return count
+
+    @property
+    def live_count(self) -> int:
+        return sum(1 for c in self.channels if c.live_since is not None)
+
+    def calls_by_upstream(self) -> dict[str, int]:
+        totals: Counter[str] = Counter()
+        for key, count in self.calls.items():
+            totals[key.split(" ", 1)[0]] += count
+        return dict(sorted(totals.items()))
+
+    # -------------------------------------------------------------------------
+    # Transport
+    # -------------------------------------------------------------------------
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        upstream = HOSTS.get(request.url.host)
+        if upstream is None:
+            return httpx.Response(404, json={"error": f"unknown host {request.url.host}"})
+        fault = self._faults.get(upstream, self._default_fault)
+        self.calls[f"{upstream} {request.method} {request.url.path}"] += 1
+        if fault.latency_ms or fault.jitter_ms:
+            jitter = self._rng.uniform(-fault.jitter_ms, fault.jitter_ms)
+            await asyncio.sleep(max(0.0, fault.latency_ms + jitter) / 1000)
+        if fault.error_rate and self._rng.random() < fault.error_rate:
+            self.errors[upstream] += 1
+            self.statuses[f"{upstream} 503"] += 1
+            return httpx.Response(503, text="injected failure")
+        response = getattr(self, f"_route_{upstream}")(request)
+        self.statuses[f"{upstream} {response.status_code}"] += 1
+        return response
+
+    # -------------------------------------------------------------------------
+    # Twitch
+    # -------------------------------------------------------------------------
+    def _token_remaining(self, request: httpx.Request) -> Optional[int]:
+        """Seconds left on the request's token, or None if unknown/expired."""
+        token = request.headers.get("Authorization", "").split(" ", 1)[-1]
+        remaining = self._tokens.get(token, 0.0) - self._clock()
+        return int(remaining) if remaining > 0 else None
+
+    def _route_twitch_auth(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/oauth2/token":
+            token = f"bench-token-{len(self._tokens) + 1}"
+            self._tokens[token] = self._clock() + self._token_ttl
+            return httpx.Response(
+                200, json={"access_token": token, "expires_in": self._token_ttl, "token_type": "bearer"}
+            )
+        if request.url.path == "/oauth2/validate":
+            remaining = self._token_remaining(request)
+            if remaining is None:
+                return httpx.Response(401, json={"status": 401, "message": "invalid access token"})
+            return httpx.Response(200, json={"client_id": "bench", "expires_in": remaining})
+        return httpx.Response(404)
+
+    def _helix_headers(self) -> dict[str, str]:
+        now = self._clock()
+        if not self._helix_reset or now >= self._helix_reset:
+            self._helix_remaining = self._helix_bucket
+            self._helix_reset = now + HELIX_BUCKET_WINDOW
+        self._helix_remaining = max(0, self._helix_remaining - 1)
+        return {
+            "Ratelimit-Limit": str(self._helix_bucket),
+            "Ratelimit-Remaining": str(self._helix_remaining),
+            "Ratelimit-Reset": str(int(self._helix_reset)),
+        }
+
+    def _route_twitch(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        headers = self._helix_headers()
+        if self._token_remaining(request) is None:
+            return httpx.Response(401, json={"error": "Unauthorized"}, headers=headers)
+        if request.url.path == "/helix/users":
+            found = [self._by_login.get(v.lower()) for v in params.get_list("login")]
+            found += [self._by_user_id.get(v) for v in params.get_list("id")]
+            data = [
+                {
+                    "id": c.twitch_user_id,
+                    "login": c.twitch_login,
+                    "display_name": c.twitch_login,
+                    "profile_image_url": f"https://static-cdn.example/{c.twitch_login}.png",
+                }
+                for c in found if c
+            ]
+            return httpx.Response(200, json={"data": data}, headers=headers)
+        if request.url.path == "/helix/streams":
+            wanted = [self._by_user_id.get(v) for v in params.get_list("user_id")]
+            wanted += [self._by_login.get(v.lower()) for v in params.get_list("user_login")]
+            data = [
+                {
+                    "id": f"s{c.index}",
+                    "user_id": c.twitch_user_id,
+                    "user_login": c.twitch_login,
+                    "user_name": c.twitch_login,
+                    "type": "live",
+                    "title": f"Bench stream {c.index}",
+                    "game_name": "Just Chatting",
+                    "viewer_count": 10 + c.index % 500,
+                    "started_at": _iso(c.live_since),
+                    "thumbnail_url": f"https://static-cdn.example/{c.twitch_login}-{{width}}x{{height}}.jpg",
+                }
+                for c in wanted if c and c.live_since is not None
+            ]
+            return httpx.Response(200, json={"data": data}, headers=headers)
+        return httpx.Response(404, headers=headers)
+
+    # -------------------------------------------------------------------------
+    # YouTube
+    # -------------------------------------------------------------------------
+    def _route_youtube_rss(self, request: httpx.Request) -> httpx.Response:
+        channel = self._by_youtube.get(request.url.params.get("channel_id", ""))
+        if request.url.path != "/feeds/videos.xml" or channel is None:
+            return httpx.Response(404)
+        entries = "".join(
+            f"<entry><id>yt:video:{video_id}</id><yt:videoId>{video_id}</yt:videoId>"
+            f"<yt:channelId>{channel.youtube_channel_id}</yt:channelId>"
+            f"<title>{escape(f'Upload {video_id}')}</title>"
+            f"<published>{_iso(published)}</published></entry>"
+            for video_id, published in channel.uploads
+        )
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+            'xmlns="http://www.w3.org/2005/Atom">'
+            f"<title>Channel {channel.index}</title>{entries}</feed>"
+        )
+        return httpx.Response(200, text=body, headers={"Content-Type": "application/atom+xml"})
+
+    def _video_item(self, video_id: str, channel: FakeChannel) -> dict[str, Any]:
+        live = video_id == channel.live_video_id
+        item: dict[str, Any] = {
+            "id": video_id,
+            "snippet": {
+                "channelTitle": f"Channel {channel.index}",
+                "title": f"Bench video {video_id}",
+                "liveBroadcastContent": "live" if live else "none",
+                "thumbnails": {"high": {"url": f"https://i.ytimg.example/{video_id}.jpg"}},
+            },
+        }
+        if live:
+            item["liveStreamingDetails"] = {
+                "actualStartTime": _iso(channel.live_since),
+                "concurrentViewers": str(5 + channel.index % 300),
+            }
+        return item
+
+    def _spend_quota(self, request: httpx.Request) -> bool:
+        """Charge the key for this call; False once today's quota is gone."""
+        if self._youtube_quota is None:
+            return True
+        today = datetime.fromtimestamp(self._clock(), QUOTA_TZ).strftime("%Y-%m-%d")
+        ledger = (request.url.params.get("key", ""), today)
+        cost = YOUTUBE_COSTS.get(request.url.path, 1)
+        if self._youtube_used.get(ledger, 0) + cost > self._youtube_quota:
+            return False
+        self._youtube_used[ledger] = self._youtube_used.get(ledger, 0) + cost
+        return True
+
+    def _route_youtube_api(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        if not self._spend_quota(request):
+            return httpx.Response(403, json={"error": {"code": 403, "errors": [
+                {"reason": "quotaExceeded", "domain": "youtube.quota"}
+            ]}})
+        if request.url.path == "/youtube/v3/videos":
+            items = []
+            for video_id in params.get("id", "").split(","):
+                channel = self._by_video.get(video_id)
+                if channel:
+                    items.append(self._video_item(video_id, channel))
+            return httpx.Response(200, json={"items": items})
+        if request.url.path == "/youtube/v3/search":
+            channel = self._by_youtube.get(params.get("channelId", ""))
+            items = []
+            if channel and channel.live_video_id:
+                video = self._video_item(channel.live_video_id, channel)
+                items.append({"id": {"videoId": channel.live_video_id}, "snippet": video["snippet"]})
+            return httpx.Response(200, json={"items": items})
+        return httpx.Response(404)
+
+    # -------------------------------------------------------------------------
+    # Fluxer REST
+    # -------------------------------------------------------------------------
+    def _route_fluxer(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "PATCH" and "/messages" not in request.url.path:
+            now = self._clock()
+            recent = [
+                t for t in self._renames.get(request.url.path, [])
+                if now - t < RENAME_WINDOW_SECONDS
+            ]
+            if len(recent) >= RENAME_LIMIT:
+                self._renames[request.url.path] = recent
+                retry = RENAME_WINDOW_SECONDS - (now - recent[0])
+                return httpx.Response(
+                    429, json={"retry_after": retry}, headers={"Retry-After": str(int(retry) + 1)}
+                )
+            self._renames[request.url.path] = recent + [now]
+        if request.method == "POST" and request.url.path.endswith("/messages"):
+            self._message_seq += 1
+            return httpx.Response(200, json={"id": str(900_000_000 + self._message_seq)})
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(200, json={})
+
+
+# ---------------------------------------------------------------------------
+# Fluxer Gateway
+# ---------------------------------------------------------------------------
+class FakeMember:
+    def __init__(self, gateway: "FakeBot", member_id: int) -> None:
+        self._gateway = gateway
+        self.id = member_id
+        self.roles: list[int] = list(gateway.role_store.setdefault(member_id, []))
+
+    async def add_role(self, role_id: int, guild_id: int = 0, reason: str = "") -> None:
+        await self._gateway.call("add_role")
+        self._gateway.role_store.setdefault(self.id, []).append(role_id)
+
+    async def remove_role(self, role_id: int, guild_id: int = 0, reason: str = "") -> None:
+        await self._gateway.call("remove_role")
+        held = self._gateway.role_store.setdefault(self.id, [])
+        if role_id in held:
+            held.remove(role_id)
+
+
+class FakeGuild:
+    def __init__(self, gateway: "FakeBot", guild_id: int) -> None:
+        self._gateway = gateway
+        self.id = guild_id
+
+    async def fetch_member(self, member_id: int) -> FakeMember:
+        await self._gateway.call("fetch_member")
+        return FakeMember(self._gateway, member_id)
+
+
+class FakeBot:
+    """Just enough of fluxer.Bot for StreamMonitor's role writes."""
+
+    def __init__(self, fault: Optional[FaultProfile] = None, seed: int = 0) -> None:
+        self._fault = fault or FaultProfile()
+        self._rng = random.Random(seed)
+        self.role_store: dict[int, list[int]] = {}
+        self.calls: Counter[str] = Counter()
+        self.errors = 0
+
+    async def call(self, name: str) -> None:
+        """Account for one gateway/REST round trip, with injected faults."""
+        self.calls[name] += 1
+        if self._fault.latency_ms or self._fault.jitter_ms:
+            jitter = self._rng.uniform(-self._fault.jitter_ms, self._fault.jitter_ms)
+            await asyncio.sleep(max(0.0, self._fault.latency_ms + jitter) / 1000)
+        if self._fault.error_rate and self._rng.random() < self._fault.error_rate:
+            self.errors += 1
+            raise RuntimeError(f"injected gateway failure ({name})")
+
+    async def fetch_guild(self, guild_id: int) -> FakeGuild:
+        await self.call("fetch_guild")
+        return FakeGuild(self, guild_id)
+
+
+def make_roster(
+    size: int, youtube_share: float = 0.33, both_share: float = 0.1, seed: int = 0
+) -> list[FakeChannel]:
+    """Build `size` channels: Twitch-only, YouTube-only and dual-platform."""
+    rng = random.Random(seed)
+    channels = []
+    for index in range(size):
+        roll = rng.random()
+        on_youtube = roll < youtube_share
+        on_twitch = not on_youtube or roll < both_share
+        channels.append(FakeChannel(
+            index=index,
+            twitch_login=f"bench_streamer_{index}" if on_twitch else None,
+            youtube_channel_id=f"UCbench{index:017d}" if on_youtube else None,
+        ))
+    return channels
+
+
+__all__ = [
+    "FakeChannel",
+    "FaultProfile",
+    "FakeUpstreams",
+    "FakeBot",
+    "make_roster",
+]
@@ -0,0 +1,228 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Builds the real Puck manager graph (same factories, same order as main.py)
+against the fake upstreams (or a fixture replay). Config comes from the shipped puck_config.json;
+the roster, secrets and every /app/data file live in a scratch directory.
+----------------------------------------------------------------------------
+FILE VERSION: v1.4.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from benchmarks.fakes import FakeBot, FakeChannel
+from src.handlers.admin_commands import AdminCommandsHandler, create_admin_commands_handler
+from src.handlers.embed_announcer import EmbedAnnouncer, create_embed_announcer
+from src.handlers.stream_monitor import StreamMonitor, create_stream_monitor
+from src.managers.capture_manager import create_capture_manager
+from src.managers.config_manager import ConfigManager, create_config_manager
+from src.managers.http_transport_manager import (
+    HttpTransportManager,
+    create_http_transport_manager,
+)
+from src.managers.latency_manager import LatencyManager, create_latency_manager
+from src.managers.logging_config_manager import create_logging_config_manager
+from src.managers.loop_monitor_manager import create_loop_monitor_manager
+from src.managers.metrics_manager import MetricsManager, create_metrics_manager
+from src.managers.profile_manager import ProfileManager, create_profile_manager
+from src.managers.resilience_manager import create_resilience_manager
+from src.managers.schedule_manager import create_schedule_manager
+from src.managers.stream_state_manager import StreamStateManager, create_stream_state_manager
+from src.managers.trace_manager import TraceManager, create_trace_manager
+from src.managers.twitch_identity_manager import create_twitch_identity_manager
+from src.managers.twitch_manager import TwitchManager, create_twitch_manager
+from src.managers.warm_start_manager import WarmStartManager, create_warm_start_manager
+from src.managers.youtube_manager import YouTubeManager, create_youtube_manager
+from src.managers.youtube_quota_manager import (
+    YouTubeQuotaManager,
+    create_youtube_quota_manager,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_PATH = REPO_ROOT / "src" / "config" / "puck_config.json"
+
+BENCH_GUILD_ID = "100000000000000001"
+BENCH_LIVE_ROLE_ID = "100000000000000002"
+BENCH_CHANNEL_ID = "100000000000000003"
+
+
+@dataclass
+class Pipeline:
+    """Every manager a poll cycle touches, wired to the fakes."""
+
+    config: ConfigManager
+    metrics: MetricsManager
+    tracer: TraceManager
+    http_transport: HttpTransportManager
+    twitch: TwitchManager
+    youtube: YouTubeManager
+    youtube_quota: YouTubeQuotaManager
+    state: StreamStateManager
+    latency: LatencyManager
+    profiler: ProfileManager
+    embed: EmbedAnnouncer
+    monitor: StreamMonitor
+    warm_start: WarmStartManager
+    admin: AdminCommandsHandler
+
+    async def close(self) -> None:
+        await self.http_transport.aclose()
+
+
+def _write_scratch(workdir: Path, channels: list[FakeChannel], capture: bool) -> Path:
+    """Write the roster and secrets, and point the config env at them."""
+    workdir.mkdir(parents=True, exist_ok=True)
+    streams = [
+        {
+            "fluxer_user_id": str(200_000_000_000_000_000 + c.index),
+            "display_name": f"Streamer {c.index}",
+            **({"twitch_username": c.twitch_login} if c.twitch_login else {}),
+            **({"youtube_channel_id": c.youtube_channel_id} if c.youtube_channel_id else {}),
+        }
+        for c in channels
+    ]
+    streams_path = workdir / "tracked_streams.json"
+    streams_path.write_text(json.dumps({"streams": streams}), encoding="utf-8")
+
+    secrets = {
+        "TOKEN_FILE": "bench-bot-token",
+        "TWITCH_CLIENT_ID_FILE": "bench-client-id",
+        "TWITCH_CLIENT_SECRET_FILE": "bench-client-secret",
+        "YOUTUBE_API_KEY_FILE": "bench-youtube-key",
+    }
+    for env_key, value in secrets.items():
+        path = workdir / env_key.lower()
+        path.write_text(value, encoding="utf-8")
+        os.environ[env_key] = str(path)
+    os.environ["YOUTUBE_API_KEY_FILES"] = str(workdir / "no_extra_keys")
+    os.environ["PUCK_GUILD_ID"] = BENCH_GUILD_ID
+    os.environ["PUCK_LIVE_ROLE_ID"] = BENCH_LIVE_ROLE_ID
+    os.environ["PUCK_ANNOUNCE_CHANNEL_ID"] = BENCH_CHANNEL_ID
+    os.environ["PUCK_METRICS"] = "false"
+    os.environ["PUCK_TRACE_EXPORT"] = "false"
+    os.environ["PUCK_HTTP_CAPTURE"] = "true" if capture else "false"
+    return streams_path
+
+
+def build_pipeline(
+    workdir: Path,
+    channels: list[FakeChannel],
+    transport: httpx.AsyncBaseTransport,
+    bot: FakeBot,
+    log_level: str = "CRITICAL",
+    capture_file: Optional[str] = None,
+) -> Pipeline:
+    """Create the manager graph exactly as main.py does, minus the gateway.
+
+    With capture_file set, every upstream response is also recorded there
+    as a replay fixture archive.
+    """
+    streams_path = _write_scratch(workdir, channels, capture=capture_file is not None)
+    config = create_config_manager(config_path=str(CONFIG_PATH), streams_path=str(streams_path))
+    logging_mgr = create_logging_config_manager(log_level=log_level, app_name="puck-bench")
+
+    metrics = create_metrics_manager(config, logging_mgr)
+    tracer = create_trace_manager(
+        config, logging_mgr, metrics, export_file=str(workdir / "traces.otlp.jsonl")
+    )
+    capture = create_capture_manager(
+        config, logging_mgr, capture_file=capture_file or str(workdir / "http_capture.jsonl.gz")
+    )
+    http_transport = create_http_transport_manager(
+        config, logging_mgr, transport=transport, capture_manager=capture
+    )
+    resilience = create_resilience_manager(config, logging_mgr, http_transport, metrics, tracer)
+    identity_mgr = create_twitch_identity_manager(
+        config, logging_mgr, identity_file=str(workdir / "twitch_identities.json")
+    )
+    twitch_mgr = create_twitch_manager(config, logging_mgr, resilience, identity_mgr)
+    youtube_quota = create_youtube_quota_manager(config, logging_mgr)
+    youtube_mgr = create_youtube_manager(
+        config, logging_mgr, resilience, youtube_quota, metrics, tracer
+    )
+    state_mgr = create_stream_state_manager(
+        config, logging_mgr, metrics, tracer, state_file=str(workdir / "stream_state.json")
+    )
+    schedule_mgr = create_schedule_manager(
+        config, logging_mgr, schedule_file=str(workdir / "schedule.json")
+    )
+    latency_mgr = create_latency_manager(
+        config, logging_mgr, latency_file=str(workdir / "latency.json")
+    )
+    profiler = create_profile_manager(config, logging_mgr, profile_dir=str(workdir / "profiles"))
+    embed_announcer = create_embed_announcer(
+        config, logging_mgr, resilience, state_file=str(workdir / "announcements.json")
+    )
+
+    monitor = create_stream_monitor(
+        bot=bot,
+        config_manager=config,
+        logging_manager=logging_mgr,
+        twitch_manager=twitch_mgr,
+        youtube_manager=youtube_mgr,
+        state_manager=state_mgr,
+        embed_announcer=embed_announcer,
+        resilience_manager=resilience,
+        schedule_manager=schedule_mgr,
+        trace_manager=tracer,
+        latency_manager=latency_mgr,
+        profile_manager=profiler,
+    )
+
+    warm_start = create_warm_start_manager(
+        config, logging_mgr, snapshot_file=str(workdir / "warm_start.json")
+    )
+    warm_start.register("twitch", twitch_mgr.export_warm_state, twitch_mgr.restore_warm_state)
+    warm_start.register("youtube", youtube_mgr.export_warm_state, youtube_mgr.restore_warm_state)
+    warm_start.register("monitor", monitor.export_warm_state, monitor.restore_warm_state)
+    warm_start.restore()
+
+    admin = create_admin_commands_handler(
+        bot=bot,
+        config_manager=config,
+        logging_manager=logging_mgr,
+        latency_manager=latency_mgr,
+        trace_manager=tracer,
+        loop_monitor=create_loop_monitor_manager(config, logging_mgr, metrics),
+        profile_manager=profiler,
+    )
+    return Pipeline(
+        config=config,
+        metrics=metrics,
+        tracer=tracer,
+        http_transport=http_transport,
+        twitch=twitch_mgr,
+        youtube=youtube_mgr,
+        youtube_quota=youtube_quota,
+        state=state_mgr,
+        latency=latency_mgr,
+        profiler=profiler,
+        embed=embed_announcer,
+        monitor=monitor,
+        warm_start=warm_start,
+        admin=admin,
+    )
+
+
+__all__ = ["Pipeline", "build_pipeline", "CONFIG_PATH"]
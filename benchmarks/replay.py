@@ -0,0 +1,253 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Deterministic replay of a captured HTTP fixture archive. The archive is
+split into poll cycles by the gaps between recordings, and each replayed
+cycle is answered from the matching recorded cycle:
+
+    1. An identical request (method, URL, sorted query) in this cycle,
+       replayed in recorded order — retries see the same 5xx, then 200
+    2. Helix /users and /streams and YouTube videos.list, rebuilt item by
+       item from what the cycle returned, so a different batching of the
+       same roster still matches
+    3. An identical request from the nearest other cycle
+    4. Fluxer REST and the Twitch token endpoint are answered synthetically
+
+Anything else is a miss (404) and is counted.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import json
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable, Optional
+
+import httpx
+
+from benchmarks.fakes import HOSTS, FakeChannel
+from src.managers.capture_manager import read_fixtures, record_body, sanitize_url
+
+CYCLE_GAP_SECONDS = 20.0  # A quieter gap than this starts a new poll cycle
+ITEM_PATHS = ("/helix/users", "/helix/streams", "/youtube/v3/videos")
+
+RequestKey = tuple[str, str, str, tuple[tuple[str, str], ...]]
+
+
+def _key(method: str, url: httpx.URL) -> RequestKey:
+    return (method, url.host, url.path, tuple(sorted(url.params.multi_items())))
+
+
+def _json(record: dict[str, Any]) -> Any:
+    try:
+        return json.loads(record_body(record))
+    except ValueError:
+        return None
+
+
+class FixtureReplay:
+    """Serves a recorded archive back to the pipeline, one poll cycle at a time."""
+
+    def __init__(
+        self,
+        records: list[dict[str, Any]],
+        clock: Callable[[], float] = time.time,
+        cycle_gap: float = CYCLE_GAP_SECONDS,
+    ) -> None:
+        if not records:
+            raise ValueError("fixture archive holds no records")
+        self._clock = clock
+        self.records = len(records)
+        self.served: Counter = Counter()
+        self.cycle = 0
+        self.loops = 0
+        self._message_seq = 0
+
+        cycles: list[list[dict[str, Any]]] = [[]]
+        for previous, record in zip([None, *records], records):
+            if previous is not None and record["at"] - previous["at"] > cycle_gap:
+                cycles.append([])
+            cycles[-1].append(record)
+        self.cycle_starts = [c[0]["at"] for c in cycles]
+
+        self._exact: list[dict[RequestKey, list[dict[str, Any]]]] = []
+        self._streams: list[Optional[list[dict[str, Any]]]] = []
+        self._users: dict[str, dict[str, Any]] = {}
+        self._logins: dict[str, dict[str, Any]] = {}
+        self._videos: dict[str, list[tuple[int, dict[str, Any]]]] = defaultdict(list)
+        self._rss_channels: set[str] = set()
+        for index, cycle in enumerate(cycles):
+            exact: dict[RequestKey, list[dict[str, Any]]] = defaultdict(list)
+            streams: Optional[list[dict[str, Any]]] = None
+            for record in cycle:
+                url = httpx.URL(record["url"])
+                exact[_key(record["method"], url)].append(record)
+                if url.path == "/feeds/videos.xml" and url.params.get("channel_id"):
+                    self._rss_channels.add(url.params["channel_id"])
+                if record["status"] != 200 or url.path not in ITEM_PATHS:
+                    continue
+                items = (_json(record) or {}).get("data" if "helix" in url.path else "items", [])
+                if url.path == "/helix/users":
+                    for user in items:
+                        self._users[str(user.get("id", ""))] = user
+                        self._logins[str(user.get("login", "")).lower()] = user
+                elif url.path == "/helix/streams":
+                    streams = (streams or []) + items
+                else:
+                    for item in items:
+                        self._videos[item.get("id", "")].append((index, item))
+            self._exact.append(exact)
+            self._streams.append(streams)
+        self._cursors: Counter = Counter()
+
+    @classmethod
+    def from_archive(cls, path: str, clock: Callable[[], float] = time.time) -> "FixtureReplay":
+        return cls(list(read_fixtures(path)), clock=clock)
+
+    @property
+    def cycles(self) -> int:
+        return len(self.cycle_starts)
+
+    @property
+    def started_at(self) -> float:
+        """Recorded start of the current cycle, shifted forward on each loop."""
+        starts = self.cycle_starts
+        interval = (starts[-1] - starts[0]) / (len(starts) - 1) if len(starts) > 1 else 0.0
+        return starts[self.cycle] + self.loops * (starts[-1] - starts[0] + interval)
+
+    def advance(self) -> None:
+        """Move to the next recorded cycle, looping back after the last."""
+        self.cycle += 1
+        if self.cycle >= self.cycles:
+            self.cycle = 0
+            self.loops += 1
+        self._cursors.clear()
+
+    def roster(self) -> list[FakeChannel]:
+        """Every Twitch login and YouTube channel the archive polled."""
+        logins = sorted(
+            {u.get("login", "").lower() for u in self._users.values()}
+            | {s.get("user_login", "").lower() for c in self._streams for s in c or []}
+        )
+        logins = [login for login in logins if login]
+        youtube = sorted(self._rss_channels)
+        return [
+            FakeChannel(index, login, None) for index, login in enumerate(logins)
+        ] + [
+            FakeChannel(len(logins) + index, None, channel_id)
+            for index, channel_id in enumerate(youtube)
+        ]
+
+    # -------------------------------------------------------------------------
+    # Serving
+    # -------------------------------------------------------------------------
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        upstream = HOSTS.get(request.url.host, "unknown")
+        url = httpx.URL(sanitize_url(request.url))
+        key = _key(request.method, url)
+
+        if upstream == "fluxer":
+            return self._serve("synthesized", self._fluxer(request))
+
+        recorded = self._exact[self.cycle].get(key)
+        if recorded:
+            position = min(self._cursors[key], len(recorded) - 1)
+            self._cursors[key] += 1
+            return self._serve("exact", self._response(recorded[position]))
+
+        if url.path in ITEM_PATHS:
+            response = self._items(url)
+            if response is not None:
+                return self._serve("item", response)
+
+        nearest = self._nearest(key)
+        if nearest is not None:
+            return self._serve("nearest", self._response(nearest))
+
+        if url.path == "/oauth2/token":
+            return self._serve("synthesized", httpx.Response(
+                200, json={"access_token": "replay", "expires_in": 5_000_000, "token_type": "bearer"}
+            ))
+        return self._serve("miss", httpx.Response(404, json={"error": "not in fixture archive"}))
+
+    def _serve(self, kind: str, response: httpx.Response) -> httpx.Response:
+        self.served[kind] += 1
+        return response
+
+    def _response(self, record: dict[str, Any]) -> httpx.Response:
+        return httpx.Response(
+            record["status"], headers=record.get("headers", {}), content=record_body(record)
+        )
+
+    def _nearest(self, key: RequestKey) -> Optional[dict[str, Any]]:
+        for distance in range(1, self.cycles):
+            for index in (self.cycle - distance, self.cycle + distance):
+                if 0 <= index < self.cycles and key in self._exact[index]:
+                    return self._exact[index][key][-1]
+        return None
+
+    def _helix_headers(self) -> dict[str, str]:
+        return {
+            "Ratelimit-Limit": "800",
+            "Ratelimit-Remaining": "799",
+            "Ratelimit-Reset": str(int(self._clock()) + 60),
+        }
+
+    def _items(self, url: httpx.URL) -> Optional[httpx.Response]:
+        params = url.params
+        if url.path == "/helix/users":
+            found = [self._users.get(v) for v in params.get_list("id")]
+            found += [self._logins.get(v.lower()) for v in params.get_list("login")]
+            data = [user for user in found if user]
+            return httpx.Response(200, json={"data": data}, headers=self._helix_headers())
+        if url.path == "/helix/streams":
+            streams = self._streams[self.cycle]
+            if streams is None:
+                return None
+            ids = set(params.get_list("user_id"))
+            logins = {v.lower() for v in params.get_list("user_login")}
+            data = [
+                s for s in streams
+                if str(s.get("user_id", "")) in ids or s.get("user_login", "").lower() in logins
+            ]
+            return httpx.Response(200, json={"data": data}, headers=self._helix_headers())
+        wanted = [v for value in params.get_list("id") for v in value.split(",") if v]
+        items = [item for item in (self._video(v) for v in wanted) if item]
+        return httpx.Response(200, json={"kind": "youtube#videoListResponse", "items": items})
+
+    def _video(self, video_id: str) -> Optional[dict[str, Any]]:
+        """The video as of this cycle: latest recording at or before it, else the earliest."""
+        seen = self._videos.get(video_id)
+        if not seen:
+            return None
+        current = [item for index, item in seen if index <= self.cycle]
+        return current[-1] if current else seen[0][1]
+
+    def _fluxer(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST" and request.url.path.endswith("/messages"):
+            self._message_seq += 1
+            return httpx.Response(200, json={"id": str(900_000_000 + self._message_seq)})
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(200, json={})
+
+
+__all__ = ["FixtureReplay", "CYCLE_GAP_SECONDS"]
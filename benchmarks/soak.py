@@ -0,0 +1,440 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Soak run under a virtual clock. Runs the full pipeline against the fake
+upstreams for days of simulated polling (a week in minutes), with each
+streamer following a realistic weekly schedule. It samples RSS memory,
+open file descriptors, live Python objects, state-file sizes and API-call
+totals over simulated time, and reports what drifted:
+
+    python -m benchmarks.soak --days 7 --streams 200 --output soak.json
+----------------------------------------------------------------------------
+FILE VERSION: v1.1.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import argparse
+import asyncio
+import bisect
+import gc
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from benchmarks.bench_poll import run_environment
+from benchmarks.clock import VirtualClock
+from benchmarks.fakes import QUOTA_TZ, FakeBot, FakeChannel, FakeUpstreams, FaultProfile, make_roster
+from benchmarks.pipeline import build_pipeline
+
+DAY = 86400
+HOUR = 3600
+# Streams per week, weighted towards a few evenings a week
+STREAMS_PER_WEEK = (0, 1, 2, 3, 4, 5, 7)
+STREAMS_PER_WEEK_WEIGHTS = (10, 20, 25, 20, 12, 8, 5)
+HOME_UTC_OFFSETS = (-8, -7, -6, -5, -3, 0, 1, 2, 10)
+SKIP_CHANCE = 0.1         # A scheduled stream doesn't happen
+SPONTANEOUS_CHANCE = 0.03 # An unscheduled stream on any given day
+START_JITTER_SECONDS = 20 * 60
+REDELIVERY_WINDOW = 30    # Late duplicate events arrive within N messages
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _pacific_day(ts: float) -> str:
+    """The YouTube quota day (Pacific date) at a timestamp."""
+    return datetime.fromtimestamp(ts, QUOTA_TZ).strftime("%Y-%m-%d")
+
+
+# ---------------------------------------------------------------------------
+# Stream Schedules
+# ---------------------------------------------------------------------------
+def make_sessions(
+    channel: FakeChannel, start: float, days: int, rng: random.Random
+) -> list[tuple[float, float]]:
+    """(start, end) broadcasts for one channel: a weekly habit with jitter,
+    skipped days, the odd spontaneous stream, and overruns past midnight."""
+    per_week = rng.choices(STREAMS_PER_WEEK, STREAMS_PER_WEEK_WEIGHTS)[0]
+    weekdays = set(rng.sample(range(7), per_week))
+    offset = rng.choice(HOME_UTC_OFFSETS) * HOUR
+    local_start = rng.uniform(16, 22) * HOUR
+    mean_length = rng.uniform(1.5, 4.5) * HOUR
+
+    first_day = start - start % DAY
+    sessions: list[tuple[float, float]] = []
+    for day in range(-1, days + 1):
+        day_start = first_day + day * DAY
+        weekday = datetime.fromtimestamp(day_start, timezone.utc).weekday()
+        planned = weekday in weekdays and rng.random() > SKIP_CHANCE
+        if planned:
+            begin = day_start + local_start - offset + rng.gauss(0, START_JITTER_SECONDS)
+        elif rng.random() < SPONTANEOUS_CHANCE:
+            begin = day_start + rng.uniform(0, DAY)
+        else:
+            continue
+        length = max(0.5 * HOUR, rng.gauss(mean_length, 0.5 * HOUR))
+        sessions.append((begin, begin + length))
+
+    sessions.sort()
+    merged: list[tuple[float, float]] = []
+    for begin, end in sessions:
+        if merged and begin <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((begin, end))
+    return merged
+
+
+class World:
+    """Drives the fake upstreams' live state from the schedules."""
+
+    def __init__(
+        self, upstreams: FakeUpstreams, sessions: dict[int, list[tuple[float, float]]]
+    ) -> None:
+        self._upstreams = upstreams
+        self._sessions = sessions
+        self._starts = {index: [s for s, _ in spans] for index, spans in sessions.items()}
+        self.broadcasts = 0
+
+    def tick(self, now: float) -> None:
+        for channel in self._upstreams.channels:
+            spans = self._sessions[channel.index]
+            i = bisect.bisect_right(self._starts[channel.index], now) - 1
+            live = i >= 0 and now < spans[i][1]
+            if live and channel.live_since is None:
+                self.broadcasts += 1
+            self._upstreams.set_live(channel, live, started_at=spans[i][0] if live else None)
+
+
+class CommandTraffic:
+    """Admin commands delivered twice (as fluxer-py does), some duplicates late."""
+
+    def __init__(self, rng: random.Random, start: float) -> None:
+        self._rng = rng
+        self._next_id = int((start - 1_420_070_400) * 1000) << 22  # Snowflake-ish
+        self._late: deque[int] = deque()
+        self._handled: dict[int, int] = {}
+        self.delivered = 0
+
+    def deliver(self, admin: Any, count: int) -> None:
+        for _ in range(count):
+            self._next_id += self._rng.randint(1, 1 << 20)
+            events = [self._next_id]
+            if self._rng.random() < 0.8:
+                events.append(self._next_id)   # Immediate duplicate
+            else:
+                self._late.append(self._next_id)
+            if self._late and (
+                len(self._late) > REDELIVERY_WINDOW or self._rng.random() < 0.3
+            ):
+                events.append(self._late.popleft())
+            for message_id in events:
+                self.delivered += 1
+                if not admin.is_duplicate(message_id):
+                    self._handled[message_id] = self._handled.get(message_id, 0) + 1
+
+    @property
+    def double_handled(self) -> int:
+        return sum(1 for n in self._handled.values() if n > 1)
+
+
+# ---------------------------------------------------------------------------
+# Process Probes
+# ---------------------------------------------------------------------------
+def rss_kib() -> int:
+    """Current resident set size; peak RSS where /proc is unavailable."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def open_fds() -> Optional[int]:
+    for path in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(path))
+        except OSError:
+            continue
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Soak Run
+# ---------------------------------------------------------------------------
+async def soak(args: argparse.Namespace) -> dict[str, Any]:
+    start = datetime.fromisoformat(args.start.replace("Z", "+00:00")).timestamp()
+    end = start + args.days * DAY
+    clock = VirtualClock(start)
+    rng = random.Random(args.seed)
+
+    channels = make_roster(args.streams, seed=args.seed)
+    upstreams = FakeUpstreams(
+        channels,
+        default_fault=FaultProfile(0.0, 0.0, args.error_rate),
+        seed=args.seed,
+        clock=clock,
+        token_ttl_seconds=int(args.token_ttl_hours * HOUR),
+        youtube_daily_quota=args.youtube_quota,
+    )
+    bot = FakeBot(seed=args.seed)
+    world = World(upstreams, {c.index: make_sessions(c, start, args.days, rng) for c in channels})
+    commands = CommandTraffic(rng, start)
+
+    samples: list[dict[str, Any]] = []
+    ledger_resets: list[dict[str, Any]] = []
+    quota_day_mismatches: list[str] = []  # Ledger day != Pacific day after a cycle
+    poll_failures: list[str] = []
+    cycle_seconds: list[float] = []
+    started_real = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(prefix="puck-soak-") as tmp, clock.install():
+        workdir = Path(tmp)
+        pipe = build_pipeline(
+            workdir, channels, upstreams.transport(), bot, log_level=args.log_level,
+            capture_file=args.capture,
+        )
+        interval = pipe.config.snapshot.poll_interval
+        save_interval = pipe.config.snapshot.warm_start_save_interval_seconds
+        next_sample, next_save, next_command = start, start + save_interval, start + HOUR
+        last_used = 0
+        last_quota_day = _pacific_day(clock.now)
+
+        def sample() -> None:
+            files = {p.name: p.stat().st_size for p in sorted(workdir.iterdir()) if p.is_file()}
+            ordered = sorted(cycle_seconds) or [0.0]
+            samples.append({
+                "sim_time": _iso(clock.now),
+                "sim_hours": round((clock.now - start) / HOUR, 2),
+                "real_seconds": round(time.perf_counter() - started_real, 2),
+                "rss_kib": rss_kib(),
+                "open_fds": open_fds(),
+                "py_objects": len(gc.get_objects()),
+                "files": files,
+                "state_bytes": sum(files.values()),
+                "http_calls": upstreams.calls_by_upstream(),
+                "gateway_calls": dict(bot.calls),
+                "quota_used_today": pipe.youtube_quota.used_today,
+                "live_streams": upstreams.live_count,
+                "dedup_window": pipe.admin.seen_count,
+                "cycle_p95_seconds": round(ordered[int(0.95 * (len(ordered) - 1))], 4),
+            })
+            cycle_seconds.clear()
+
+        try:
+            while clock.now < end:
+                world.tick(clock.now)
+                cycle_started = time.perf_counter()
+                try:
+                    await pipe.monitor.poll_once()
+                except Exception as e:
+                    poll_failures.append(f"{_iso(clock.now)} {type(e).__name__}: {e}")
+                cycle_seconds.append(time.perf_counter() - cycle_started)
+
+                used = pipe.youtube_quota.used_today
+                quota_day = _pacific_day(clock.now)
+                if used < last_used:
+                    ledger_resets.append({
+                        "utc": _iso(clock.now),
+                        "pacific": datetime.fromtimestamp(clock.now, QUOTA_TZ).isoformat(timespec="minutes"),
+                        # First cycle of a new Pacific day, as Google resets
+                        "on_schedule": quota_day != last_quota_day,
+                    })
+                ledger_day = pipe.youtube_quota.export_warm_state()["reset_date"]
+                if ledger_day != quota_day:
+                    quota_day_mismatches.append(f"{_iso(clock.now)} ledger {ledger_day}, Pacific {quota_day}")
+                last_used, last_quota_day = used, quota_day
+
+                if clock.now >= next_save:
+                    pipe.warm_start.save()
+                    next_save += save_interval
+                if clock.now >= next_command:
+                    commands.deliver(pipe.admin, args.commands_per_hour)
+                    next_command += HOUR
+                if clock.now >= next_sample:
+                    sample()
+                    next_sample += args.sample_minutes * 60
+                    if len(samples) % max(1, DAY // (args.sample_minutes * 60)) == 1:
+                        _print_sample(samples[-1])
+
+                clock.advance(interval)
+            sample()
+            _print_sample(samples[-1])
+        finally:
+            await pipe.close()
+
+    statuses = dict(sorted(upstreams.statuses.items()))
+    summary = _summarise(samples, args)
+    summary.update({
+        "simulated_days": args.days,
+        "real_seconds": round(time.perf_counter() - started_real, 1),
+        "simulated_sleep_seconds": round(clock.slept, 1),
+        "broadcasts": world.broadcasts,
+        "role_adds": bot.calls["add_role"],
+        "role_removes": bot.calls["remove_role"],
+        "token_requests": upstreams.calls["twitch_auth POST /oauth2/token"],
+        "http_statuses": statuses,
+        "helix_401": statuses.get("twitch 401", 0),
+        "youtube_403": statuses.get("youtube_api 403", 0),
+        "rename_429": statuses.get("fluxer 429", 0),
+        "quota_ledger_resets": ledger_resets,
+        "quota_resets_off_schedule": sum(1 for r in ledger_resets if not r["on_schedule"]),
+        "quota_day_mismatches": quota_day_mismatches[:50],
+        "quota_day_mismatch_count": len(quota_day_mismatches),
+        "commands_delivered": commands.delivered,
+        "dedup_double_handled": commands.double_handled,
+        "poll_failures": poll_failures[:50],
+        "poll_failure_count": len(poll_failures),
+    })
+    return {"samples": samples, "summary": summary}
+
+
+def _summarise(samples: list[dict[str, Any]], args: argparse.Namespace) -> dict[str, Any]:
+    """Growth after the first simulated day, once caches and state have warmed."""
+    if not samples:
+        return {}
+    per_day = max(1, DAY // (args.sample_minutes * 60))
+    base = samples[min(per_day, len(samples) - 1)]
+    last = samples[-1]
+    days = max((last["sim_hours"] - base["sim_hours"]) / 24, 1e-9)
+    fds = (base["open_fds"], last["open_fds"])
+    return {
+        "rss_kib_start": samples[0]["rss_kib"],
+        "rss_kib_end": last["rss_kib"],
+        "rss_growth_kib_per_day": round((last["rss_kib"] - base["rss_kib"]) / days, 1),
+        "py_objects_growth_per_day": round((last["py_objects"] - base["py_objects"]) / days),
+        "open_fds_growth": None if None in fds else fds[1] - fds[0],
+        "state_growth_bytes": {
+            name: size - base["files"].get(name, 0) for name, size in last["files"].items()
+        },
+        "http_calls_total": last["http_calls"],
+    }
+
+
+def _problems(summary: dict[str, Any]) -> list[str]:
+    problems = []
+    if summary.get("poll_failure_count"):
+        problems.append(f"{summary['poll_failure_count']} poll cycle(s) raised")
+    if summary.get("dedup_double_handled"):
+        problems.append(f"{summary['dedup_double_handled']} command(s) handled twice")
+    if summary.get("open_fds_growth"):
+        problems.append(f"open file descriptors grew by {summary['open_fds_growth']}")
+    if summary.get("helix_401"):
+        problems.append(f"{summary['helix_401']} Helix request(s) sent with an expired token")
+    if summary.get("youtube_403"):
+        problems.append(f"{summary['youtube_403']} YouTube call(s) rejected for quota")
+    if summary.get("quota_resets_off_schedule"):
+        problems.append(
+            f"{summary['quota_resets_off_schedule']} quota ledger reset(s) away from midnight Pacific"
+        )
+    if summary.get("quota_day_mismatch_count"):
+        problems.append(
+            f"quota ledger out of step with the Pacific day after "
+            f"{summary['quota_day_mismatch_count']} cycle(s)"
+        )
+    if summary.get("rename_429"):
+        problems.append(f"{summary['rename_429']} channel rename(s) rate limited")
+    return problems
+
+
+def _print_sample(row: dict[str, Any]) -> None:
+    print(
+        f"{row['sim_time']}  rss {row['rss_kib'] / 1024:7.1f} MiB  fds {row['open_fds']!s:>4}  "
+        f"objs {row['py_objects']:>8}  state {row['state_bytes'] / 1024:8.1f} KiB  "
+        f"http {sum(row['http_calls'].values()):>7}  quota {row['quota_used_today']:>5}  "
+        f"live {row['live_streams']:>4}  ({row['real_seconds']:.0f}s real)"
+    )
+
+
+def _parse_args(argv: Optional[list[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Soak Puck under a virtual clock")
+    parser.add_argument("--days", type=int, default=7, help="Simulated days (default: 7)")
+    parser.add_argument("--streams", type=int, default=200, help="Roster size (default: 200)")
+    parser.add_argument("--start", default="2026-03-02T00:00:00Z",
+                        help="Simulated start, UTC (default spans the US DST change)")
+    parser.add_argument("--sample-minutes", type=int, default=60,
+                        help="Simulated minutes between samples (default: 60)")
+    parser.add_argument("--token-ttl-hours", type=float, default=36.0,
+                        help="Lifetime of fake Twitch app tokens (default: 36)")
+    parser.add_argument("--youtube-quota", type=int,
+                        help="Enforce this daily quota per key at the fake (resets midnight PT)")
+    parser.add_argument("--commands-per-hour", type=int, default=4,
+                        help="Admin commands delivered per simulated hour")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Share of upstream calls answered with an injected failure")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--log-level", default="CRITICAL")
+    parser.add_argument("--output", help="Write samples and summary JSON here")
+    parser.add_argument("--capture",
+                        help="Record every upstream response to this fixture archive (.jsonl.gz)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = _parse_args(argv)
+    print(f"Puck soak: {args.days} simulated day(s), {args.streams} streams, from {args.start}")
+    result = asyncio.run(soak(args))
+    summary = result["summary"]
+    report = {
+        "environment": run_environment(),
+        "params": {k: v for k, v in vars(args).items() if k not in ("output", "log_level", "capture")},
+        **result,
+    }
+
+    print(
+        f"\n{summary['broadcasts']} broadcasts · {summary['role_adds']} role adds · "
+        f"{summary['token_requests']} token request(s) · "
+        f"{len(summary['quota_ledger_resets'])} quota reset(s) · "
+        f"{summary['real_seconds']}s real"
+    )
+    print(
+        f"RSS {summary['rss_kib_end'] / 1024:.1f} MiB "
+        f"({summary['rss_growth_kib_per_day']:+.0f} KiB/day after day 1) · "
+        f"objects {summary['py_objects_growth_per_day']:+}/day · "
+        f"fds {summary['open_fds_growth']!s}"
+    )
+    for name, growth in summary["state_growth_bytes"].items():
+        if growth:
+            print(f"  {name}: {growth:+} bytes after day 1")
+    for reset in summary["quota_ledger_resets"]:
+        note = "" if reset["on_schedule"] else " — not at midnight Pacific"
+        print(f"  quota ledger reset at {reset['utc']} ({reset['pacific']} Pacific){note}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+
+    problems = _problems(summary)
+    for problem in problems:
+        print(f"⚠️ {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
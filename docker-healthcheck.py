@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Docker HEALTHCHECK probe for puck-bot. The bot writes the /healthz URL it
+actually bound (from the merged config) to /tmp/puck-healthz.url, so the
+probe follows health.host/port wherever they were set. With the endpoint
+disabled the file is absent and the probe passes.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import sys
+import urllib.request
+from pathlib import Path
+
+HEALTH_URL_FILE = Path("/tmp/puck-healthz.url")
+TIMEOUT_SECONDS = 4
+
+
+def main() -> int:
+    try:
+        url = HEALTH_URL_FILE.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return 0  # Health endpoint disabled (or not bound yet)
+    try:
+        with urllib.request.urlopen(url, timeout=TIMEOUT_SECONDS):
+            return 0
+    except Exception as e:  # HTTPError (503), URLError, timeouts
+        print(f"puck healthcheck failed: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,37 +13,80 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Admin utility handler for puck-bot. Provides the !roles command for
 listing guild roles and their IDs — essential for populating config files
-with correct role IDs without guessing.
+with correct role IDs without guessing — !slo for go-live latency
+percentiles and SLO attainment, and !puckstats for the slowest poll-cycle
+stages, recent cycle breakdowns and event-loop lag, and !puckprofile to
+profile the next poll cycles on demand. Also owns the message dedup window
+(fluxer-py delivers every event twice).
 
 Admin-only: requires the caller to have a role with the Administrator
 permission bit (0x8).
 ----------------------------------------------------------------------------
-FILE VERSION: v1.0.0
-LAST MODIFIED: 2026-03-04
+FILE VERSION: v1.5.1
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
 ============================================================================
 """
 
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
 import fluxer
 
 from src.managers.config_manager import ConfigManager
+from src.managers.latency_manager import LatencyManager
 from src.managers.logging_config_manager import LoggingConfigManager
+from src.managers.loop_monitor_manager import LoopMonitorManager
+from src.managers.profile_manager import MODE_CPU, ProfileManager
+from src.managers.trace_manager import TraceManager
+
+STATS_STAGES = 8   # Slowest span names shown by !puckstats
+STATS_CYCLES = 5   # Recent cycles shown by !puckstats
+SEEN_MESSAGES = 100  # Message IDs remembered for dedup
 
 
 class AdminCommandsHandler:
-    """Admin-only commands for puck-bot. Currently implements !roles."""
+    """Admin-only commands for puck-bot: !roles, !slo, !puckstats and !puckprofile."""
 
     def __init__(
         self,
         bot: fluxer.Bot,
         config_manager: ConfigManager,
         logging_manager: LoggingConfigManager,
+        latency_manager: LatencyManager,
+        trace_manager: TraceManager,
+        loop_monitor: LoopMonitorManager,
+        profile_manager: ProfileManager,
     ) -> None:
         self._bot = bot
         self._config = config_manager
         self._log = logging_manager.get_logger("admin_commands")
+        self._latency = latency_manager
+        self._tracer = trace_manager
+        self._loop_monitor = loop_monitor
+        self._profiler = profile_manager
+        self._seen: OrderedDict[int, None] = OrderedDict()
+
+    def is_duplicate(self, message_id: Optional[int]) -> bool:
+        """True if this message ID was already seen; otherwise remember it.
+
+        Keeps the most recent SEEN_MESSAGES IDs, evicting the oldest first.
+        """
+        if not message_id:
+            return False
+        if message_id in self._seen:
+            return True
+        self._seen[message_id] = None
+        if len(self._seen) > SEEN_MESSAGES:
+            self._seen.popitem(last=False)
+        return False
+
+    @property
+    def seen_count(self) -> int:
+        return len(self._seen)
 
     async def handle(self, message: fluxer.Message) -> bool:
         """Process a message. Returns True if handled, False otherwise.
@@ -56,10 +99,22 @@ class AdminCommandsHandler:
             await self._cmd_roles(message)
             return True
 
+        if content == "!slo":
+            await self._cmd_slo(message)
+            return True
+
+        if content == "!puckstats":
+            await self._cmd_puckstats(message)
+            return True
+
+        if content.split()[0] == "!puckprofile":
+            await self._cmd_puckprofile(message, content.split()[1:])
+            return True
+
         return False
 
-    async def _cmd_roles(self, message: fluxer.Message) -> None:
-        """List all guild roles with their IDs. Admin-only."""
+    async def _admin_roles(self, message: fluxer.Message, command: str) -> Optional[list]:
+        """Return the guild's roles if the caller is an administrator, else None."""
         guild_id = message.channel.guild_id
         try:
             guild = await self._bot.fetch_guild(guild_id)
@@ -67,7 +122,7 @@ class AdminCommandsHandler:
             roles = await guild.fetch_roles()
         except Exception as e:
             self._log.error(f"Could not fetch guild data: {e}")
-            return
+            return None
 
         # member.roles is list[int] in fluxer-py (not role objects)
         member_role_ids = set(member.roles)
@@ -80,11 +135,18 @@ class AdminCommandsHandler:
 
         if not is_admin:
             self._log.debug(
-                f"!roles ignored for {message.author} — not an administrator"
+                f"{command} ignored for {message.author} — not an administrator"
             )
-            return
+            return None
+
+        self._log.info(f"{command} used by {message.author} in #{message.channel}")
+        return roles
 
-        self._log.info(f"!roles used by {message.author} in #{message.channel}")
+    async def _cmd_roles(self, message: fluxer.Message) -> None:
+        """List all guild roles with their IDs. Admin-only."""
+        roles = await self._admin_roles(message, "!roles")
+        if roles is None:
+            return
 
         lines = ["**Guild Roles and IDs:**\n```"]
         for role in sorted(roles, key=lambda r: r.position, reverse=True):
@@ -111,17 +173,129 @@ class AdminCommandsHandler:
             for c in chunks:
                 await message.reply(c)
 
+    async def _cmd_slo(self, message: fluxer.Message) -> None:
+        """Show go-live latency percentiles and SLO attainment. Admin-only."""
+        if await self._admin_roles(message, "!slo") is None:
+            return
+
+        slo = self._latency.slo()
+        rows = self._latency.summary()
+        lines = [f"**Go-live latency** (target: Live role within {slo['target_seconds']}s of stream start)"]
+        if slo["ratio"] is None:
+            lines.append("No go-live transitions recorded yet.")
+        else:
+            lines.append(
+                f"SLO: {slo['ratio']:.1%} within target "
+                f"({slo['within']}/{slo['count']} go-lives)"
+            )
+        if rows:
+            lines.append("```")
+            lines.append(f"{'segment':<8} {'platform':<8} {'n':>5} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+            for row in rows:
+                lines.append(
+                    f"{row['segment']:<8} {row['platform']:<8} {row['count']:>5} "
+                    f"{row['p50']:>7.2f}s {row['p90']:>7.2f}s {row['p99']:>7.2f}s {row['max']:>7.2f}s"
+                )
+            lines.append("```")
+            lines.append("detect = start → detection · role/embed = detection → applied · total = start → role")
+        await message.reply("\n".join(lines))
+
+    async def _cmd_puckstats(self, message: fluxer.Message) -> None:
+        """Show the slowest stages and recent poll-cycle breakdowns. Admin-only."""
+        if await self._admin_roles(message, "!puckstats") is None:
+            return
+
+        cycles = self._tracer.recent(STATS_CYCLES)
+        if not cycles:
+            await message.reply("No poll cycles traced yet.")
+            return
+
+        lines = [f"**Puck stats** — {self._tracer.buffered_cycles} recent cycle(s)"]
+        lines.append("Slowest stages:\n```")
+        lines.append(f"{'stage':<22} {'n':>5} {'p50':>8} {'max':>8}")
+        for row in self._tracer.slowest_stages(STATS_STAGES):
+            lines.append(
+                f"{row['name'][:22]:<22} {row['count']:>5} "
+                f"{row['p50']:>7.3f}s {row['max']:>7.3f}s"
+            )
+        lines.append("```")
+
+        loop = self._loop_monitor.summary()
+        if loop["samples"]:
+            lines.append(
+                f"Event loop lag: p50 {loop['p50'] * 1000:.0f}ms · "
+                f"p99 {loop['p99'] * 1000:.0f}ms · max {loop['max'] * 1000:.0f}ms · "
+                f"{len(loop['stalls'])} recent stall(s)"
+            )
+            for stall in loop["stalls"][-3:]:
+                at = datetime.fromtimestamp(stall["at"], tz=timezone.utc)
+                lines.append(
+                    f"  {at:%H:%M:%S} blocked {stall['lag_seconds']:.2f}s in "
+                    f"{stall['task']} at `{stall['site'].rsplit('/', 1)[-1]}`"
+                )
+
+        lines.append("Recent cycles:\n```")
+        for trace in cycles:
+            root = trace.root
+            started = datetime.fromtimestamp(root.start_ns / 1e9, tz=timezone.utc)
+            stages = " · ".join(
+                f"{span.name} {span.duration:.2f}s" for span in trace.children(root)
+            )
+            dropped = f" (+{trace.dropped} dropped)" if trace.dropped else ""
+            lines.append(
+                f"{started:%H:%M:%S} {root.duration:.2f}s — "
+                f"{stages or 'no stages'}{dropped}"
+            )
+        lines.append("```")
+
+        output = "\n".join(lines)
+        if len(output) > 2000:  # Fluxer message limit
+            output = output[:1990] + "\n…```"
+        await message.reply(output)
+
+    async def _cmd_puckprofile(self, message: fluxer.Message, args: list[str]) -> None:
+        """Profile the next poll cycles. Admin-only.
+
+        !puckprofile [cycles] [cpu|mem|all] · !puckprofile status · !puckprofile cancel
+        """
+        if await self._admin_roles(message, "!puckprofile") is None:
+            return
+
+        if args and args[0] == "status":
+            await message.reply(self._profiler.status())
+            return
+        if args and args[0] == "cancel":
+            await message.reply(self._profiler.cancel())
+            return
+
+        cycles: Optional[int] = None
+        mode = MODE_CPU
+        for arg in args:
+            if arg.isdigit():
+                cycles = int(arg)
+            else:
+                mode = arg
+        await message.reply(self._profiler.arm(cycles, mode, str(message.author)))
+
 
 def create_admin_commands_handler(
     bot: fluxer.Bot,
     config_manager: ConfigManager,
     logging_manager: LoggingConfigManager,
+    latency_manager: LatencyManager,
+    trace_manager: TraceManager,
+    loop_monitor: LoopMonitorManager,
+    profile_manager: ProfileManager,
 ) -> AdminCommandsHandler:
     """Factory function — MANDATORY. Never call AdminCommandsHandler directly."""
     return AdminCommandsHandler(
         bot=bot,
         config_manager=config_manager,
         logging_manager=logging_manager,
+        latency_manager=latency_manager,
+        trace_manager=trace_manager,
+        loop_monitor=loop_monitor,
+        profile_manager=profile_manager,
     )
 
 
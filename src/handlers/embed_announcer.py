@@ -19,8 +19,8 @@ Twitch-only: YouTube streams do not get embed announcements.
 
 Uses the Fluxer REST API directly via httpx for embed operations.
 ----------------------------------------------------------------------------
-FILE VERSION: v2.0.0
-LAST MODIFIED: 2026-03-04
+FILE VERSION: v2.6.0
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
@@ -31,12 +31,13 @@ import json
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
 
 import httpx
 
 from src.managers.config_manager import ConfigManager
 from src.managers.logging_config_manager import LoggingConfigManager
+from src.managers.resilience_manager import ResilienceManager
 from src.models.stream_status import StreamStatus
 
 FLUXER_API_BASE = "https://api.fluxer.app/v1"
@@ -52,12 +53,15 @@ class EmbedAnnouncer:
         self,
         config_manager: ConfigManager,
         logging_manager: LoggingConfigManager,
+        resilience_manager: ResilienceManager,
+        state_file: str = ANNOUNCEMENTS_STATE_FILE,
     ) -> None:
         self._config = config_manager
         self._log = logging_manager.get_logger("embed_announcer")
+        self._resilience = resilience_manager
+        self._state_file = Path(state_file)
         self._token = config_manager.get_token()
         self._channel_id = config_manager.get_announcement_channel_id()
-        self._http: Optional[httpx.AsyncClient] = None
 
         # Maps "twitch:{username}" -> {"message_id": str, "last_updated": float}
         self._active: dict[str, dict[str, Any]] = {}
@@ -78,7 +82,7 @@ class EmbedAnnouncer:
     # -------------------------------------------------------------------------
     def _load_state(self) -> None:
         """Load active announcement message IDs from disk."""
-        path = Path(ANNOUNCEMENTS_STATE_FILE)
+        path = self._state_file
         if not path.exists():
             return
         try:
@@ -94,7 +98,7 @@ class EmbedAnnouncer:
     def _save_state(self) -> None:
         """Persist active announcement message IDs to disk."""
         try:
-            path = Path(ANNOUNCEMENTS_STATE_FILE)
+            path = self._state_file
             path.parent.mkdir(parents=True, exist_ok=True)
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(self._active, f, indent=2)
@@ -102,12 +106,11 @@ class EmbedAnnouncer:
             self._log.error(f"❌ Could not save announcements state: {e}")
 
     # -------------------------------------------------------------------------
-    # HTTP Client
+    # HTTP
     # -------------------------------------------------------------------------
-    async def _get_http(self) -> httpx.AsyncClient:
-        if self._http is None or self._http.is_closed:
-            self._http = httpx.AsyncClient(timeout=15.0)
-        return self._http
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a Fluxer REST request through the shared resilience layer."""
+        return await self._resilience.request("fluxer", method, url, **kwargs)
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -167,10 +170,13 @@ class EmbedAnnouncer:
             "description": status.stream_title or "Live now!",
             "fields": fields,
             "footer": {
-                "text": f"twitch.tv/{status.platform_username}",
+                "text": stream_url.removeprefix("https://"),
             },
         }
 
+        if status.avatar_url:
+            embed["author"] = {"name": status.display_name, "icon_url": status.avatar_url}
+
         if thumbnail:
             embed["image"] = {"url": thumbnail}
 
@@ -179,19 +185,22 @@ class EmbedAnnouncer:
     # -------------------------------------------------------------------------
     # Public Interface
     # -------------------------------------------------------------------------
-    async def create_announcement(self, status: StreamStatus) -> None:
-        """Post a new stream announcement embed. Twitch only."""
+    async def create_announcement(self, status: StreamStatus) -> bool:
+        """Post a new stream announcement embed. Twitch only.
+
+        Returns True if an announcement was posted.
+        """
         if status.platform != "twitch":
-            return
+            return False
         if not self._channel_id:
-            return
+            return False
 
         embed = self._build_embed(status)
         key = f"twitch:{status.platform_username}"
 
-        http = await self._get_http()
         try:
-            resp = await http.post(
+            resp = await self._request(
+                "POST",
                 f"{FLUXER_API_BASE}/channels/{self._channel_id}/messages",
                 headers=self._headers(),
                 json={
@@ -215,10 +224,12 @@ class EmbedAnnouncer:
                 f"Posted announcement for {status.display_name} "
                 f"(msg {message_id})"
             )
+            return True
         except httpx.HTTPError as e:
             self._log.error(
                 f"❌ Failed to post announcement for {status.display_name}: {e}"
             )
+            return False
 
     async def update_announcement(self, status: StreamStatus) -> None:
         """Update an existing announcement embed with fresh data. Twitch only."""
@@ -242,9 +253,9 @@ class EmbedAnnouncer:
         message_id = active["message_id"]
         embed = self._build_embed(status)
 
-        http = await self._get_http()
         try:
-            resp = await http.patch(
+            resp = await self._request(
+                "PATCH",
                 f"{FLUXER_API_BASE}/channels/{self._channel_id}/messages/{message_id}",
                 headers=self._headers(),
                 json={
@@ -293,9 +304,9 @@ class EmbedAnnouncer:
             return
 
         message_id = active["message_id"]
-        http = await self._get_http()
         try:
-            resp = await http.delete(
+            resp = await self._request(
+                "DELETE",
                 f"{FLUXER_API_BASE}/channels/{self._channel_id}/messages/{message_id}",
                 headers=self._headers(),
             )
@@ -332,6 +343,17 @@ class EmbedAnnouncer:
         # it will call delete_announcement for any persisted entries
         # where the streamer is no longer live.
 
+    def reassign_announcement(self, key: str, fluxer_user_id: str) -> None:
+        """Point an active announcement at a different Fluxer member.
+
+        Used when a roster hot-reload remaps a live stream to a new member.
+        """
+        active = self._active.get(key)
+        if not active or active.get("fluxer_user_id") == fluxer_user_id:
+            return
+        active["fluxer_user_id"] = fluxer_user_id
+        self._save_state()
+
     def get_active_keys(self) -> set[str]:
         """Return the set of stream keys that have active announcements."""
         return set(self._active.keys())
@@ -344,11 +366,15 @@ class EmbedAnnouncer:
 def create_embed_announcer(
     config_manager: ConfigManager,
     logging_manager: LoggingConfigManager,
+    resilience_manager: ResilienceManager,
+    state_file: str = ANNOUNCEMENTS_STATE_FILE,
 ) -> EmbedAnnouncer:
     """Factory function — MANDATORY. Never call EmbedAnnouncer directly."""
     return EmbedAnnouncer(
         config_manager=config_manager,
         logging_manager=logging_manager,
+        resilience_manager=resilience_manager,
+        state_file=state_file,
     )
 
 
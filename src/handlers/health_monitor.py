@@ -0,0 +1,286 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Health monitor for puck-bot. Owns the background polling task and keeps it
+alive: a watchdog restarts it if it exits or if poll cycles stop finishing
+within health.restart_after_seconds (e.g. a request hung without a
+timeout). A small HTTP listener reports gateway connection state, the age
+of the last successful cycle and the upstream circuit breakers as JSON:
+
+    GET /healthz  → 200 while the bot is doing its job, else 503 (Docker)
+    GET /readyz   → 200 once connected and the first cycle has finished
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+import json
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Optional
+
+import fluxer
+
+from src.handlers.stream_monitor import StreamMonitor
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+from src.managers.metrics_manager import MetricsManager
+from src.managers.resilience_manager import ResilienceManager
+from src.utils.http_listener import HttpListener
+
+WATCH_INTERVAL = 15     # Seconds between watchdog checks
+CANCEL_TIMEOUT = 10     # Seconds to wait for a stuck polling task to unwind
+HEALTH_URL_FILE = "/tmp/puck-healthz.url"  # Read by docker-healthcheck.py
+
+
+class HealthMonitor:
+    """Supervises the polling task and serves /healthz and /readyz."""
+
+    def __init__(
+        self,
+        bot: fluxer.Bot,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        stream_monitor: StreamMonitor,
+        resilience_manager: ResilienceManager,
+        metrics_manager: MetricsManager,
+        url_file: str = HEALTH_URL_FILE,
+    ) -> None:
+        self._bot = bot
+        self._config = config_manager
+        self._log = logging_manager.get_logger("health_monitor")
+        self._monitor = stream_monitor
+        self._resilience = resilience_manager
+        self._metrics = metrics_manager
+        self._started_at = time.monotonic()
+        self._poll_task: Optional[asyncio.Task] = None
+        self._polling_since: Optional[float] = None  # When the current task started
+        self._watch_task: Optional[asyncio.Task] = None
+        self._listener = HttpListener(
+            {
+                "/healthz": lambda: self._route(readiness=False),
+                "/readyz": lambda: self._route(readiness=True),
+            },
+            content_type="application/json; charset=utf-8",
+            not_found=b'{"error": "not found"}\n',
+        )
+        self._url_file = Path(url_file)
+        self._disconnected_at: Optional[float] = None
+        self.restarts = 0
+
+    # -------------------------------------------------------------------------
+    # Polling Task + Watchdog
+    # -------------------------------------------------------------------------
+    def start_polling(self) -> None:
+        """Start the polling task unless it is already running.
+
+        Safe to call from every on_ready — the gateway fires READY again
+        after a reconnect, which must not start a second polling loop.
+        """
+        if self._poll_task is not None and not self._poll_task.done():
+            return
+        self._polling_since = time.monotonic()
+        self._poll_task = asyncio.create_task(self._run_polling(), name="stream_monitor")
+
+    async def _run_polling(self) -> None:
+        try:
+            await self._monitor.start()
+        except Exception as e:
+            self._log.error(f"❌ Stream monitor crashed: {e}\n{traceback.format_exc()}")
+
+    def _restart_deadline(self) -> float:
+        """Seconds without a finished cycle before polling counts as stuck."""
+        snapshot = self._config.snapshot
+        # Never shorter than two sleeps plus a full cycle, whatever the config
+        floor = 2 * snapshot.poll_interval + snapshot.cycle_deadline_seconds
+        return max(snapshot.health_restart_after_seconds, floor)
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(WATCH_INTERVAL)
+            self._track_gateway()
+            task = self._poll_task
+            if task is None:
+                continue  # Not connected yet — on_ready starts polling
+            if task.done():
+                await self._restart("the polling task exited")
+                continue
+            last = max(self._monitor.last_cycle_at or 0.0, self._polling_since or 0.0)
+            idle = time.monotonic() - last
+            if idle > self._restart_deadline():
+                await self._restart(f"no poll cycle finished in {idle:.0f}s")
+
+    async def _restart(self, reason: str) -> None:
+        """Cancel the polling task (if still running) and start a fresh one."""
+        self.restarts += 1
+        self._metrics.inc("puck_polling_restarts_total")
+        self._log.error(f"❌ Watchdog: {reason} — restarting polling (restart #{self.restarts})")
+        task = self._poll_task
+        if task is not None and not task.done():
+            task.cancel()
+            done, _ = await asyncio.wait({task}, timeout=CANCEL_TIMEOUT)
+            if not done:
+                self._log.warning(
+                    f"⚠️ Watchdog: stuck polling task ignored cancellation for "
+                    f"{CANCEL_TIMEOUT}s — starting a new one anyway"
+                )
+        self._poll_task = None
+        self.start_polling()
+
+    def _track_gateway(self) -> Optional[bool]:
+        """Gateway connection state; remembers when it was lost."""
+        # fluxer.py has no public accessor for the gateway connection
+        gateway = getattr(self._bot, "_gateway", None)
+        connected = gateway.is_connected if gateway is not None else False
+        if connected:
+            self._disconnected_at = None
+        elif self._disconnected_at is None:
+            self._disconnected_at = time.monotonic()
+        return connected
+
+    # -------------------------------------------------------------------------
+    # Health Report
+    # -------------------------------------------------------------------------
+    def report(self) -> dict[str, Any]:
+        """Current health, plus the problems that make it unhealthy."""
+        snapshot = self._config.snapshot
+        connected = self._track_gateway()
+        now = time.monotonic()
+        problems: list[str] = []
+
+        disconnected_for = now - self._disconnected_at if self._disconnected_at else None
+        if disconnected_for is not None and disconnected_for > snapshot.health_gateway_grace_seconds:
+            problems.append(f"gateway disconnected for {disconnected_for:.0f}s")
+
+        last_success = self._monitor.last_success_at
+        success_age = now - last_success if last_success is not None else None
+        stale_after = max(snapshot.health_stale_after_seconds, self._restart_deadline())
+        if (success_age if success_age is not None else now - self._started_at) > stale_after:
+            problems.append(
+                f"no successful poll cycle in {success_age:.0f}s" if success_age is not None
+                else f"no successful poll cycle since startup ({now - self._started_at:.0f}s)"
+            )
+
+        breakers = self._resilience.breaker_states()
+        open_upstreams = sorted(name for name, b in breakers.items() if b["state"] == "open")
+        if problems:
+            status = "unhealthy"
+        elif open_upstreams or not connected or success_age is None:
+            status = "degraded"  # Not the bot's fault, or still starting — no restart
+        else:
+            status = "ok"
+
+        last_cycle = self._monitor.last_cycle_at
+        return {
+            "status": status,
+            "ready": bool(connected) and success_age is not None and not problems,
+            "problems": problems,
+            "uptime_seconds": round(now - self._started_at, 1),
+            "gateway": {
+                "connected": connected,
+                "disconnected_seconds": (
+                    round(disconnected_for, 1) if disconnected_for is not None else None
+                ),
+            },
+            "polling": {
+                "running": self._poll_task is not None and not self._poll_task.done(),
+                "last_success_age_seconds": round(success_age, 1) if success_age is not None else None,
+                "last_cycle_age_seconds": round(now - last_cycle, 1) if last_cycle is not None else None,
+                "restarts": self.restarts,
+            },
+            "breakers": breakers,
+            "open_upstreams": open_upstreams,
+        }
+
+    # -------------------------------------------------------------------------
+    # HTTP Listener
+    # -------------------------------------------------------------------------
+    def _route(self, readiness: bool) -> tuple[str, bytes]:
+        """Status line and JSON body for /healthz (liveness) or /readyz."""
+        report = self.report()
+        healthy = report["ready"] if readiness else not report["problems"]
+        status = "200 OK" if healthy else "503 Service Unavailable"
+        return status, (json.dumps(report, indent=2) + "\n").encode("utf-8")
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+    async def start(self) -> None:
+        """Start the watchdog and, if enabled, the health listener."""
+        if self._watch_task is None or self._watch_task.done():
+            self._watch_task = asyncio.create_task(self._watch(), name="polling_watchdog")
+        snapshot = self._config.snapshot
+        if self._listener.running:
+            return
+        # The Docker HEALTHCHECK probes whatever URL this file names, and
+        # passes while it is absent (endpoint disabled or not bound)
+        self._url_file.unlink(missing_ok=True)
+        if not snapshot.health_enabled:
+            return
+        try:
+            await self._listener.start(snapshot.health_host, snapshot.health_port)
+        except OSError as e:
+            self._log.error(f"❌ Could not start health endpoint: {e}")
+            return
+        probe_host = "127.0.0.1" if snapshot.health_host in ("", "0.0.0.0", "::") else snapshot.health_host
+        try:
+            self._url_file.write_text(
+                f"http://{probe_host}:{snapshot.health_port}/healthz\n", encoding="utf-8"
+            )
+        except OSError as e:
+            self._log.warning(f"⚠️ Could not write {self._url_file} for the Docker HEALTHCHECK: {e}")
+        self._log.success(
+            f"Health endpoint listening on "
+            f"http://{snapshot.health_host}:{snapshot.health_port}/healthz"
+        )
+
+    async def stop(self) -> None:
+        """Stop the watchdog, the polling task and the health listener."""
+        tasks = {t for t in (self._watch_task, self._poll_task) if t is not None and not t.done()}
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks, timeout=CANCEL_TIMEOUT)
+        self._watch_task = self._poll_task = None
+        await self._listener.stop()
+        self._url_file.unlink(missing_ok=True)
+
+
+def create_health_monitor(
+    bot: fluxer.Bot,
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    stream_monitor: StreamMonitor,
+    resilience_manager: ResilienceManager,
+    metrics_manager: MetricsManager,
+    url_file: str = HEALTH_URL_FILE,
+) -> HealthMonitor:
+    """Factory function — MANDATORY. Never call HealthMonitor directly."""
+    return HealthMonitor(
+        bot=bot,
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        stream_monitor=stream_monitor,
+        resilience_manager=resilience_manager,
+        metrics_manager=metrics_manager,
+        url_file=url_file,
+    )
+
+
+__all__ = ["HealthMonitor", "create_health_monitor"]
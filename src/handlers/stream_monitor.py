@@ -13,10 +13,16 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Stream monitor handler. Runs the background polling loop that checks Twitch
 and YouTube for live streams, compares against persisted state, and toggles
-the configured "Live" role on Fluxer for community members.
+the configured "Live" role on Fluxer for community members. Streams outside
+their learned schedule window are polled at a reduced rate. Roles follow the
+member: a member live on several platforms keeps the role until the last
+stream ends. Go-live latency (start → detection → role/embed) is recorded
+for every transition, and each cycle is traced stage by stage. Cycles can
+be profiled on demand (!puckprofile). The times of the last finished and
+last successful cycle are kept for the health endpoint and its watchdog.
 ----------------------------------------------------------------------------
-FILE VERSION: v1.2.0
-LAST MODIFIED: 2026-03-04
+FILE VERSION: v1.17.2
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
@@ -24,17 +30,26 @@ Repository: https://github.com/the-alphabet-cartel/puck
 """
 
 import asyncio
+import time
 import traceback
+from typing import Any, Optional
 
 import fluxer
 import httpx
 
 from src.handlers.embed_announcer import EmbedAnnouncer
 from src.managers.config_manager import ConfigManager
+from src.managers.latency_manager import LatencyManager
 from src.managers.logging_config_manager import LoggingConfigManager
+from src.managers.profile_manager import ProfileManager
+from src.managers.trace_manager import TraceManager
+from src.managers.resilience_manager import ResilienceManager
+from src.managers.schedule_manager import ScheduleManager
 from src.managers.stream_state_manager import StreamStateManager
 from src.managers.twitch_manager import TwitchManager
 from src.managers.youtube_manager import YouTubeManager
+from src.models.check_result import PlatformCheckResult
+from src.models.roster_diff import RosterDiff, roster_entries
 from src.models.stream_status import StreamStatus
 
 FLUXER_API_BASE = "https://api.fluxer.app/v1"
@@ -52,6 +67,11 @@ class StreamMonitor:
         youtube_manager: YouTubeManager,
         state_manager: StreamStateManager,
         embed_announcer: EmbedAnnouncer,
+        resilience_manager: ResilienceManager,
+        schedule_manager: ScheduleManager,
+        trace_manager: TraceManager,
+        latency_manager: LatencyManager,
+        profile_manager: ProfileManager,
     ) -> None:
         self._bot = bot
         self._config = config_manager
@@ -64,7 +84,23 @@ class StreamMonitor:
         self._youtube_cycle: int = 0
         self._running: bool = False
         self._current_channel_name: str | None = None  # Track to avoid redundant renames
-        self._rename_http: httpx.AsyncClient | None = None
+        self._resilience = resilience_manager
+        self._schedule = schedule_manager
+        self._tracer = trace_manager
+        self._latency = latency_manager
+        self._profiler = profile_manager
+        # Serializes poll cycles and roster hot-reloads so they never
+        # interleave state comparisons
+        self._cycle_lock = asyncio.Lock()
+        # Cached guild object (skips the guild round-trip per transition)
+        self._guild: Any = None
+        self._guild_id: str = ""
+        self._created_at = time.monotonic()
+        self._warm_restored = False
+        self.time_to_first_poll: Optional[float] = None
+        # Monotonic times read by the health endpoint and polling watchdog
+        self.last_cycle_at: Optional[float] = None    # Any cycle that finished
+        self.last_success_at: Optional[float] = None  # Last cycle without an error
 
     # -------------------------------------------------------------------------
     # User-to-Stream Mapping
@@ -92,21 +128,34 @@ class StreamMonitor:
     # -------------------------------------------------------------------------
     # Role Toggle
     # -------------------------------------------------------------------------
-    async def _add_live_role(self, status: StreamStatus) -> None:
-        """Add the Live role to a Fluxer member."""
-        guild_id = self._config.get_guild_id()
-        role_id = self._config.get_live_role_id()
+    async def _get_guild(self, guild_id: str) -> Any:
+        """Fetch the configured guild once and reuse it across transitions."""
+        if self._guild is None or self._guild_id != guild_id:
+            self._guild = await self._bot.fetch_guild(int(guild_id))
+            self._guild_id = guild_id
+        return self._guild
+
+    async def _add_live_role(self, status: StreamStatus) -> bool:
+        """Add the Live role to a Fluxer member.
+
+        Returns True only if this call added the role.
+        """
+        guild_id = self._config.snapshot.guild_id
+        role_id = self._config.snapshot.live_role_id
         if not guild_id or not role_id:
             self._log.warning("⚠️ Guild ID or Live Role ID not configured — skipping role add")
-            return
+            return False
         try:
-            guild = await self._bot.fetch_guild(int(guild_id))
+            guild = await self._get_guild(guild_id)
             member = await guild.fetch_member(int(status.fluxer_user_id))
 
             # Check if member already has the role
             if int(role_id) in member.roles:
-                self._log.debug(f"🔍 {status.display_name} already has Live role")
-                return
+                self._log.debug(
+                    "🔍 %s already has Live role", status.display_name,
+                    extra={"platform": status.platform, "stream": status.key},
+                )
+                return False
 
             await member.add_role(
                 int(role_id),
@@ -115,8 +164,10 @@ class StreamMonitor:
             )
             self._log.success(
                 f"Added Live role to {status.display_name} "
-                f"({status.platform}: {status.stream_title})"
+                f"({status.platform}: {status.stream_title})",
+                extra={"platform": status.platform, "stream": status.key},
             )
+            return True
         except fluxer.Forbidden:
             self._log.error(
                 f"❌ Missing permissions to add Live role to {status.display_name} "
@@ -124,19 +175,23 @@ class StreamMonitor:
             )
         except Exception as e:
             self._log.error(f"❌ Failed to add Live role to {status.display_name}: {e}")
+        return False
 
     async def _remove_live_role(self, status: StreamStatus) -> None:
         """Remove the Live role from a Fluxer member."""
-        guild_id = self._config.get_guild_id()
-        role_id = self._config.get_live_role_id()
+        guild_id = self._config.snapshot.guild_id
+        role_id = self._config.snapshot.live_role_id
         if not guild_id or not role_id:
             return
         try:
-            guild = await self._bot.fetch_guild(int(guild_id))
+            guild = await self._get_guild(guild_id)
             member = await guild.fetch_member(int(status.fluxer_user_id))
 
             if int(role_id) not in member.roles:
-                self._log.debug(f"🔍 {status.display_name} doesn't have Live role")
+                self._log.debug(
+                    "🔍 %s doesn't have Live role", status.display_name,
+                    extra={"platform": status.platform, "stream": status.key},
+                )
                 return
 
             await member.remove_role(
@@ -144,7 +199,10 @@ class StreamMonitor:
                 guild_id=int(guild_id),
                 reason=f"Puck: {status.display_name} went offline on {status.platform}",
             )
-            self._log.success(f"Removed Live role from {status.display_name}")
+            self._log.success(
+                f"Removed Live role from {status.display_name}",
+                extra={"platform": status.platform, "stream": status.key},
+            )
         except fluxer.Forbidden:
             self._log.error(
                 f"❌ Missing permissions to remove Live role from {status.display_name}"
@@ -161,25 +219,24 @@ class StreamMonitor:
         Only fires on state transitions (idle→live or live→idle) to avoid
         hitting Fluxer's channel rename rate limit (2 per 10 minutes).
         """
-        channel_id = self._config.get_announcement_channel_id()
+        channel_id = self._config.snapshot.announcement_channel_id
         if not channel_id:
             return
 
         desired = (
-            self._config.get_channel_name_live() if anyone_live
-            else self._config.get_channel_name_idle()
+            self._config.snapshot.channel_name_live if anyone_live
+            else self._config.snapshot.channel_name_idle
         )
 
         # Skip if already in the desired state
         if self._current_channel_name == desired:
             return
 
-        if self._rename_http is None or self._rename_http.is_closed:
-            self._rename_http = httpx.AsyncClient(timeout=15.0)
-
-        token = self._config.get_token()
+        token = self._config.snapshot.token
         try:
-            resp = await self._rename_http.patch(
+            resp = await self._resilience.request(
+                "fluxer",
+                "PATCH",
                 f"{FLUXER_API_BASE}/channels/{channel_id}",
                 headers={
                     "Authorization": f"Bot {token}",
@@ -193,87 +250,359 @@ class StreamMonitor:
         except httpx.HTTPError as e:
             self._log.warning(f"⚠️ Could not update channel title: {e}")
 
+    # -------------------------------------------------------------------------
+    # Transitions
+    # -------------------------------------------------------------------------
+    async def _apply_transitions(
+        self,
+        went_live: list[StreamStatus],
+        went_offline: list[StreamStatus],
+        live_before: dict[str, set[str]],
+    ) -> None:
+        """Toggle roles and announcements for detected transitions.
+
+        Announcements are per stream; the Live role is per member and only
+        changes when the member's aggregate live state does.
+        """
+        self._schedule.observe(went_live, went_offline)
+        for status in went_live:
+            if status.fluxer_user_id:
+                self._latency.detected(status)
+
+        roles_added = await self._sync_member_roles(live_before, went_offline + went_live)
+        for status in went_live:
+            if status.fluxer_user_id in roles_added:
+                self._latency.role_applied(status, roles_added[status.fluxer_user_id])
+
+        for status in went_live:
+            if status.fluxer_user_id:
+                with self._tracer.span("embed_create", stream=status.key):
+                    posted = await self._embed.create_announcement(status)
+                if posted:
+                    self._latency.embed_posted(status, time.time())
+
+        for status in went_offline:
+            if status.fluxer_user_id:
+                with self._tracer.span("embed_delete", stream=status.key):
+                    await self._embed.delete_announcement(status)
+        if went_live:
+            self._latency.persist()
+
+    async def _sync_member_roles(
+        self,
+        live_before: dict[str, set[str]],
+        statuses: list[StreamStatus],
+    ) -> dict[str, float]:
+        """Add or remove the Live role for members whose aggregate state changed.
+
+        A member is live while any of their tracked streams is live, so
+        ending one of two concurrent streams leaves the role in place and
+        going live on a second platform is not a new role write.
+
+        Returns {fluxer_user_id: time the role was added} for new role holders.
+        """
+        live_after = self._state.live_members()
+        by_member: dict[str, StreamStatus] = {}
+        for status in statuses:
+            if status.fluxer_user_id:
+                by_member[status.fluxer_user_id] = status
+
+        added: dict[str, float] = {}
+        for fuid, status in by_member.items():
+            was_live, is_live = fuid in live_before, fuid in live_after
+            if is_live and not was_live:
+                with self._tracer.span("role_add", member=fuid):
+                    role_added = await self._add_live_role(status)
+                if role_added:
+                    added[fuid] = time.time()
+            elif was_live and not is_live:
+                with self._tracer.span("role_remove", member=fuid):
+                    await self._remove_live_role(status)
+            elif is_live:
+                self._log.debug(
+                    "🔍 %s still live on %s — Live role unchanged",
+                    status.display_name, ", ".join(sorted(live_after[fuid])),
+                    extra={"platform": status.platform, "stream": status.key},
+                )
+        return added
+
     # -------------------------------------------------------------------------
     # Polling Loop
     # -------------------------------------------------------------------------
     async def poll_once(self) -> None:
         """Execute a single poll cycle."""
+        try:
+            async with self._cycle_lock, self._profiler.cycle():
+                with self._tracer.cycle() as trace:
+                    await self._poll_cycle()
+        finally:
+            self.last_cycle_at = time.monotonic()
+        self.last_success_at = self.last_cycle_at
+        duration_ms = round(trace.root.duration * 1000, 1)
+        self._log.debug(
+            "🔍 Poll #%d finished in %.0fms", self._poll_count, duration_ms,
+            extra={"cycle": self._poll_count, "duration_ms": duration_ms},
+        )
+
+    async def _timed(self, stage: str, coro: Any) -> Any:
+        """Await a coroutine, recording its wall time as a poll-cycle stage."""
+        with self._tracer.span(stage, stage=True):
+            return await coro
+
+    async def _fetch(
+        self, twitch_usernames: list[str], youtube_ids: list[str]
+    ) -> PlatformCheckResult:
+        """Run platform checks concurrently under the per-cycle deadline.
+
+        Checks still outstanding at the deadline are cancelled; their
+        streams are simply not in checked_keys and keep last-known state.
+        """
+        deadline = self._config.snapshot.cycle_deadline_seconds
+        tasks: dict[str, asyncio.Task] = {}
+        with self._resilience.cycle_deadline(deadline):
+            if twitch_usernames:
+                tasks["twitch"] = asyncio.create_task(
+                    self._timed("twitch_fetch", self._twitch.check_streams(twitch_usernames))
+                )
+            if youtube_ids:
+                tasks["youtube"] = asyncio.create_task(
+                    self._youtube.check_streams(youtube_ids)
+                )
+        result = PlatformCheckResult()
+        if not tasks:
+            return result
+
+        done, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+        for platform, task in tasks.items():
+            if task in pending:
+                task.cancel()
+                self._log.warning(
+                    f"⚠️ {platform} check exceeded the {deadline}s cycle deadline "
+                    f"— keeping last-known state"
+                )
+            elif task.exception() is not None:
+                self._log.error(f"❌ {platform} check failed: {task.exception()}")
+            else:
+                result.merge(task.result())
+        return result
+
+    async def _poll_cycle(self) -> None:
         self._poll_count += 1
         self._youtube_cycle += 1
         twitch_map, youtube_map = self._build_mappings()
         tracked_streams = self._config.get_tracked_streams()
 
-        # --- Twitch (every cycle) ---
-        twitch_usernames = list(twitch_map.keys())
-        twitch_live = await self._twitch.check_streams(twitch_usernames)
-
-        # Map fluxer_user_id onto results
-        for status in twitch_live:
-            fuid = twitch_map.get(status.platform_username, "")
-            status.fluxer_user_id = fuid
-
-        # --- YouTube (every N cycles) ---
-        youtube_live: list[StreamStatus] = []
-        yt_multiplier = self._config.get_youtube_poll_multiplier()
+        # --- Twitch (every cycle) + YouTube (every N cycles), concurrently ---
+        # Within each, cold-tier streams are only polled every few cycles
+        interval = self._config.snapshot.poll_interval
+        live_keys = {
+            key for key, s in self._state.get_previous_state().items() if s.is_live
+        }
+        twitch_usernames = self._due("twitch", list(twitch_map), live_keys, interval)
+        youtube_ids: list[str] = []
+        yt_multiplier = self._config.snapshot.youtube_poll_multiplier
         if youtube_map and self._youtube_cycle >= yt_multiplier:
             self._youtube_cycle = 0
-            youtube_ids = list(youtube_map.keys())
-            youtube_live = await self._youtube.check_streams(youtube_ids)
-
-            for status in youtube_live:
-                fuid = youtube_map.get(status.platform_username, "")
-                status.fluxer_user_id = fuid
-
-        # --- Compare & Act ---
-        all_live = twitch_live + youtube_live
-        went_live, went_offline = self._state.compare(all_live, tracked_streams)
+            youtube_ids = self._due(
+                "youtube", list(youtube_map), live_keys, interval * yt_multiplier
+            )
+        # Scheduled and known-live YouTube broadcasts get a targeted check
+        # every base cycle, so YouTube offline detection matches Twitch
+        youtube_channels = list(youtube_map)
+        youtube_ids += [
+            cid for cid in (
+                self._youtube.scheduled_channels(youtube_channels)
+                + self._youtube.live_channels(youtube_channels)
+            )
+            if cid not in youtube_ids
+        ]
 
-        for status in went_live:
-            if status.fluxer_user_id:
-                await self._add_live_role(status)
-                await self._embed.create_announcement(status)
+        result = await self._fetch(twitch_usernames, youtube_ids)
+        self._schedule.mark_polled(result.checked_keys)
 
-        for status in went_offline:
-            if status.fluxer_user_id:
-                await self._remove_live_role(status)
-                await self._embed.delete_announcement(status)
+        # Map fluxer_user_id onto results
+        for status in result.live:
+            platform_map = twitch_map if status.platform == "twitch" else youtube_map
+            status.fluxer_user_id = platform_map.get(status.platform_username, "")
+        twitch_live = [s for s in result.live if s.platform == "twitch"]
 
-        # --- STILL_LIVE: Update embeds for streams that remain live ---
-        # The embed announcer handles its own 5-minute throttle internally
-        for status in twitch_live:
-            key = f"twitch:{status.platform_username}"
-            if key not in {f"twitch:{s.platform_username}" for s in went_live}:
-                # This stream was already live last cycle — update embed
-                if status.fluxer_user_id:
-                    await self._embed.update_announcement(status)
+        # --- Compare & Act ---
+        # Only keys answered this cycle can go offline — YouTube streams
+        # between their (less frequent) checks, and streams on an upstream
+        # that is down or timed out, keep their last-known state.
+        live_before = self._state.live_members()
+        with self._tracer.span("compare", stage=True):
+            went_live, went_offline = self._state.compare(
+                result.live, tracked_streams, checked_keys=result.checked_keys
+            )
 
-        # --- Channel title: toggle based on whether anyone is live ---
-        await self._sync_channel_title(anyone_live=len(twitch_live) > 0)
+        with self._tracer.span("actions", stage=True):
+            await self._apply_transitions(went_live, went_offline, live_before)
+
+            # --- STILL_LIVE: Update embeds for streams that remain live ---
+            # The embed announcer handles its own 5-minute throttle internally
+            went_live_keys = {s.key for s in went_live}
+            for status in twitch_live:
+                if status.key not in went_live_keys:
+                    # This stream was already live last cycle — update embed
+                    if status.fluxer_user_id:
+                        with self._tracer.span("embed_update", stream=status.key):
+                            await self._embed.update_announcement(status)
+
+            # --- Channel title: toggle based on whether anyone is live ---
+            anyone_live = any(
+                s.is_live and s.platform == "twitch"
+                for s in self._state.get_previous_state().values()
+            )
+            with self._tracer.span("channel_title"):
+                await self._sync_channel_title(anyone_live=anyone_live)
 
         if self._poll_count % 10 == 0:
-            live_count = len(all_live)
+            live_count = len(result.live)
+            tiers = self.tier_counts()
             self._log.debug(
-                f"🔍 Poll #{self._poll_count}: {live_count} live stream(s) across "
-                f"{len(twitch_usernames)} Twitch / {len(youtube_map)} YouTube"
+                "🔍 Poll #%d: %d live stream(s) across %d Twitch / %d YouTube "
+                "(%d hot / %d cold)",
+                self._poll_count, live_count, len(twitch_map), len(youtube_map),
+                tiers["hot"], tiers["cold"],
+                extra={"cycle": self._poll_count, "live": live_count},
             )
 
+    def tier_counts(self) -> dict[str, int]:
+        """Tracked streams per polling tier (live streams count as hot)."""
+        live_keys = {
+            key for key, s in self._state.get_previous_state().items() if s.is_live
+        }
+        return self._schedule.tier_counts(
+            list(roster_entries(self._config.get_tracked_streams())), live_keys
+        )
+
+    def _due(
+        self, platform: str, ids: list[str], live_keys: set[str], interval: float
+    ) -> list[str]:
+        """Filter platform IDs to those whose polling tier makes them due."""
+        by_key = {f"{platform}:{i}": i for i in ids}
+        return [by_key[key] for key in self._schedule.due(list(by_key), live_keys, interval)]
+
+    # -------------------------------------------------------------------------
+    # Warm Start
+    # -------------------------------------------------------------------------
+    def export_warm_state(self) -> dict:
+        """Channel title and cycle position for the warm-start snapshot."""
+        return {
+            "guild_id": self._config.snapshot.guild_id,
+            "live_role_id": self._config.snapshot.live_role_id,
+            "channel_name": self._current_channel_name,
+            "youtube_cycle": self._youtube_cycle,
+        }
+
+    def restore_warm_state(self, data: dict) -> None:
+        """Restore the snapshot if it was taken for the same guild and role."""
+        snapshot = self._config.snapshot
+        if data.get("guild_id") != snapshot.guild_id or data.get("live_role_id") != snapshot.live_role_id:
+            return
+        self._current_channel_name = data.get("channel_name")
+        self._youtube_cycle = int(data.get("youtube_cycle", 0))
+        self._warm_restored = True
+
+    # -------------------------------------------------------------------------
+    # Roster Hot-Reload
+    # -------------------------------------------------------------------------
+    async def apply_roster_diff(self, diff: RosterDiff) -> None:
+        """Apply an incremental tracked_streams.json change.
+
+        Removed streams lose their announcement, remapped live streams move
+        to the new member, and the Live role follows each affected member's
+        aggregate state. Added streams get an immediate targeted live check
+        instead of waiting for the next cycle. Unaffected streams are not
+        touched.
+        """
+        if diff.is_empty:
+            return
+
+        async with self._cycle_lock:
+            live_before = self._state.live_members()
+            removed_live, reassigned_live = self._state.apply_roster_diff(diff)
+
+            affected: list[StreamStatus] = list(removed_live)
+            for status in removed_live:
+                await self._embed.delete_announcement(status)
+
+            for status, old_fuid in reassigned_live:
+                if old_fuid:
+                    affected.append(StreamStatus(
+                        fluxer_user_id=old_fuid,
+                        display_name=status.display_name,
+                        platform=status.platform,
+                        platform_username=status.platform_username,
+                    ))
+                affected.append(status)
+                self._embed.reassign_announcement(status.key, status.fluxer_user_id)
+
+            await self._sync_member_roles(live_before, affected)
+
+            if diff.removed:
+                self._schedule.forget(set(roster_entries(self._config.get_tracked_streams())))
+            if any(entry.platform == "twitch" for entry in diff.removed):
+                twitch_map, _ = self._build_mappings()
+                self._twitch.prune_identities(list(twitch_map))
+
+            if diff.added:
+                await self._check_added(diff)
+
+        self._log.info(
+            f"Roster change applied ({diff.summary()}) — "
+            f"{len(removed_live)} live stream(s) cleaned up, "
+            f"{len(reassigned_live)} reassigned"
+        )
+
+    async def _check_added(self, diff: RosterDiff) -> None:
+        """Run a targeted live check for newly tracked streams only."""
+        fuids = {entry.key: entry.fluxer_user_id for entry in diff.added}
+        twitch_names = [e.platform_username for e in diff.added if e.platform == "twitch"]
+        youtube_ids = [e.platform_username for e in diff.added if e.platform == "youtube"]
+
+        result = await self._fetch(twitch_names, youtube_ids)
+        for status in result.live:
+            status.fluxer_user_id = fuids.get(status.key, "")
+
+        live_before = self._state.live_members()
+        went_live, went_offline = self._state.compare(
+            result.live,
+            self._config.get_tracked_streams(),
+            checked_keys=result.checked_keys & set(fuids),
+        )
+        await self._apply_transitions(went_live, went_offline, live_before)
+        self._log.debug(
+            f"🔍 Targeted check for {len(fuids)} added stream(s): "
+            f"{len(went_live)} live"
+        )
+
     async def start(self) -> None:
         """Start the background polling loop."""
-        interval = self._config.get_poll_interval()
+        snapshot = self._config.snapshot
         self._running = True
         self._log.success(
-            f"Stream monitor started — polling every {interval}s "
-            f"(YouTube every {interval * self._config.get_youtube_poll_multiplier()}s)"
+            f"Stream monitor started — polling every {snapshot.poll_interval}s "
+            f"(YouTube every "
+            f"{snapshot.poll_interval * snapshot.youtube_poll_multiplier}s)"
         )
 
         while self._running:
             try:
                 await self.poll_once()
+                if self.time_to_first_poll is None:
+                    self.time_to_first_poll = time.monotonic() - self._created_at
+                    self._log.info(
+                        f"First poll completed {self.time_to_first_poll:.1f}s after startup "
+                        f"({'warm' if self._warm_restored else 'cold'} start)"
+                    )
             except Exception as e:
                 self._log.error(
                     f"❌ Poll cycle failed: {e}\n{traceback.format_exc()}"
                 )
-            await asyncio.sleep(interval)
+            # Re-read each cycle so a hot-reloaded interval takes effect
+            await asyncio.sleep(self._config.snapshot.poll_interval)
 
     def stop(self) -> None:
         """Signal the polling loop to stop."""
@@ -289,6 +618,11 @@ def create_stream_monitor(
     youtube_manager: YouTubeManager,
     state_manager: StreamStateManager,
     embed_announcer: EmbedAnnouncer,
+    resilience_manager: ResilienceManager,
+    schedule_manager: ScheduleManager,
+    trace_manager: TraceManager,
+    latency_manager: LatencyManager,
+    profile_manager: ProfileManager,
 ) -> StreamMonitor:
     """Factory function — MANDATORY. Never call StreamMonitor directly."""
     return StreamMonitor(
@@ -299,6 +633,11 @@ def create_stream_monitor(
         youtube_manager=youtube_manager,
         state_manager=state_manager,
         embed_announcer=embed_announcer,
+        resilience_manager=resilience_manager,
+        schedule_manager=schedule_manager,
+        trace_manager=trace_manager,
+        latency_manager=latency_manager,
+        profile_manager=profile_manager,
     )
 
 
@@ -15,8 +15,8 @@ Main entry point for puck-bot. Creates all managers via factory functions,
 registers the on_ready event, starts the background polling task and config
 watcher, and runs the Fluxer bot.
 ----------------------------------------------------------------------------
-FILE VERSION: v1.3.0
-LAST MODIFIED: 2026-03-04
+FILE VERSION: v1.20.1
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
@@ -24,6 +24,7 @@ Repository: https://github.com/the-alphabet-cartel/puck
 """
 
 import asyncio
+import signal
 import sys
 import traceback
 
@@ -32,12 +33,25 @@ import fluxer
 from src.managers.config_manager import create_config_manager
 from src.managers.logging_config_manager import create_logging_config_manager
 from src.managers.config_watcher import create_config_watcher
+from src.managers.capture_manager import create_capture_manager
+from src.managers.http_transport_manager import create_http_transport_manager
+from src.managers.metrics_manager import create_metrics_manager
+from src.managers.profile_manager import create_profile_manager
+from src.managers.trace_manager import create_trace_manager
+from src.managers.latency_manager import create_latency_manager
+from src.managers.loop_monitor_manager import create_loop_monitor_manager
+from src.managers.resilience_manager import create_resilience_manager
+from src.managers.twitch_identity_manager import create_twitch_identity_manager
 from src.managers.twitch_manager import create_twitch_manager
 from src.managers.youtube_manager import create_youtube_manager
+from src.managers.youtube_quota_manager import create_youtube_quota_manager
 from src.managers.stream_state_manager import create_stream_state_manager
+from src.managers.schedule_manager import create_schedule_manager
+from src.managers.warm_start_manager import create_warm_start_manager
 from src.handlers.stream_monitor import create_stream_monitor
 from src.handlers.embed_announcer import create_embed_announcer
 from src.handlers.admin_commands import create_admin_commands_handler
+from src.handlers.health_monitor import create_health_monitor
 
 
 def main() -> None:
@@ -55,6 +69,8 @@ def main() -> None:
         log_file=config.get("logging", "file"),
         console_enabled=config.get_bool("logging", "console", True),
         app_name="puck-bot",
+        repeat_window_seconds=config.snapshot.log_repeat_window_seconds,
+        debug_sample_every=config.snapshot.log_debug_sample_every,
     )
     log = logging_mgr.get_logger("main")
     log.info("Puck bot starting up...")
@@ -86,10 +102,30 @@ def main() -> None:
     # =========================================================================
     # Phase 4: Create managers via factory functions
     # =========================================================================
-    twitch_mgr = create_twitch_manager(config, logging_mgr)
-    youtube_mgr = create_youtube_manager(config, logging_mgr)
-    state_mgr = create_stream_state_manager(config, logging_mgr)
-    embed_announcer = create_embed_announcer(config, logging_mgr)
+    # One pooled transport shared by every manager that talks HTTP, wrapped
+    # in circuit breakers + retry/backoff. With capture on, every response
+    # is also recorded (sanitised) as a replay fixture.
+    metrics = create_metrics_manager(config, logging_mgr)
+    tracer = create_trace_manager(config, logging_mgr, metrics)
+    loop_monitor = create_loop_monitor_manager(config, logging_mgr, metrics)
+    profiler = create_profile_manager(config, logging_mgr)
+    capture = create_capture_manager(config, logging_mgr)
+    http_transport = create_http_transport_manager(
+        config, logging_mgr, capture_manager=capture
+    )
+    resilience = create_resilience_manager(
+        config, logging_mgr, http_transport, metrics, tracer
+    )
+    identity_mgr = create_twitch_identity_manager(config, logging_mgr)
+    twitch_mgr = create_twitch_manager(config, logging_mgr, resilience, identity_mgr)
+    youtube_quota = create_youtube_quota_manager(config, logging_mgr)
+    youtube_mgr = create_youtube_manager(
+        config, logging_mgr, resilience, youtube_quota, metrics, tracer
+    )
+    state_mgr = create_stream_state_manager(config, logging_mgr, metrics, tracer)
+    schedule_mgr = create_schedule_manager(config, logging_mgr)
+    latency_mgr = create_latency_manager(config, logging_mgr)
+    embed_announcer = create_embed_announcer(config, logging_mgr, resilience)
 
     # =========================================================================
     # Phase 5: Create bot and handlers
@@ -111,40 +147,133 @@ def main() -> None:
         youtube_manager=youtube_mgr,
         state_manager=state_mgr,
         embed_announcer=embed_announcer,
+        resilience_manager=resilience,
+        schedule_manager=schedule_mgr,
+        trace_manager=tracer,
+        latency_manager=latency_mgr,
+        profile_manager=profiler,
+    )
+
+    # Owns the polling task: restarts it if it dies or stops finishing
+    # cycles, and serves /healthz + /readyz for Docker HEALTHCHECK
+    health = create_health_monitor(
+        bot=bot,
+        config_manager=config,
+        logging_manager=logging_mgr,
+        stream_monitor=monitor,
+        resilience_manager=resilience,
+        metrics_manager=metrics,
+    )
+
+    # =========================================================================
+    # Phase 5a: Warm start — reuse token, quota ledger and guild snapshot
+    # =========================================================================
+    warm_start = create_warm_start_manager(config, logging_mgr)
+    warm_start.register("twitch", twitch_mgr.export_warm_state, twitch_mgr.restore_warm_state)
+    warm_start.register("youtube", youtube_mgr.export_warm_state, youtube_mgr.restore_warm_state)
+    warm_start.register("monitor", monitor.export_warm_state, monitor.restore_warm_state)
+    warm_start.restore()
+
+    # =========================================================================
+    # Phase 5b: Metrics — gauges are read from the managers at scrape time
+    # =========================================================================
+    metrics.register_gauge(
+        "puck_live_streams", "Tracked streams currently live, by platform",
+        lambda: [
+            ({"platform": platform}, sum(
+                1 for s in state_mgr.get_previous_state().values()
+                if s.is_live and s.platform == platform
+            ))
+            for platform in ("twitch", "youtube")
+        ],
+    )
+    metrics.register_gauge(
+        "puck_live_members", "Members live on at least one platform",
+        lambda: len(state_mgr.live_members()),
+    )
+    metrics.register_gauge(
+        "puck_youtube_quota_used_units", "YouTube Data API units used today, per key",
+        lambda: [({"key": l["fingerprint"]}, l["used"]) for l in youtube_quota.ledgers()],
+    )
+    metrics.register_gauge(
+        "puck_youtube_quota_remaining_units", "YouTube Data API units left today, per key",
+        lambda: [({"key": l["fingerprint"]}, l["remaining"]) for l in youtube_quota.ledgers()],
+    )
+    metrics.register_gauge(
+        "puck_helix_ratelimit_remaining", "Points left in the Helix rate-limit bucket",
+        lambda: twitch_mgr.rate_limit_headroom()["remaining"],
+    )
+    metrics.register_gauge(
+        "puck_helix_queue_depth", "Helix requests waiting on rate-limit pacing",
+        lambda: twitch_mgr.rate_limit_headroom()["waiting"],
+    )
+    metrics.register_gauge(
+        "puck_circuit_open", "1 while an upstream's circuit breaker is open",
+        lambda: [
+            ({"upstream": name}, 1 if b["state"] == "open" else 0)
+            for name, b in resilience.breaker_states().items()
+        ],
+    )
+    metrics.register_gauge(
+        "puck_schedule_tier_streams", "Tracked streams per adaptive polling tier",
+        lambda: [({"tier": tier}, n) for tier, n in monitor.tier_counts().items()],
+    )
+    metrics.register_gauge(
+        "puck_time_to_first_poll_seconds", "Seconds from startup to the first completed poll",
+        lambda: monitor.time_to_first_poll,
+    )
+    metrics.register_gauge(
+        "puck_golive_latency_seconds", "Go-live latency percentiles over the rolling window",
+        lambda: [
+            ({"segment": row["segment"], "platform": row["platform"], "quantile": q}, row[p])
+            for row in latency_mgr.summary()
+            for q, p in (("0.5", "p50"), ("0.9", "p90"), ("0.99", "p99"))
+        ],
+    )
+    metrics.register_gauge(
+        "puck_golive_slo_ratio", "Share of go-lives with the Live role inside the SLO target",
+        lambda: latency_mgr.slo()["ratio"],
     )
 
     admin_cmds = create_admin_commands_handler(
         bot=bot,
         config_manager=config,
         logging_manager=logging_mgr,
+        latency_manager=latency_mgr,
+        trace_manager=tracer,
+        loop_monitor=loop_monitor,
+        profile_manager=profiler,
     )
 
     # =========================================================================
-    # Phase 5b: Config watcher — hot-reload without container restart (Rule #13)
+    # Phase 5c: Config watcher — hot-reload without container restart (Rule #13)
     # =========================================================================
     config_watcher = create_config_watcher(config_dir="/app/src/config")
 
     async def _on_config_change(filename: str) -> None:
         """Callback fired by ConfigWatcher when a JSON file is modified."""
         if filename == "tracked_streams.json":
-            config.reload_streams()
+            diff = config.reload_streams()
             new_tracked = config.get_tracked_streams()
             tc = sum(1 for s in new_tracked if s.get("twitch_username"))
             yc = sum(1 for s in new_tracked if s.get("youtube_channel_id"))
             log.info(
                 f"Hot-reloaded tracked_streams.json — "
-                f"{len(new_tracked)} stream(s): {tc} Twitch, {yc} YouTube"
+                f"{len(new_tracked)} stream(s): {tc} Twitch, {yc} YouTube "
+                f"({diff.summary()})"
             )
+            # Incremental: only added/removed/changed streams are touched
+            await monitor.apply_roster_diff(diff)
 
         elif filename == "puck_config.json":
-            # Main config reload is partial — env/secrets still override.
-            # Values read per-request (like poll interval) pick up changes
-            # automatically. Values cached at startup need a restart.
-            log.warning(
-                f"{filename} changed — behavioral values read per-request "
-                f"will update automatically. Cached startup values (token, "
-                f"guild ID) require a container restart."
-            )
+            # Recompiles the validated snapshot — env/secrets still override,
+            # and an invalid edit is rejected whole. Values read from the
+            # snapshot (poll interval, role IDs, channel names) apply on the
+            # next cycle. Values cached at startup (token) need a restart.
+            if config.reload_config():
+                log.info(f"Hot-reloaded {filename}")
+            else:
+                log.warning(f"{filename} rejected — keeping previous config")
 
     config_watcher.on_change(_on_config_change)
 
@@ -158,10 +287,16 @@ def main() -> None:
             f"Guild: {guild_id} | Live Role: {live_role_id} | "
             f"Poll interval: {config.get_poll_interval()}s"
         )
-        # Start the background polling task
-        asyncio.create_task(_run_monitor())
+        # Keep the Twitch app token fresh off the hot path
+        await twitch_mgr.start()
+        # Start the background polling task (once — READY repeats on reconnect)
+        health.start_polling()
         # Start the config watcher
         await config_watcher.start()
+        # Periodically refresh the warm-start snapshot
+        await warm_start.start()
+        # Optional /metrics endpoint
+        await metrics.start()
 
     @bot.event
     async def on_message(message: fluxer.Message) -> None:
@@ -174,40 +309,49 @@ def main() -> None:
             return
 
         # Dedup guard — fluxer-py fires every event twice
-        if not hasattr(on_message, "_seen"):
-            on_message._seen = set()
-        msg_id = getattr(message, "id", None)
-        if msg_id and msg_id in on_message._seen:
+        if admin_cmds.is_duplicate(getattr(message, "id", None)):
             return
-        if msg_id:
-            on_message._seen.add(msg_id)
-            # Prevent unbounded growth — keep last 100 message IDs
-            if len(on_message._seen) > 100:
-                on_message._seen = set(list(on_message._seen)[-50:])
 
         await admin_cmds.handle(message)
 
-    async def _run_monitor() -> None:
-        """Wrapper to catch and log monitor startup errors."""
+    async def _run_bot() -> None:
+        """Run the bot and release every resource on the way out."""
+        # Docker stop sends SIGTERM — cancel the run so cleanup below executes
+        main_task = asyncio.current_task()
+        loop = asyncio.get_running_loop()
+        if main_task is not None:
+            loop.add_signal_handler(signal.SIGTERM, main_task.cancel)
+        # Watch for event-loop stalls from before the gateway connects
+        await loop_monitor.start()
+        # Health endpoint answers during the gateway connect, too
+        await health.start()
         try:
-            await monitor.start()
-        except Exception as e:
-            log.error(f"❌ Stream monitor crashed: {e}\n{traceback.format_exc()}")
+            await bot.start(token)
+        finally:
+            await loop_monitor.stop()
+            monitor.stop()
+            await health.stop()
+            twitch_mgr.stop()
+            await config_watcher.stop()
+            await warm_start.stop()
+            await metrics.stop()
+            await tracer.aclose()
+            await http_transport.aclose()
 
     # =========================================================================
     # Phase 7: Run (blocking)
     # =========================================================================
     log.info("Connecting to Fluxer gateway...")
     try:
-        bot.run(token)
-    except KeyboardInterrupt:
+        asyncio.run(_run_bot())
+    except (KeyboardInterrupt, asyncio.CancelledError):
         log.info("Received shutdown signal")
-        monitor.stop()
     except Exception as e:
         log.error(f"❌ Fatal error: {e}\n{traceback.format_exc()}")
         sys.exit(1)
     finally:
         log.info("Puck bot shut down")
+        logging_mgr.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,270 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+HTTP fixture capture for puck-bot. When enabled, the shared HTTP transport
+records every upstream response, sanitised, to a gzip-compressed JSON-lines
+archive in /app/data/fixtures. Credentials never reach the archive: API
+keys, client IDs/secrets and tokens are redacted from URLs and bodies, and
+only rate-limit and content-type headers are kept. The archive is replayed
+offline by benchmarks/replay.py.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Iterator
+
+import httpx
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+
+CAPTURE_FILE = "/app/data/fixtures/http_capture.jsonl.gz"
+FORMAT_VERSION = 1
+FLUSH_RECORDS = 50  # Records buffered before a background write
+
+REDACTED = "***"
+SECRET_PARAMS = {"key", "client_id", "client_secret", "access_token", "refresh_token"}
+SECRET_FIELDS = {"access_token", "refresh_token", "client_secret", "client_id", "token"}
+KEPT_HEADERS = {
+    "content-type",
+    "ratelimit-limit",
+    "ratelimit-remaining",
+    "ratelimit-reset",
+    "retry-after",
+}
+
+
+# ---------------------------------------------------------------------------
+# Sanitising + Archive Format
+# ---------------------------------------------------------------------------
+def sanitize_url(url: httpx.URL) -> str:
+    """URL with credential query parameters redacted, parameters in order."""
+    params = [
+        (k, REDACTED if k.lower() in SECRET_PARAMS else v)
+        for k, v in url.params.multi_items()
+    ]
+    return str(url.copy_with(params=params))
+
+
+def _redact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            k: REDACTED if k.lower() in SECRET_FIELDS else _redact(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(v) for v in value]
+    return value
+
+
+def _body_fields(content: bytes, content_type: str) -> dict[str, str]:
+    """Archive fields for a response body: JSON redacted, text as-is, else base64."""
+    if "json" in content_type:
+        try:
+            return {"body": json.dumps(_redact(json.loads(content)), separators=(",", ":"))}
+        except ValueError:
+            pass
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(content).decode("ascii")}
+
+
+def record_body(record: dict[str, Any]) -> bytes:
+    """Response body bytes of an archive record."""
+    if "body_b64" in record:
+        return base64.b64decode(record["body_b64"])
+    return record.get("body", "").encode("utf-8")
+
+
+def read_fixtures(path: str) -> Iterator[dict[str, Any]]:
+    """Yield archive records in capture order. Skips truncated/corrupt lines."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("v") == FORMAT_VERSION:
+                    yield record
+        except (EOFError, gzip.BadGzipFile, zlib.error):
+            return  # Final member cut short or corrupt — keep what was read
+
+
+class _CapturingTransport(httpx.AsyncBaseTransport):
+    """Wraps an upstream's transport and hands each response to the recorder."""
+
+    def __init__(
+        self, inner: httpx.AsyncBaseTransport, upstream: str, capture: "CaptureManager"
+    ) -> None:
+        self._inner = inner
+        self._upstream = upstream
+        self._capture = capture
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self._inner.handle_async_request(request)
+        if not self._capture.active:
+            return response
+        # Read (and decode) the body here so it can be recorded, then hand
+        # the client an equivalent, already-buffered response
+        content = await response.aread()
+        elapsed = time.perf_counter() - started
+        self._capture.record(self._upstream, request, response, content, elapsed)
+        headers = [
+            (k, v) for k, v in response.headers.multi_items()
+            if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=content,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class CaptureManager:
+    """Records sanitised upstream responses to a compressed fixture archive."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        capture_file: str = CAPTURE_FILE,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("capture_manager")
+        self._capture_file = Path(capture_file)
+        snapshot = config_manager.snapshot
+        self._enabled = snapshot.capture_enabled
+        self._max_bytes = snapshot.capture_max_mb * 1024 * 1024
+        self._buffer: list[str] = []
+        self._tasks: set[asyncio.Task] = set()
+        # One writer at a time — concurrent appends interleave gzip members
+        self._write_lock = asyncio.Lock()
+        self._full = False
+        self.recorded = 0
+        if self._enabled:
+            self._log.warning(
+                f"⚠️ HTTP capture enabled — recording sanitised responses to {self._capture_file}"
+            )
+
+    @property
+    def active(self) -> bool:
+        return self._enabled and not self._full
+
+    def wrap(self, upstream: str, transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+        """Return a recording transport for an upstream, or the transport unchanged."""
+        if not self._enabled:
+            return transport
+        return _CapturingTransport(transport, upstream, self)
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+    def record(
+        self,
+        upstream: str,
+        request: httpx.Request,
+        response: httpx.Response,
+        content: bytes,
+        elapsed: float,
+    ) -> None:
+        headers = {
+            k.lower(): v for k, v in response.headers.items() if k.lower() in KEPT_HEADERS
+        }
+        record = {
+            "v": FORMAT_VERSION,
+            "at": round(time.time(), 3),
+            "upstream": upstream,
+            "method": request.method,
+            "url": sanitize_url(request.url),
+            "status": response.status_code,
+            "headers": headers,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            **_body_fields(content, headers.get("content-type", "")),
+        }
+        self._buffer.append(json.dumps(record, separators=(",", ":")))
+        self.recorded += 1
+        if len(self._buffer) >= FLUSH_RECORDS:
+            task = asyncio.create_task(self.flush())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        """Compress and append buffered records off the event loop."""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        async with self._write_lock:
+            await asyncio.to_thread(self._write, batch)
+
+    def _write(self, batch: list[str]) -> None:
+        try:
+            self._capture_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self._capture_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            with os.fdopen(fd, "ab") as raw, gzip.GzipFile(fileobj=raw, mode="ab", compresslevel=6) as f:
+                f.write(("\n".join(batch) + "\n").encode("utf-8"))
+            if self._capture_file.stat().st_size >= self._max_bytes:
+                self._full = True
+                self._log.warning(
+                    f"⚠️ HTTP capture reached {self._config.snapshot.capture_max_mb} MB "
+                    f"— recording stopped ({self.recorded} responses)"
+                )
+        except OSError as e:
+            self._log.error(f"❌ Could not write HTTP capture: {e}")
+
+    async def aclose(self) -> None:
+        """Wait for pending writes and flush what is left."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.flush()
+
+
+def create_capture_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    capture_file: str = CAPTURE_FILE,
+) -> CaptureManager:
+    """Factory function — MANDATORY. Never call CaptureManager directly."""
+    return CaptureManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        capture_file=capture_file,
+    )
+
+
+__all__ = [
+    "CaptureManager",
+    "create_capture_manager",
+    "read_fixtures",
+    "record_body",
+    "sanitize_url",
+]
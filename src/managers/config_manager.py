@@ -12,23 +12,28 @@ MISSION - NEVER TO BE VIOLATED:
 
 ============================================================================
 ConfigManager for puck-bot. Loads the three-layer config stack: JSON
-defaults → .env overrides → Docker Secrets. Also loads the separate
+defaults → .env overrides → Docker Secrets, then compiles it into an
+immutable, validated ConfigSnapshot. Also loads the separate
 tracked_streams.json for stream-to-user mappings.
 ----------------------------------------------------------------------------
-FILE VERSION: v1.2.0
-LAST MODIFIED: 2026-03-02
+FILE VERSION: v1.16.1
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
 ============================================================================
 """
 
+import glob
 import json
 import logging
 import os
 from pathlib import Path
 from typing import Any, Optional
 
+from src.models.config_snapshot import ConfigSnapshot, SENSITIVE_FIELDS, SNAPSHOT_FIELDS
+from src.models.roster_diff import RosterDiff
+
 log = logging.getLogger("puck-bot.config_manager")
 
 
@@ -42,12 +47,18 @@ class ConfigManager:
     ) -> None:
         self._config: dict[str, Any] = {}
         self._streams: list[dict[str, Any]] = []
+        self._config_path = config_path
         self._streams_path = streams_path
         self._load_json(config_path)
         self._load_streams(streams_path)
         self._apply_env_overrides()
         self._apply_secret_overrides()
 
+        snapshot, errors = self._compile_snapshot()
+        for error in errors:
+            log.warning(f"⚠️ Invalid config {error} — using default")
+        self._snapshot: ConfigSnapshot = snapshot
+
     # -------------------------------------------------------------------------
     # Layer 1: JSON defaults
     # -------------------------------------------------------------------------
@@ -89,12 +100,27 @@ class ConfigManager:
             "LOG_FORMAT": ("logging", "format"),
             "PUCK_LOG_FILE": ("logging", "file"),
             "LOG_CONSOLE": ("logging", "console"),
+            "PUCK_LOG_REPEAT_WINDOW": ("logging", "repeat_window_seconds"),
+            "PUCK_LOG_DEBUG_SAMPLE": ("logging", "debug_sample_every"),
             "COMMAND_PREFIX": ("bot", "command_prefix"),
             "PUCK_GUILD_ID": ("fluxer", "guild_id"),
             "PUCK_LIVE_ROLE_ID": ("fluxer", "live_role_id"),
             "PUCK_ANNOUNCE_CHANNEL_ID": ("fluxer", "announcement_channel_id"),
             "PUCK_POLL_INTERVAL": ("polling", "interval_seconds"),
+            "PUCK_OFFLINE_GRACE_MISSES": ("polling", "offline_grace_misses"),
             "PUCK_YOUTUBE_POLL_MULTIPLIER": ("youtube", "poll_multiplier"),
+            "PUCK_HTTP2": ("http", "http2"),
+            "PUCK_CYCLE_DEADLINE": ("resilience", "cycle_deadline_seconds"),
+            "PUCK_WARM_START": ("warm_start", "enabled"),
+            "PUCK_ADAPTIVE_POLLING": ("schedule", "enabled"),
+            "PUCK_METRICS": ("metrics", "enabled"),
+            "PUCK_METRICS_PORT": ("metrics", "port"),
+            "PUCK_GO_LIVE_SLO": ("slo", "target_seconds"),
+            "PUCK_TRACE_EXPORT": ("tracing", "export_enabled"),
+            "PUCK_HTTP_CAPTURE": ("capture", "enabled"),
+            "PUCK_LOOP_STALL_MS": ("loop_monitor", "stall_threshold_ms"),
+            "PUCK_HEALTH_PORT": ("health", "port"),
+            "PUCK_WATCHDOG_RESTART": ("health", "restart_after_seconds"),
         }
         for env_key, (section, key) in env_map.items():
             value = os.environ.get(env_key)
@@ -133,6 +159,17 @@ class ConfigManager:
             else:
                 log.warning(f"⚠️ Secret not found for {env_key} at {secret_path}")
 
+        # Additional YouTube API keys (separate projects) for the key pool
+        extra_files = os.environ.get("YOUTUBE_API_KEY_FILES")
+        if extra_files:
+            paths = [p.strip() for p in extra_files.split(",") if p.strip()]
+        else:
+            paths = sorted(glob.glob("/run/secrets/youtube_api_key_*"))
+        extra_keys = [key for path in paths if (key := self._read_secret_file(path))]
+        if extra_keys:
+            self._config.setdefault("youtube", {})["extra_api_keys"] = extra_keys
+            log.debug(f"🔍 Loaded {len(extra_keys)} additional YouTube API key(s)")
+
     def _read_secret_file(self, path: str) -> Optional[str]:
         secret_path = Path(path)
         if not secret_path.exists():
@@ -143,6 +180,118 @@ class ConfigManager:
             log.error(f"❌ Could not read secret {path}: {e}")
             return None
 
+    # -------------------------------------------------------------------------
+    # Snapshot compilation + validation
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _coerce(value: Any, kind: type, rules: dict[str, Any]) -> Any:
+        """Coerce a raw value to kind and enforce validation rules.
+
+        Raises ValueError with a human-readable reason on failure.
+        """
+        if kind is bool:
+            if isinstance(value, bool):
+                return value
+            text = str(value).strip().lower()
+            if text in ("true", "1", "yes", "on"):
+                return True
+            if text in ("false", "0", "no", "off"):
+                return False
+            raise ValueError(f"expected boolean, got {value!r}")
+
+        if kind is int:
+            if isinstance(value, bool):
+                raise ValueError(f"expected integer, got {value!r}")
+            try:
+                coerced: Any = int(str(value).strip())
+            except (TypeError, ValueError):
+                raise ValueError(f"expected integer, got {value!r}") from None
+        elif kind is float:
+            if isinstance(value, bool):
+                raise ValueError(f"expected number, got {value!r}")
+            try:
+                coerced = float(str(value).strip())
+            except (TypeError, ValueError):
+                raise ValueError(f"expected number, got {value!r}") from None
+        else:
+            coerced = "" if value is None else str(value)
+
+        bounds = rules.get("range")
+        if bounds and not bounds[0] <= coerced <= bounds[1]:
+            raise ValueError(
+                f"{coerced!r} outside allowed range {bounds[0]}–{bounds[1]}"
+            )
+        return coerced
+
+    def _compile_snapshot(self) -> tuple[ConfigSnapshot, list[str]]:
+        """Compile the merged config into a validated ConfigSnapshot.
+
+        Invalid values fall back to the section's "defaults" block (then the
+        hard-coded fallback) and are reported in the returned error list.
+        """
+        values: dict[str, Any] = {}
+        errors: list[str] = []
+
+        for attr, (section, key, kind, fallback) in SNAPSHOT_FIELDS.items():
+            section_cfg = self._config.get(section, {})
+            rules = section_cfg.get("validation", {}).get(key, {})
+            default = section_cfg.get("defaults", {}).get(key, fallback)
+            raw = section_cfg.get(key, default)
+
+            # Unresolved "${VAR}" placeholders mean "not set"
+            if isinstance(raw, str) and raw.startswith("${") and raw.endswith("}"):
+                raw = default
+
+            try:
+                values[attr] = self._coerce(raw, kind, rules)
+            except ValueError as e:
+                # Never echo a secret back into the logs, even a malformed one
+                reason = "invalid value (hidden)" if attr in SENSITIVE_FIELDS else e
+                errors.append(f"[{section}.{key}] {reason}")
+                try:
+                    values[attr] = self._coerce(default, kind, rules)
+                except ValueError:
+                    values[attr] = fallback
+
+            if rules.get("required") and values[attr] in ("", None):
+                log.warning(f"⚠️ [{section}.{key}] is required but not set")
+
+        return ConfigSnapshot(**values), errors
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The current immutable config snapshot. Cheap to read on hot paths."""
+        return self._snapshot
+
+    def reload_config(self) -> bool:
+        """Re-read puck_config.json (plus env and secrets) and swap the snapshot.
+
+        The reload is rejected as a whole if any value fails validation, so
+        a bad edit never reaches the running bot. Returns True if applied.
+        """
+        previous = self._config
+        self._config = {}
+        self._load_json(self._config_path)
+        self._apply_env_overrides()
+        self._apply_secret_overrides()
+
+        snapshot, errors = self._compile_snapshot()
+        if errors:
+            self._config = previous
+            for error in errors:
+                log.error(f"❌ Rejected config reload: {error}")
+            return False
+
+        changed = [
+            f"{name}=***" if name in SENSITIVE_FIELDS else f"{name}={getattr(snapshot, name)!r}"
+            for name in snapshot.changed_fields(self._snapshot)
+        ]
+        self._snapshot = snapshot
+        log.info(
+            f"ℹ️ Reloaded config — changed: {', '.join(changed) or 'nothing'}"
+        )
+        return True
+
     # -------------------------------------------------------------------------
     # Accessors
     # -------------------------------------------------------------------------
@@ -170,19 +319,25 @@ class ConfigManager:
 
     def get_token(self) -> str:
         """Get the Fluxer bot token."""
-        return self.get("bot", "token", "")
+        return self._snapshot.token
 
     def get_twitch_client_id(self) -> str:
         """Get the Twitch application client ID."""
-        return self.get("twitch", "client_id", "")
+        return self._snapshot.twitch_client_id
 
     def get_twitch_client_secret(self) -> str:
         """Get the Twitch application client secret."""
-        return self.get("twitch", "client_secret", "")
+        return self._snapshot.twitch_client_secret
 
     def get_youtube_api_key(self) -> str:
         """Get the YouTube Data API v3 key."""
-        return self.get("youtube", "api_key", "")
+        return self._snapshot.youtube_api_key
+
+    def get_youtube_api_keys(self) -> list[str]:
+        """Get every YouTube Data API v3 key (primary first, de-duplicated)."""
+        keys = [self._snapshot.youtube_api_key]
+        keys += self.get("youtube", "extra_api_keys", []) or []
+        return [k for k in dict.fromkeys(keys) if k]
 
     def get_tracked_streams(self) -> list[dict[str, Any]]:
         """Get the list of tracked stream mappings."""
@@ -190,37 +345,46 @@ class ConfigManager:
 
     def get_guild_id(self) -> str:
         """Get the Fluxer guild ID."""
-        return str(self.get("fluxer", "guild_id", ""))
+        return self._snapshot.guild_id
 
     def get_live_role_id(self) -> str:
         """Get the Live role ID for Fluxer."""
-        return str(self.get("fluxer", "live_role_id", ""))
+        return self._snapshot.live_role_id
 
     def get_poll_interval(self) -> int:
-        """Get polling interval in seconds (default 90)."""
-        return self.get_int("polling", "interval_seconds", 90)
+        """Get polling interval in seconds (default 90, range 30–300)."""
+        return self._snapshot.poll_interval
 
     def get_youtube_poll_multiplier(self) -> int:
-        """Get YouTube poll multiplier (default 3)."""
-        return self.get_int("youtube", "poll_multiplier", 3)
+        """Get YouTube poll multiplier (default 3, range 1–10)."""
+        return self._snapshot.youtube_poll_multiplier
 
     def get_announcement_channel_id(self) -> str:
-        """Get the announcement channel ID (future use)."""
-        return str(self.get("fluxer", "announcement_channel_id", ""))
+        """Get the announcement channel ID."""
+        return self._snapshot.announcement_channel_id
 
     def get_channel_name_live(self) -> str:
         """Get the channel name to use when someone is streaming."""
-        return str(self.get("fluxer", "channel_name_live", "🟢 Live Now"))
+        return self._snapshot.channel_name_live
 
     def get_channel_name_idle(self) -> str:
         """Get the channel name to use when nobody is streaming."""
-        return str(self.get("fluxer", "channel_name_idle", "Live Now"))
+        return self._snapshot.channel_name_idle
+
+    def reload_streams(self) -> RosterDiff:
+        """Re-read tracked_streams.json from disk. Used by ConfigWatcher hot-reload.
 
-    def reload_streams(self) -> list[dict[str, Any]]:
-        """Re-read tracked_streams.json from disk. Used by ConfigWatcher hot-reload."""
+        Returns the RosterDiff between the previous and the reloaded roster
+        so callers can act on added/removed/changed streams only.
+        """
+        previous = self._streams
         self._load_streams(self._streams_path)
-        log.info(f"ℹ️ Reloaded tracked streams: {len(self._streams)} stream(s)")
-        return self._streams
+        diff = RosterDiff.between(previous, self._streams)
+        log.info(
+            f"ℹ️ Reloaded tracked streams: {len(self._streams)} stream(s) "
+            f"({diff.summary()})"
+        )
+        return diff
 
 
 def create_config_manager(
@@ -13,10 +13,12 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Config watcher for puck-bot. Monitors the config directory for file
 changes and triggers reload callbacks without restarting the container.
-Uses polling via os.stat (no external dependencies required). Rule #13.
+Uses Linux inotify (via ctypes, no external dependencies) for event-driven
+reloads, and falls back to os.stat polling where inotify is unavailable.
+Rule #13.
 ----------------------------------------------------------------------------
-FILE VERSION: v1.0.0
-LAST MODIFIED: 2026-03-02
+FILE VERSION: v1.1.0
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
@@ -26,38 +28,115 @@ Repository: https://github.com/the-alphabet-cartel/puck
 from __future__ import annotations
 
 import asyncio
+import ctypes
+import ctypes.util
+import hashlib
+import json
 import logging
 import os
+import struct
 from pathlib import Path
-from typing import Any, Callable, Coroutine
+from typing import Any, Callable, Coroutine, Optional
 
 log = logging.getLogger("puck-bot.config_watcher")
 
+# inotify event masks (see inotify(7))
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_IGNORED = 0x00008000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_DELETE_SELF | _IN_MOVE_SELF
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+
+class _Inotify:
+    """Minimal ctypes wrapper around the Linux inotify API."""
+
+    def __init__(self, directory: Path) -> None:
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify not supported by this libc")
+
+        self.fd: int = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+
+        wd = libc.inotify_add_watch(
+            self.fd, os.fsencode(str(directory)), _WATCH_MASK
+        )
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed: {os.strerror(err)}")
+
+    def read_events(self) -> list[tuple[int, str]]:
+        """Drain pending events. Returns (mask, filename) pairs."""
+        events: list[tuple[int, str]] = []
+        while True:
+            try:
+                buf = os.read(self.fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                _wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                raw_name = buf[offset : offset + length]
+                offset += length
+                name = os.fsdecode(raw_name.rstrip(b"\0"))
+                events.append((mask, name))
+        return events
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
 
 class ConfigWatcher:
-    """Polls config files for changes and fires async callbacks on modification.
+    """Watches config files for changes and fires async callbacks on modification.
 
-    Watches all *.json files in a directory. When a file's mtime changes,
-    the registered callback is invoked with the filename that changed.
-    Designed to run as a background asyncio task.
+    Watches all *.json files in a directory. On Linux, inotify close-write
+    and rename events are debounced per file; otherwise the directory is
+    polled by mtime. Either way, a callback only fires when the file's
+    content hash actually changes and the file parses as JSON, so
+    half-written saves and touch-only updates are ignored. The registered
+    callback is invoked with the filename that changed. Designed to run as
+    a background asyncio task.
     """
 
     def __init__(
         self,
         config_dir: str = "/app/src/config",
         poll_interval: float = 5.0,
+        debounce_seconds: float = 0.25,
+        use_inotify: bool = True,
     ) -> None:
         self._config_dir = Path(config_dir)
         self._poll_interval = poll_interval
+        self._debounce_seconds = debounce_seconds
+        self._use_inotify = use_inotify
         self._running = False
         self._mtimes: dict[str, float] = {}
+        self._hashes: dict[str, str] = {}
         self._callbacks: list[Callable[[str], Coroutine[Any, Any, None]]] = []
+        self._inotify: Optional[_Inotify] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._pending: dict[str, asyncio.TimerHandle] = {}
+        self._fire_tasks: set[asyncio.Task] = set()
 
-        # Snapshot initial mtimes so we don't fire on startup
-        self._snapshot_mtimes()
+        # Snapshot initial state so we don't fire on startup
+        self._snapshot()
 
-    def _snapshot_mtimes(self) -> None:
-        """Record current mtime for all JSON files in the config directory."""
+    def _snapshot(self) -> None:
+        """Record current mtime and content hash for all JSON files."""
         if not self._config_dir.exists():
             log.warning(f"Config directory not found: {self._config_dir}")
             return
@@ -65,7 +144,24 @@ class ConfigWatcher:
             try:
                 self._mtimes[str(filepath)] = os.stat(filepath).st_mtime
             except OSError:
-                pass
+                continue
+            digest = self._hash_file(filepath)
+            if digest is not None:
+                self._hashes[filepath.name] = digest
+
+    @staticmethod
+    def _hash_file(filepath: Path) -> Optional[str]:
+        try:
+            return hashlib.sha256(filepath.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    @property
+    def mode(self) -> str:
+        """Return the active watch mode: "inotify", "polling" or "stopped"."""
+        if not self._running:
+            return "stopped"
+        return "inotify" if self._inotify is not None else "polling"
 
     def on_change(
         self, callback: Callable[[str], Coroutine[Any, Any, None]]
@@ -77,21 +173,102 @@ class ConfigWatcher:
         self._callbacks.append(callback)
 
     async def start(self) -> None:
-        """Start the polling loop as a background task."""
+        """Start watching — inotify if available, polling otherwise."""
         if self._running:
             return
         self._running = True
-        log.info(
-            f"Config watcher started — polling {self._config_dir} "
-            f"every {self._poll_interval}s"
-        )
-        asyncio.create_task(self._poll_loop())
+
+        if self._use_inotify and self._start_inotify():
+            log.info(f"Config watcher started — inotify on {self._config_dir}")
+            return
+
+        self._start_polling()
 
     async def stop(self) -> None:
-        """Stop the polling loop."""
+        """Stop watching and release the inotify descriptor."""
         self._running = False
+        self._stop_inotify()
+        for handle in self._pending.values():
+            handle.cancel()
+        self._pending.clear()
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
         log.info("Config watcher stopped")
 
+    # -------------------------------------------------------------------------
+    # inotify mode
+    # -------------------------------------------------------------------------
+    def _start_inotify(self) -> bool:
+        if not self._config_dir.exists():
+            return False
+        try:
+            self._inotify = _Inotify(self._config_dir)
+            asyncio.get_running_loop().add_reader(
+                self._inotify.fd, self._on_inotify_readable
+            )
+            return True
+        except (OSError, AttributeError, NotImplementedError) as e:
+            log.info(f"inotify unavailable ({e}) — falling back to polling")
+            self._stop_inotify()
+            return False
+
+    def _stop_inotify(self) -> None:
+        if self._inotify is None:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(self._inotify.fd)
+        except (RuntimeError, ValueError):
+            pass
+        self._inotify.close()
+        self._inotify = None
+
+    def _on_inotify_readable(self) -> None:
+        if self._inotify is None:
+            return
+        try:
+            events = self._inotify.read_events()
+        except OSError as e:
+            log.error(f"Config watcher inotify read failed: {e}")
+            events = []
+
+        for mask, name in events:
+            if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED):
+                log.warning(
+                    "Config directory watch lost — falling back to polling"
+                )
+                self._stop_inotify()
+                self._start_polling()
+                return
+            if name.endswith(".json") and mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                self._debounce(name)
+
+    def _debounce(self, filename: str) -> None:
+        """Coalesce bursts of events for one file into a single check."""
+        loop = asyncio.get_running_loop()
+        previous = self._pending.pop(filename, None)
+        if previous is not None:
+            previous.cancel()
+        self._pending[filename] = loop.call_later(
+            self._debounce_seconds, self._spawn_fire, filename
+        )
+
+    def _spawn_fire(self, filename: str) -> None:
+        self._pending.pop(filename, None)
+        task = asyncio.create_task(self._fire_if_changed(filename))
+        self._fire_tasks.add(task)
+        task.add_done_callback(self._fire_tasks.discard)
+
+    # -------------------------------------------------------------------------
+    # Polling mode (fallback)
+    # -------------------------------------------------------------------------
+    def _start_polling(self) -> None:
+        log.info(
+            f"Config watcher started — polling {self._config_dir} "
+            f"every {self._poll_interval}s"
+        )
+        self._poll_task = asyncio.create_task(self._poll_loop())
+
     async def _poll_loop(self) -> None:
         """Main polling loop — checks mtimes and fires callbacks on changes."""
         while self._running:
@@ -102,7 +279,7 @@ class ConfigWatcher:
                 log.error(f"Config watcher error: {e}")
 
     async def _check_for_changes(self) -> None:
-        """Compare current mtimes against snapshot and fire callbacks."""
+        """Compare current mtimes against snapshot and verify by content hash."""
         if not self._config_dir.exists():
             return
 
@@ -114,31 +291,57 @@ class ConfigWatcher:
                 continue
 
             previous_mtime = self._mtimes.get(str_path)
+            if previous_mtime is not None and current_mtime == previous_mtime:
+                continue
+            self._mtimes[str_path] = current_mtime
+            await self._fire_if_changed(filepath.name)
+
+    # -------------------------------------------------------------------------
+    # Change dispatch
+    # -------------------------------------------------------------------------
+    async def _fire_if_changed(self, filename: str) -> None:
+        """Fire callbacks if the file's content really changed and is valid JSON."""
+        filepath = self._config_dir / filename
+        try:
+            content = filepath.read_bytes()
+        except OSError:
+            return
 
-            # New file or modified file
-            if previous_mtime is None or current_mtime != previous_mtime:
-                self._mtimes[str_path] = current_mtime
+        digest = hashlib.sha256(content).hexdigest()
+        if self._hashes.get(filename) == digest:
+            log.debug(f"Config file {filename} touched but content unchanged")
+            return
 
-                # Skip the initial snapshot (previous_mtime is None on first run)
-                if previous_mtime is None:
-                    continue
+        try:
+            json.loads(content)
+        except ValueError as e:
+            # Leave the old hash in place so the next complete save fires
+            log.warning(f"Config file {filename} is not valid JSON yet: {e}")
+            return
 
-                filename = filepath.name
-                log.info(f"Config file changed: {filename}")
+        self._hashes[filename] = digest
+        log.info(f"Config file changed: {filename}")
 
-                for callback in self._callbacks:
-                    try:
-                        await callback(filename)
-                    except Exception as e:
-                        log.error(f"Callback error for {filename}: {e}")
+        for callback in self._callbacks:
+            try:
+                await callback(filename)
+            except Exception as e:
+                log.error(f"Callback error for {filename}: {e}")
 
 
 def create_config_watcher(
     config_dir: str = "/app/src/config",
     poll_interval: float = 5.0,
+    debounce_seconds: float = 0.25,
+    use_inotify: bool = True,
 ) -> ConfigWatcher:
     """Factory function — MANDATORY. Never call ConfigWatcher directly."""
-    return ConfigWatcher(config_dir=config_dir, poll_interval=poll_interval)
+    return ConfigWatcher(
+        config_dir=config_dir,
+        poll_interval=poll_interval,
+        debounce_seconds=debounce_seconds,
+        use_inotify=use_inotify,
+    )
 
 
 __all__ = ["ConfigWatcher", "create_config_watcher"]
@@ -0,0 +1,216 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Shared HTTP transport for puck-bot. Hands out one pooled httpx.AsyncClient
+per upstream (Twitch, YouTube, Fluxer) with tuned keepalive/connection
+limits, per-upstream timeouts, optional HTTP/2 and a shared DNS cache, and
+closes them all on shutdown. A transport can be injected in place of the
+real pools (benchmarks, fixture replay), and every transport can be wrapped
+by the capture manager to record responses as replay fixtures.
+----------------------------------------------------------------------------
+FILE VERSION: v1.2.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+import socket
+import time
+from typing import Any, Iterable, Optional
+
+import httpcore
+import httpx
+
+from src.managers.capture_manager import CaptureManager
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+
+# Upstream name -> base URL. Managers ask for clients by name.
+UPSTREAMS: dict[str, str] = {
+    "twitch": "https://api.twitch.tv",
+    "twitch_auth": "https://id.twitch.tv",
+    "youtube_rss": "https://www.youtube.com",
+    "youtube_api": "https://www.googleapis.com",
+    "fluxer": "https://api.fluxer.app",
+}
+DEFAULT_TIMEOUT_SECONDS = 15.0
+CONNECT_TIMEOUT_SECONDS = 5.0
+
+
+class _DNSCachingBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches getaddrinfo results for a fixed TTL.
+
+    TLS SNI and certificate checks still use the original hostname — httpcore
+    passes it to start_tls separately from the connect address.
+    """
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, ttl: float) -> None:
+        self._backend = backend
+        self._ttl = ttl
+        self._cache: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+    async def _resolve(self, host: str, port: int) -> list[str]:
+        key = (host, port)
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        self._cache[key] = (time.monotonic() + self._ttl, addresses)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self._resolve(host, port)
+        except OSError:
+            addresses = [host]  # Let the real backend raise a proper ConnectError
+
+        last_error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+        # Every cached address failed — resolve fresh next time
+        self._cache.pop((host, port), None)
+        assert last_error is not None
+        raise last_error
+
+    async def connect_unix_socket(self, *args: Any, **kwargs: Any) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(*args, **kwargs)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class HttpTransportManager:
+    """Owns every outbound HTTP connection pool in puck-bot."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        capture_manager: Optional[CaptureManager] = None,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("http_transport")
+        self._override = transport
+        self._capture = capture_manager
+        snapshot = config_manager.snapshot
+        self._http2 = snapshot.http2 and self._h2_available()
+        self._limits = httpx.Limits(
+            max_connections=snapshot.http_max_connections,
+            max_keepalive_connections=snapshot.http_max_keepalive_connections,
+            keepalive_expiry=snapshot.http_keepalive_expiry_seconds,
+        )
+        self._timeouts: dict[str, Any] = config_manager.get("http", "timeouts", {}) or {}
+        self._dns_ttl = snapshot.dns_cache_ttl_seconds
+        self._dns_backend: Optional[_DNSCachingBackend] = None
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def _h2_available(self) -> bool:
+        try:
+            import h2  # noqa: F401
+            return True
+        except ImportError:
+            self._log.warning("⚠️ HTTP/2 enabled but the 'h2' package is missing — using HTTP/1.1")
+            return False
+
+    def _timeout_for(self, upstream: str) -> httpx.Timeout:
+        try:
+            seconds = float(self._timeouts.get(upstream, DEFAULT_TIMEOUT_SECONDS))
+        except (TypeError, ValueError):
+            seconds = DEFAULT_TIMEOUT_SECONDS
+        return httpx.Timeout(seconds, connect=min(seconds, CONNECT_TIMEOUT_SECONDS))
+
+    def _build_transport(self) -> httpx.AsyncHTTPTransport:
+        transport = httpx.AsyncHTTPTransport(
+            http2=self._http2,
+            limits=self._limits,
+            retries=1,  # Retry connect failures once (never retries requests)
+        )
+        # httpx does not expose the network backend, so install the DNS cache
+        # on the underlying httpcore pool. Skipped when a proxy is in use.
+        pool = getattr(transport, "_pool", None)
+        if self._dns_ttl > 0 and isinstance(pool, httpcore.AsyncConnectionPool):
+            if self._dns_backend is None:
+                self._dns_backend = _DNSCachingBackend(pool._network_backend, self._dns_ttl)
+            pool._network_backend = self._dns_backend
+        return transport
+
+    def client(self, upstream: str) -> httpx.AsyncClient:
+        """Return the pooled client for an upstream, creating it on first use."""
+        http = self._clients.get(upstream)
+        if http is None or http.is_closed:
+            transport = self._override or self._build_transport()
+            if self._capture is not None:
+                transport = self._capture.wrap(upstream, transport)
+            http = httpx.AsyncClient(
+                transport=transport,
+                timeout=self._timeout_for(upstream),
+            )
+            self._clients[upstream] = http
+            self._log.debug(
+                f"🔍 Created pooled client for {upstream} "
+                f"(http2={self._http2}, timeout={http.timeout.read}s)"
+            )
+        return http
+
+    async def aclose(self) -> None:
+        """Close every pooled client. Safe to call more than once."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for http in clients:
+            if not http.is_closed:
+                await http.aclose()
+        if clients:
+            self._log.info(f"Closed {len(clients)} HTTP connection pool(s)")
+        if self._capture is not None:
+            await self._capture.aclose()
+
+
+def create_http_transport_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+    capture_manager: Optional[CaptureManager] = None,
+) -> HttpTransportManager:
+    """Factory function — MANDATORY. Never call HttpTransportManager directly."""
+    return HttpTransportManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        transport=transport,
+        capture_manager=capture_manager,
+    )
+
+
+__all__ = ["HttpTransportManager", "create_http_transport_manager", "UPSTREAMS"]
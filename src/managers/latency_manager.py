@@ -0,0 +1,199 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Go-live latency accounting for puck-bot. For every WENT LIVE transition it
+records how long the platform took to be noticed (stream start → detection)
+and how long Puck took to act (detection → Live role, detection → embed).
+Samples are kept in a rolling window per segment and platform, persisted
+to /app/data, and summarised against the configured go-live SLO.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import json
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Optional
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+from src.models.stream_status import StreamStatus
+from src.utils.stats import percentile
+
+LATENCY_FILE = "/app/data/latency.json"
+
+SEGMENT_DETECT = "detect"  # Platform start → Puck detection
+SEGMENT_ROLE = "role"      # Detection → Live role applied
+SEGMENT_EMBED = "embed"    # Detection → announcement posted
+SEGMENT_TOTAL = "total"    # Platform start → Live role applied (the SLO)
+SEGMENTS = (SEGMENT_DETECT, SEGMENT_ROLE, SEGMENT_EMBED, SEGMENT_TOTAL)
+
+# A start time older than this means Puck was down or the stream was
+# already live when first tracked — not a detection latency worth counting
+MAX_DETECT_SECONDS = 3600
+
+
+class LatencyManager:
+    """Rolling go-live latency samples and SLO attainment."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        latency_file: str = LATENCY_FILE,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("latency_manager")
+        self._latency_file = Path(latency_file)
+        self._window = config_manager.snapshot.slo_window_size
+        # "segment:platform" -> [(recorded_at, seconds)]
+        self._samples: dict[str, deque[tuple[float, float]]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load persisted samples. Handles missing/corrupt files gracefully."""
+        if not self._latency_file.exists():
+            return
+        try:
+            with open(self._latency_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for series, samples in data.get("samples", {}).items():
+                self._samples[series] = deque(
+                    ((float(at), float(sec)) for at, sec in samples), maxlen=self._window
+                )
+            self._log.debug(f"🔍 Loaded go-live latency history ({len(self._samples)} series)")
+        except (json.JSONDecodeError, OSError, TypeError, ValueError) as e:
+            self._log.warning(f"⚠️ Could not load latency history: {e} — starting fresh")
+            self._samples = {}
+
+    def persist(self) -> None:
+        """Write samples to disk if anything was recorded since the last write."""
+        if not self._dirty:
+            return
+        try:
+            self._latency_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "samples": {
+                    series: [[round(at, 1), round(sec, 3)] for at, sec in samples]
+                    for series, samples in self._samples.items()
+                }
+            }
+            with open(self._latency_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self._dirty = False
+        except OSError as e:
+            self._log.error(f"❌ Failed to persist latency history: {e}")
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+    def _record(self, segment: str, platform: str, seconds: float) -> None:
+        series = f"{segment}:{platform}"
+        samples = self._samples.get(series)
+        if samples is None:
+            samples = self._samples[series] = deque(maxlen=self._window)
+        samples.append((time.time(), max(0.0, seconds)))
+        self._dirty = True
+
+    @staticmethod
+    def _start_age(status: StreamStatus, at: float) -> Optional[float]:
+        """Seconds between the platform start and `at`, if known and plausible."""
+        if status.started_at is None:
+            return None
+        age = at - status.started_at.timestamp()
+        return age if age <= MAX_DETECT_SECONDS else None
+
+    def detected(self, status: StreamStatus) -> None:
+        """Record start → detection for a stream that just went live."""
+        age = self._start_age(status, status.last_checked.timestamp())
+        if age is not None:
+            self._record(SEGMENT_DETECT, status.platform, age)
+
+    def role_applied(self, status: StreamStatus, applied_at: float) -> None:
+        """Record detection → role, and start → role for the SLO."""
+        self._record(SEGMENT_ROLE, status.platform, applied_at - status.last_checked.timestamp())
+        age = self._start_age(status, applied_at)
+        if age is not None:
+            self._record(SEGMENT_TOTAL, status.platform, age)
+            target = self._config.snapshot.slo_target_seconds
+            if age > target:
+                self._log.info(
+                    f"ℹ️ Live role for {status.display_name} applied {age:.0f}s after "
+                    f"stream start (SLO {target}s)"
+                )
+
+    def embed_posted(self, status: StreamStatus, posted_at: float) -> None:
+        """Record detection → announcement posted."""
+        self._record(SEGMENT_EMBED, status.platform, posted_at - status.last_checked.timestamp())
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+    def summary(self) -> list[dict[str, Any]]:
+        """Percentiles per segment and platform over the rolling window."""
+        rows = []
+        for series, samples in sorted(self._samples.items()):
+            if not samples:
+                continue
+            segment, platform = series.split(":", 1)
+            ordered = sorted(sec for _, sec in samples)
+            rows.append({
+                "segment": segment,
+                "platform": platform,
+                "count": len(ordered),
+                "p50": percentile(ordered, 50),
+                "p90": percentile(ordered, 90),
+                "p99": percentile(ordered, 99),
+                "max": ordered[-1],
+            })
+        return rows
+
+    def slo(self) -> dict[str, Any]:
+        """Share of go-lives whose Live role landed within the target."""
+        target = self._config.snapshot.slo_target_seconds
+        totals = [
+            sec
+            for series, samples in self._samples.items()
+            if series.startswith(f"{SEGMENT_TOTAL}:")
+            for _, sec in samples
+        ]
+        within = sum(1 for sec in totals if sec <= target)
+        return {
+            "target_seconds": target,
+            "count": len(totals),
+            "within": within,
+            "ratio": within / len(totals) if totals else None,
+        }
+
+
+def create_latency_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    latency_file: str = LATENCY_FILE,
+) -> LatencyManager:
+    """Factory function — MANDATORY. Never call LatencyManager directly."""
+    return LatencyManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        latency_file=latency_file,
+    )
+
+
+__all__ = ["LatencyManager", "create_latency_manager", "SEGMENTS"]
@@ -12,19 +12,31 @@ MISSION - NEVER TO BE VIOLATED:
 
 ============================================================================
 LoggingConfigManager for puck-bot. Provides colorized, leveled console and
-file logging with a custom SUCCESS level (25). Rule #9 compliant.
+file logging with a custom SUCCESS level (25). Rule #9 compliant. Log calls
+only enqueue the record; a background listener thread formats it and does
+the console/file I/O, so logging never blocks the event loop. log_format
+"json" emits one structured JSON object per line, including extra= fields
+(platform, stream, cycle, duration_ms). Identical repeated messages are
+suppressed within a window, and per-stream DEBUG lines can be sampled.
 ----------------------------------------------------------------------------
-FILE VERSION: v1.1.0
-LAST MODIFIED: 2026-02-26
+FILE VERSION: v1.2.0
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
 ============================================================================
 """
 
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
-from typing import Optional
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
 SUCCESS_LEVEL = 25
 logging.addLevelName(SUCCESS_LEVEL, "SUCCESS")
@@ -35,6 +47,17 @@ NOISY_LIBRARIES = [
     "aiohttp", "aiohttp.access",
 ]
 
+PLAIN_FORMAT = "[%(asctime)s] %(levelname)-8s | %(name)-30s | %(message)s"
+PLAIN_DATEFMT = "%Y-%m-%d %H:%M:%S"
+REPEAT_KEYS_MAX = 1000  # Distinct messages tracked for repeat suppression
+
+# Attributes every LogRecord has — anything else came in through extra=
+_RECORD_ATTRS = set(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {
+    "message", "asctime", "taskName",
+}
+
+_listener: Optional[QueueListener] = None  # One per process; replaced on reconfigure
+
 
 class _ColorFormatter(logging.Formatter):
     """ANSI-colorized log formatter with emoji symbols (Charter Rule #9)."""
@@ -63,12 +86,97 @@ class _ColorFormatter(logging.Formatter):
         symbol = self.SYMBOLS.get(level, "")
         reset = self.COLORS["RESET"]
         timestamp = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
+        exc = f"\n{record.exc_text}" if record.exc_text else ""
         return (
             f"{color}[{timestamp}] {level:<8} | "
-            f"{record.name:<30} | {symbol} {record.getMessage()}{reset}"
+            f"{record.name:<30} | {symbol} {record.getMessage()}{exc}{reset}"
         )
 
 
+class _JsonFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message, extras."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(QueueHandler):
+    """Enqueues a copy with the message rendered and any traceback as text.
+
+    The copy keeps extra= attributes for the JSON formatter; args and
+    exc_info are dropped so nothing unpicklable or mutable crosses threads.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+
+class _RepeatFilter(logging.Filter):
+    """Drops identical messages repeated within the window.
+
+    The next occurrence after the window says how many were suppressed.
+    """
+
+    def __init__(self, window: float) -> None:
+        super().__init__()
+        self._window = window
+        self._seen: dict[tuple[str, int, str], list[float]] = {}  # key -> [first, suppressed]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        now = time.monotonic()
+        key = (record.name, record.levelno, record.getMessage())
+        seen = self._seen.get(key)
+        if seen is not None and now - seen[0] < self._window:
+            seen[1] += 1
+            return False
+        if seen is not None and seen[1]:
+            record.msg = f"{record.getMessage()} (repeated {int(seen[1])}× in {self._window:.0f}s)"
+            record.args = None
+            record.repeats = int(seen[1])
+        if len(self._seen) >= REPEAT_KEYS_MAX:
+            self._seen = {k: v for k, v in self._seen.items() if now - v[0] < self._window}
+        self._seen[key] = [now, 0]
+        return True
+
+
+class _DebugSampler(logging.Filter):
+    """Passes one in every N per-stream DEBUG records per call site and stream.
+
+    Only records logged with extra={"stream": ...} are sampled, so one-off
+    debug lines are never dropped.
+    """
+
+    def __init__(self, every: int) -> None:
+        super().__init__()
+        self._every = every
+        self._counts: dict[tuple[str, int, str], int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        stream = getattr(record, "stream", None)
+        if record.levelno != logging.DEBUG or stream is None:
+            return True
+        site = (record.pathname, record.lineno, str(stream))
+        count = self._counts.get(site, 0)
+        self._counts[site] = count + 1
+        return count % self._every == 0
+
+
 class LoggingConfigManager:
     """Manages logging configuration for puck-bot."""
 
@@ -79,40 +187,69 @@ class LoggingConfigManager:
         log_file: Optional[str] = None,
         console_enabled: bool = True,
         app_name: str = "puck-bot",
+        repeat_window_seconds: float = 0.0,
+        debug_sample_every: int = 1,
     ) -> None:
         self.app_name = app_name
         self.log_level = getattr(logging, log_level.upper(), logging.INFO)
         self.log_format = log_format
         self.log_file = log_file
         self.console_enabled = console_enabled
+        self.repeat_window_seconds = repeat_window_seconds
+        self.debug_sample_every = max(1, debug_sample_every)
         self._configure_root()
         self._silence_noisy_libraries()
 
     def _configure_root(self) -> None:
+        global _listener
+        if _listener is not None:
+            _listener.stop()  # Drain and retire the previous configuration
+            _listener = None
+
         root = logging.getLogger()
         root.setLevel(self.log_level)
         root.handlers.clear()
 
+        json_format = self.log_format == "json"
+        handlers: list[logging.Handler] = []
         if self.console_enabled:
             handler = logging.StreamHandler(sys.stdout)
             handler.setLevel(self.log_level)
-            if self.log_format == "human":
+            if json_format:
+                handler.setFormatter(_JsonFormatter())
+            elif self.log_format == "human":
                 handler.setFormatter(_ColorFormatter())
             else:
-                handler.setFormatter(logging.Formatter(
-                    "[%(asctime)s] %(levelname)-8s | %(name)-30s | %(message)s",
-                    datefmt="%Y-%m-%d %H:%M:%S",
-                ))
-            root.addHandler(handler)
+                handler.setFormatter(logging.Formatter(PLAIN_FORMAT, datefmt=PLAIN_DATEFMT))
+            handlers.append(handler)
 
         if self.log_file:
             file_handler = logging.FileHandler(self.log_file, encoding="utf-8")
             file_handler.setLevel(self.log_level)
-            file_handler.setFormatter(logging.Formatter(
-                "[%(asctime)s] %(levelname)-8s | %(name)-30s | %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            ))
-            root.addHandler(file_handler)
+            file_handler.setFormatter(
+                _JsonFormatter() if json_format
+                else logging.Formatter(PLAIN_FORMAT, datefmt=PLAIN_DATEFMT)
+            )
+            handlers.append(file_handler)
+
+        # Callers only enqueue; the listener thread formats and writes
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = _QueueHandler(log_queue)
+        queue_handler.setLevel(self.log_level)
+        if self.debug_sample_every > 1:
+            queue_handler.addFilter(_DebugSampler(self.debug_sample_every))
+        if self.repeat_window_seconds > 0:
+            queue_handler.addFilter(_RepeatFilter(self.repeat_window_seconds))
+        root.addHandler(queue_handler)
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+
+    def stop(self) -> None:
+        """Flush queued records and stop the listener thread. Safe to repeat."""
+        global _listener
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
 
     def _silence_noisy_libraries(self) -> None:
         for lib in NOISY_LIBRARIES:
@@ -133,6 +270,8 @@ def create_logging_config_manager(
     log_file: Optional[str] = None,
     console_enabled: bool = True,
     app_name: str = "puck-bot",
+    repeat_window_seconds: float = 0.0,
+    debug_sample_every: int = 1,
 ) -> LoggingConfigManager:
     """Factory function — MANDATORY. Never call LoggingConfigManager directly."""
     return LoggingConfigManager(
@@ -141,7 +280,16 @@ def create_logging_config_manager(
         log_file=log_file,
         console_enabled=console_enabled,
         app_name=app_name,
+        repeat_window_seconds=repeat_window_seconds,
+        debug_sample_every=debug_sample_every,
     )
 
 
+@atexit.register
+def _flush_on_exit() -> None:
+    """Write out anything still queued when the interpreter exits."""
+    if _listener is not None:
+        _listener.stop()
+
+
 __all__ = ["LoggingConfigManager", "create_logging_config_manager", "SUCCESS_LEVEL"]
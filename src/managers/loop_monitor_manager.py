@@ -0,0 +1,209 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Event-loop lag monitor for puck-bot. The gateway, the poll loop, the config
+watcher and file I/O all share one asyncio loop, so anything that blocks it
+delays heartbeats. A sampler task sleeps for a fixed interval and records
+how late it wakes as puck_event_loop_lag_seconds. A watchdog thread notices
+when the sampler has not woken past the stall threshold and captures the
+loop thread's stack while the blocking code is still running.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.2
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Optional
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+from src.managers.metrics_manager import MetricsManager
+from src.utils.stats import percentile
+
+LAG_SAMPLES = 1200          # Recent lag samples kept for summaries
+STALL_HISTORY = 10          # Recent stalls kept, with their stacks
+STACK_FRAMES = 12           # Innermost frames kept per stall
+STALL_LOG_COOLDOWN = 300    # Seconds before the same blocking site is logged again
+
+
+class LoopMonitorManager:
+    """Samples event-loop lag and captures the stack behind loop stalls."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        metrics_manager: MetricsManager,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("loop_monitor")
+        self._metrics = metrics_manager
+        self._lags: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._stalls: deque[dict[str, Any]] = deque(maxlen=STALL_HISTORY)
+        self._logged: dict[str, float] = {}  # Blocking site -> last logged
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id = 0
+        # Written by the sampler, read by the watchdog: monotonic time the
+        # sampler went to sleep, and how long it meant to sleep
+        self._slept_at = 0.0
+        self._sleep_for = 0.0
+        self._caught: Optional[dict[str, Any]] = None  # Stall seen for this sleep
+
+    # -------------------------------------------------------------------------
+    # Sampler (event loop)
+    # -------------------------------------------------------------------------
+    async def _sample(self) -> None:
+        while True:
+            snapshot = self._config.snapshot
+            interval = snapshot.loop_lag_interval_ms / 1000
+            self._caught = None
+            self._sleep_for = interval
+            self._slept_at = time.monotonic()
+            await asyncio.sleep(interval)
+            lag = max(0.0, time.monotonic() - self._slept_at - interval)
+            self._slept_at = 0.0
+            self._lags.append(lag)
+            self._metrics.observe("puck_event_loop_lag_seconds", lag)
+
+            caught = self._caught
+            if caught is not None:
+                caught["lag_seconds"] = round(lag, 3)
+                self._report(caught)
+            elif lag * 1000 >= snapshot.loop_stall_threshold_ms:
+                # Short enough to slip between watchdog checks — no stack
+                self._metrics.inc("puck_event_loop_stalls_total")
+                self._log.warning(f"⚠️ Event loop lagged {lag * 1000:.0f}ms (no stack captured)")
+
+    def _report(self, stall: dict[str, Any]) -> None:
+        """Count and log a captured stall, once per blocking site per cooldown."""
+        self._metrics.inc("puck_event_loop_stalls_total")
+        site = stall["site"]
+        now = time.monotonic()
+        if now - self._logged.get(site, -STALL_LOG_COOLDOWN) < STALL_LOG_COOLDOWN:
+            self._log.debug(f"🔍 Event loop blocked {stall['lag_seconds']:.3f}s at {site} (repeat)")
+            return
+        self._logged[site] = now
+        self._log.warning(
+            f"⚠️ Event loop blocked for {stall['lag_seconds']:.3f}s in task "
+            f"{stall['task']} at {site}\n" + "".join(stall["stack"])
+        )
+
+    # -------------------------------------------------------------------------
+    # Watchdog (thread)
+    # -------------------------------------------------------------------------
+    def _watch(self) -> None:
+        while not self._stopping.is_set():
+            threshold = self._config.snapshot.loop_stall_threshold_ms / 1000
+            self._stopping.wait(max(0.02, threshold / 4))
+            slept_at = self._slept_at
+            if not slept_at or self._caught is not None:
+                continue
+            overdue = time.monotonic() - slept_at - self._sleep_for
+            if overdue >= threshold:
+                stall = self._capture(overdue)
+                if self._slept_at == slept_at:  # Still the same stall
+                    self._caught = stall
+                    self._stalls.append(stall)
+
+    def _capture(self, overdue: float) -> dict[str, Any]:
+        """Snapshot the loop thread's stack and the task it is running."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.format_stack(frame)[-STACK_FRAMES:] if frame else []
+        site = "unknown"
+        if frame is not None:
+            site = f"{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+        task = asyncio.current_task(self._loop) if self._loop else None
+        return {
+            "at": time.time(),
+            "lag_seconds": round(overdue, 3),  # Updated when the loop wakes
+            "task": task.get_name() if task else "callback",
+            "site": site,
+            "stack": stack,
+        }
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def summary(self) -> dict[str, Any]:
+        """Lag percentiles over recent samples, plus the recent stalls."""
+        ordered = sorted(self._lags)
+        if not ordered:
+            return {"samples": 0, "p50": None, "p99": None, "max": None, "stalls": []}
+        return {
+            "samples": len(ordered),
+            "p50": percentile(ordered, 50),
+            "p99": percentile(ordered, 99),
+            "max": ordered[-1],
+            "stalls": list(self._stalls),
+        }
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+    async def start(self) -> None:
+        """Start the sampler and watchdog, if enabled."""
+        if not self._config.snapshot.loop_monitor_enabled:
+            return
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._loop_thread_id = threading.get_ident()
+            self._task = asyncio.create_task(self._sample(), name="loop_monitor")
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+            self._thread.start()
+        self._log.info(
+            f"Event-loop monitor started (sample every {self._config.snapshot.loop_lag_interval_ms}ms, "
+            f"stall at {self._config.snapshot.loop_stall_threshold_ms}ms)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the sampler and watchdog."""
+        self._stopping.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+
+def create_loop_monitor_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    metrics_manager: MetricsManager,
+) -> LoopMonitorManager:
+    """Factory function — MANDATORY. Never call LoopMonitorManager directly."""
+    return LoopMonitorManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        metrics_manager=metrics_manager,
+    )
+
+
+__all__ = ["LoopMonitorManager", "create_loop_monitor_manager"]
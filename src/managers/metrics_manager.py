@@ -0,0 +1,211 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Metrics registry for puck-bot. Counters and histograms are recorded in
+memory on the hot path (a dict lookup and a bisect); gauges are callbacks
+evaluated only when scraped. An optional HTTP listener serves everything
+in the Prometheus text exposition format at /metrics.
+----------------------------------------------------------------------------
+FILE VERSION: v1.3.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+from src.utils.http_listener import HttpListener
+
+# Seconds — covers a single HTTP call up to a deadline-bounded poll cycle
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Recorded metrics: name -> (type, help)
+METRICS: dict[str, tuple[str, str]] = {
+    "puck_poll_cycle_seconds": ("histogram", "Wall time of a full poll cycle"),
+    "puck_poll_stage_seconds": ("histogram", "Wall time of one poll-cycle stage"),
+    "puck_http_requests_total": ("counter", "Outbound HTTP attempts by upstream and status"),
+    "puck_http_request_seconds": ("histogram", "Outbound HTTP attempt latency by upstream"),
+    "puck_state_write_seconds": ("histogram", "Time to persist stream_state.json"),
+    "puck_event_loop_lag_seconds": ("histogram", "How late the event loop ran a timed wake-up"),
+    "puck_event_loop_stalls_total": ("counter", "Event-loop stalls past the configured threshold"),
+    "puck_polling_restarts_total": ("counter", "Polling task restarts by the health watchdog"),
+}
+
+LabelKey = tuple[tuple[str, str], ...]
+GaugeSamples = Union[float, int, None, Iterable[tuple[dict[str, Any], float]]]
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(key: LabelKey, extra: Optional[tuple[str, str]] = None) -> str:
+    pairs = key + (extra,) if extra else key
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class _Histogram:
+    """Per-bucket counts (non-cumulative until rendered), sum and count."""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+
+class MetricsManager:
+    """In-process metrics registry with an optional /metrics listener."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("metrics")
+        self._counters: dict[str, dict[LabelKey, float]] = {}
+        self._histograms: dict[str, dict[LabelKey, _Histogram]] = {}
+        self._gauges: dict[str, tuple[str, Callable[[], GaugeSamples]]] = {}
+        self._listener = HttpListener(
+            {"/metrics": lambda: ("200 OK", self.render().encode("utf-8"))},
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    # -------------------------------------------------------------------------
+    # Recording (hot path)
+    # -------------------------------------------------------------------------
+    def inc(self, name: str, amount: float = 1.0, **labels: Any) -> None:
+        """Increment a counter."""
+        series = self._counters.setdefault(name, {})
+        key = tuple((k, str(v)) for k, v in labels.items())
+        series[key] = series.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record one histogram observation (seconds)."""
+        series = self._histograms.setdefault(name, {})
+        key = tuple((k, str(v)) for k, v in labels.items())
+        hist = series.get(key)
+        if hist is None:
+            hist = series[key] = _Histogram()
+        hist.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        hist.total += value
+        hist.count += 1
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        """Observe the wall time of the enclosed block, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    # -------------------------------------------------------------------------
+    # Gauges (evaluated at scrape time)
+    # -------------------------------------------------------------------------
+    def register_gauge(
+        self, name: str, help_text: str, collect: Callable[[], GaugeSamples]
+    ) -> None:
+        """Register a gauge callback.
+
+        The callback returns a single number, None (no sample), or an
+        iterable of (labels, value) pairs.
+        """
+        self._gauges[name] = (help_text, collect)
+
+    # -------------------------------------------------------------------------
+    # Exposition
+    # -------------------------------------------------------------------------
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        lines: list[str] = []
+
+        for name, series in self._counters.items():
+            _, help_text = METRICS.get(name, ("counter", name))
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            lines += [f"{name}{_labels(key)} {value}" for key, value in series.items()]
+
+        for name, series in self._histograms.items():
+            _, help_text = METRICS.get(name, ("histogram", name))
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for key, hist in series.items():
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, hist.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_labels(key, ('le', str(bound)))} {cumulative}")
+                lines.append(f"{name}_bucket{_labels(key, ('le', '+Inf'))} {hist.count}")
+                lines.append(f"{name}_sum{_labels(key)} {hist.total}")
+                lines.append(f"{name}_count{_labels(key)} {hist.count}")
+
+        for name, (help_text, collect) in self._gauges.items():
+            try:
+                samples = collect()
+            except Exception as e:
+                self._log.warning(f"⚠️ Gauge {name} failed: {e}")
+                continue
+            if samples is None:
+                continue
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            if isinstance(samples, (int, float)):
+                samples = [({}, samples)]
+            for labels, value in samples:
+                key = tuple((k, str(v)) for k, v in labels.items())
+                lines.append(f"{name}{_labels(key)} {float(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    # -------------------------------------------------------------------------
+    # HTTP Listener
+    # -------------------------------------------------------------------------
+    async def start(self) -> None:
+        """Start the /metrics listener if metrics are enabled."""
+        snapshot = self._config.snapshot
+        if not snapshot.metrics_enabled or self._listener.running:
+            return
+        try:
+            await self._listener.start(snapshot.metrics_host, snapshot.metrics_port)
+            self._log.success(
+                f"Metrics endpoint listening on "
+                f"http://{snapshot.metrics_host}:{snapshot.metrics_port}/metrics"
+            )
+        except OSError as e:
+            self._log.error(f"❌ Could not start metrics endpoint: {e}")
+
+    async def stop(self) -> None:
+        """Stop the /metrics listener."""
+        await self._listener.stop()
+
+
+def create_metrics_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+) -> MetricsManager:
+    """Factory function — MANDATORY. Never call MetricsManager directly."""
+    return MetricsManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+    )
+
+
+__all__ = ["MetricsManager", "create_metrics_manager", "LATENCY_BUCKETS"]
@@ -0,0 +1,270 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+On-demand profiling for puck-bot. An admin arms a session with
+!puckprofile, and the next N poll cycles run under cProfile and/or
+tracemalloc. When the last cycle finishes, the results go to
+/app/data/profiles: a .prof file (readable by pstats, snakeviz), a text
+summary of the top functions, and the top allocation sites with their
+growth over the session. Nothing is traced while no session is armed.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+
+PROFILE_DIR = "/app/data/profiles"
+TRACEMALLOC_FRAMES = 10
+TOP_FUNCTIONS = 40  # Rows in the text summary of a CPU profile
+
+MODE_CPU = "cpu"
+MODE_MEMORY = "mem"
+MODE_ALL = "all"
+MODES = (MODE_CPU, MODE_MEMORY, MODE_ALL)
+
+
+@dataclass
+class _Session:
+    """One armed profiling run over the next `cycles` poll cycles."""
+
+    cycles: int
+    cpu: bool
+    memory: bool
+    requested_by: str
+    done: int = 0
+    seconds: float = 0.0
+    profile: Optional[cProfile.Profile] = None
+    baseline: Optional[tracemalloc.Snapshot] = None
+    started_tracing: bool = False
+    stamp: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    )
+
+
+class ProfileManager:
+    """Profiles a bounded number of poll cycles on request."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        profile_dir: str = PROFILE_DIR,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("profile_manager")
+        self._profile_dir = Path(profile_dir)
+        self._session: Optional[_Session] = None
+        self._finishing = False  # Results of the last session still being built
+        self.last_files: list[str] = []
+
+    # -------------------------------------------------------------------------
+    # Control (admin commands)
+    # -------------------------------------------------------------------------
+    def arm(self, cycles: Optional[int], mode: str, requested_by: str) -> str:
+        """Profile the next `cycles` poll cycles. Returns a reply for the admin."""
+        if self._session is not None:
+            s = self._session
+            return f"A profile is already running ({s.done}/{s.cycles} cycles done)."
+        if self._finishing:
+            return "The last profile's results are still being written — try again shortly."
+        if mode not in MODES:
+            return f"Unknown mode '{mode}' — use one of: {', '.join(MODES)}."
+        snapshot = self._config.snapshot
+        cycles = cycles or snapshot.profile_default_cycles
+        cycles = max(1, min(cycles, snapshot.profile_max_cycles))
+        self._session = _Session(
+            cycles=cycles,
+            cpu=mode in (MODE_CPU, MODE_ALL),
+            memory=mode in (MODE_MEMORY, MODE_ALL),
+            requested_by=requested_by,
+        )
+        self._log.info(f"Profiling armed by {requested_by}: next {cycles} cycle(s), mode {mode}")
+        return (
+            f"Profiling the next {cycles} poll cycle(s) ({mode}). "
+            f"Results will be written to `{self._profile_dir}`."
+        )
+
+    def cancel(self) -> str:
+        """Drop an armed or running session without writing results."""
+        session, self._session = self._session, None
+        if session is None:
+            return "No profile is running."
+        if session.started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._log.info(f"Profiling cancelled after {session.done}/{session.cycles} cycle(s)")
+        return f"Profile cancelled after {session.done}/{session.cycles} cycle(s)."
+
+    def status(self) -> str:
+        s = self._session
+        if s is not None:
+            return f"Profiling: {s.done}/{s.cycles} cycle(s) done, requested by {s.requested_by}."
+        if self._finishing:
+            return "Profile finished — writing results."
+        if self.last_files:
+            return "No profile running. Last results:\n" + "\n".join(
+                f"`{name}`" for name in self.last_files
+            )
+        return "No profile running."
+
+    # -------------------------------------------------------------------------
+    # Poll-cycle hook
+    # -------------------------------------------------------------------------
+    @asynccontextmanager
+    async def cycle(self) -> AsyncIterator[None]:
+        """Wrap one poll cycle; profiles it only while a session is armed."""
+        session = self._session
+        if session is None:
+            yield
+            return
+
+        if session.done == 0:
+            self._begin(session)
+        if session.profile is not None:
+            try:
+                session.profile.enable()
+            except ValueError as e:  # Another profiler already holds the hook
+                self._log.warning(f"⚠️ CPU profiling unavailable: {e}")
+                session.profile = None
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if session.profile is not None:
+                session.profile.disable()
+            session.seconds += time.perf_counter() - started
+            session.done += 1
+            if session.done >= session.cycles and self._session is session:
+                self._session = None
+                await self._finish(session)
+
+    def _begin(self, session: _Session) -> None:
+        if session.cpu:
+            session.profile = cProfile.Profile()
+        if session.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+                session.started_tracing = True
+            session.baseline = tracemalloc.take_snapshot()
+
+    async def _finish(self, session: _Session) -> None:
+        """Build and write the results off the event loop."""
+        self._finishing = True
+        try:
+            written = await asyncio.to_thread(self._report, session)
+        finally:
+            self._finishing = False
+        self.last_files = written
+        self._log.success(
+            f"Profile of {session.done} cycle(s) ({session.seconds:.2f}s) written: "
+            + ", ".join(written)
+        )
+
+    def _report(self, session: _Session) -> list[str]:
+        """Snapshot, compare and format the session's results, then write them.
+
+        Runs in a worker thread: with deep frame tracing the final snapshot
+        and comparison alone can take seconds.
+        """
+        outputs: dict[str, str] = {}
+        prefix = f"puck-{session.stamp}-{session.cycles}c"
+        top = self._config.snapshot.profile_top_allocations
+
+        if session.baseline is not None and tracemalloc.is_tracing():
+            final = tracemalloc.take_snapshot()
+            if session.started_tracing:
+                tracemalloc.stop()
+            filters = [
+                tracemalloc.Filter(False, module.__file__)
+                for module in (tracemalloc, cProfile, pstats)
+            ]
+            final = final.filter_traces(filters)
+            growth = final.compare_to(session.baseline.filter_traces(filters), "lineno")[:top]
+            largest = final.statistics("lineno")[:top]
+            outputs[f"{prefix}-mem.txt"] = "\n".join(
+                [f"Allocation growth over {session.done} cycle(s), by line:"]
+                + [str(stat) for stat in growth]
+                + ["", "Largest live allocations at the end, by line:"]
+                + [str(stat) for stat in largest]
+            ) + "\n"
+
+        # After the memory snapshot, so building the report isn't counted
+        if session.profile is not None:
+            text = io.StringIO()
+            stats = pstats.Stats(session.profile, stream=text)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+            outputs[f"{prefix}-cpu.txt"] = text.getvalue()
+
+        return self._write(prefix, session.profile, outputs)
+
+    def _write(
+        self, prefix: str, profile: Optional[cProfile.Profile], outputs: dict[str, str]
+    ) -> list[str]:
+        written: list[str] = []
+        try:
+            self._profile_dir.mkdir(parents=True, exist_ok=True)
+            if profile is not None:
+                path = self._profile_dir / f"{prefix}-cpu.prof"
+                profile.dump_stats(str(path))
+                written.append(path.name)
+            for name, text in outputs.items():
+                (self._profile_dir / name).write_text(text, encoding="utf-8")
+                written.append(name)
+            self._prune()
+        except OSError as e:
+            self._log.error(f"❌ Could not write profile results: {e}")
+        return written
+
+    def _prune(self) -> None:
+        """Keep only the newest profiling.keep_files result files."""
+        keep = self._config.snapshot.profile_keep_files
+        files = sorted(
+            (p for p in self._profile_dir.glob("puck-*") if p.is_file()),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for stale in files[keep:]:
+            stale.unlink(missing_ok=True)
+
+
+def create_profile_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    profile_dir: str = PROFILE_DIR,
+) -> ProfileManager:
+    """Factory function — MANDATORY. Never call ProfileManager directly."""
+    return ProfileManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        profile_dir=profile_dir,
+    )
+
+
+__all__ = ["ProfileManager", "create_profile_manager", "MODES"]
@@ -0,0 +1,319 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Resilience layer for puck-bot's outbound HTTP. Wraps the shared transport
+with per-upstream circuit breakers, jittered exponential backoff for
+retryable statuses, and a per-cycle deadline so one dead upstream cannot
+stall a whole poll cycle. Every attempt is counted and timed per upstream
+and status, and traced as a span of the current poll cycle.
+----------------------------------------------------------------------------
+FILE VERSION: v1.3.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+import contextvars
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import httpx
+
+from src.managers.config_manager import ConfigManager
+from src.managers.http_transport_manager import HttpTransportManager
+from src.managers.logging_config_manager import LoggingConfigManager
+from src.managers.metrics_manager import MetricsManager
+from src.managers.trace_manager import TraceManager
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Absolute time.monotonic() deadline for the current poll cycle, if any
+_cycle_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "puck_cycle_deadline", default=None
+)
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of sending a request while an upstream's breaker is open."""
+
+
+class CircuitBreaker:
+    """Classic closed → open → half-open breaker for one upstream."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float) -> None:
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = self.CLOSED
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self._reset_seconds:
+            return self.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def abort_trial(self) -> None:
+        """Release a half-open trial slot whose request never completed."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._state = self.CLOSED
+        self._trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """Record a failure. Returns True if this failure opened the breaker."""
+        self._trial_in_flight = False
+        self._failures += 1
+        was_open = self._state == self.OPEN
+        if self._failures >= self._failure_threshold or was_open:
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            return not was_open
+        return False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"state": self.state, "failures": self._failures}
+
+
+class ResilienceManager:
+    """Sends HTTP requests through breakers, retries and the cycle deadline."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        http_transport: HttpTransportManager,
+        metrics_manager: MetricsManager,
+        trace_manager: TraceManager,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("resilience")
+        self._transport = http_transport
+        self._metrics = metrics_manager
+        self._tracer = trace_manager
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    # -------------------------------------------------------------------------
+    # Breakers
+    # -------------------------------------------------------------------------
+    def breaker(self, upstream: str) -> CircuitBreaker:
+        """Return (creating on first use) the breaker for an upstream."""
+        breaker = self._breakers.get(upstream)
+        if breaker is None:
+            snapshot = self._config.snapshot
+            breaker = CircuitBreaker(
+                upstream,
+                failure_threshold=snapshot.breaker_failure_threshold,
+                reset_seconds=snapshot.breaker_reset_seconds,
+            )
+            self._breakers[upstream] = breaker
+        return breaker
+
+    def is_available(self, upstream: str) -> bool:
+        """True unless the upstream's breaker is fully open."""
+        return self.breaker(upstream).state != CircuitBreaker.OPEN
+
+    def breaker_states(self) -> dict[str, dict[str, Any]]:
+        return {name: b.to_dict() for name, b in self._breakers.items()}
+
+    # -------------------------------------------------------------------------
+    # Cycle deadline
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def cycle_deadline(self, seconds: float) -> Iterator[float]:
+        """Bound retries and backoff inside a poll cycle to `seconds`.
+
+        Tasks spawned inside the block inherit the deadline (contextvars).
+        Hard cancellation of outstanding work is the caller's job.
+        """
+        deadline = time.monotonic() + seconds
+        token = _cycle_deadline.set(deadline)
+        try:
+            yield deadline
+        finally:
+            _cycle_deadline.reset(token)
+
+    @staticmethod
+    def _remaining() -> Optional[float]:
+        deadline = _cycle_deadline.get()
+        if deadline is None:
+            return None
+        return deadline - time.monotonic()
+
+    # -------------------------------------------------------------------------
+    # Requests
+    # -------------------------------------------------------------------------
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        """Full-jitter exponential backoff, honouring Retry-After when present."""
+        snapshot = self._config.snapshot
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), snapshot.backoff_max_seconds)
+                except ValueError:
+                    pass
+        ceiling = min(
+            snapshot.backoff_max_seconds,
+            snapshot.backoff_base_seconds * (2 ** attempt),
+        )
+        return random.uniform(0, ceiling)
+
+    async def request(
+        self,
+        upstream: str,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request to an upstream with breaker, retry and deadline handling.
+
+        Non-idempotent requests (POST by default) are only retried on 429,
+        where the upstream guarantees nothing was processed.
+
+        Returns the final response (which may still be an error status).
+        Raises CircuitOpenError while the breaker is open, or the last
+        httpx.TransportError once retries are exhausted.
+        """
+        if idempotent is None:
+            idempotent = method.upper() != "POST"
+        breaker = self.breaker(upstream)
+        trial = breaker.state == CircuitBreaker.HALF_OPEN
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {upstream}")
+
+        try:
+            return await self._request_with_retries(
+                upstream, breaker, method, url, idempotent, **kwargs
+            )
+        finally:
+            # A trial that ended without a recorded success or failure (429
+            # after retries, cancellation at the cycle deadline, decode
+            # errors) must give the slot back, or the breaker never closes
+            if trial:
+                breaker.abort_trial()
+
+    async def _request_with_retries(
+        self,
+        upstream: str,
+        breaker: CircuitBreaker,
+        method: str,
+        url: str,
+        idempotent: bool,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        http = self._transport.client(upstream)
+        max_retries = self._config.snapshot.max_retries
+        attempt = 0
+
+        while True:
+            response: Optional[httpx.Response] = None
+            error: Optional[httpx.TransportError] = None
+            started = time.perf_counter()
+            with self._tracer.span(f"http:{upstream}", method=method) as span:
+                try:
+                    response = await http.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    error = e
+                status = response.status_code if response is not None else type(error).__name__
+                span["status"] = status
+            self._metrics.observe(
+                "puck_http_request_seconds", time.perf_counter() - started, upstream=upstream
+            )
+            self._metrics.inc("puck_http_requests_total", upstream=upstream, status=status)
+
+            # 429 is backpressure, not an outage — it never trips the breaker
+            failed = error is not None or (
+                response is not None and response.status_code >= 500
+            )
+            retryable = (failed and idempotent) or (
+                response is not None
+                and response.status_code in RETRYABLE_STATUSES
+                and (idempotent or response.status_code == 429)
+            )
+
+            if not retryable and not failed:
+                breaker.record_success()
+                assert response is not None
+                return response
+
+            delay = self._backoff(attempt, response)
+            remaining = self._remaining()
+            out_of_time = remaining is not None and delay >= remaining
+            if not retryable or attempt >= max_retries or out_of_time:
+                if failed and breaker.record_failure():
+                    self._log.warning(
+                        f"⚠️ Circuit opened for {upstream} — serving last-known "
+                        f"state for {self._config.snapshot.breaker_reset_seconds}s"
+                    )
+                if error is not None:
+                    raise error
+                assert response is not None
+                return response
+
+            attempt += 1
+            self._log.debug(
+                "🔍 %s %s returned %s — retry %d/%d in %.2fs",
+                upstream, method, status, attempt, max_retries, delay,
+                extra={"upstream": upstream, "status": status, "attempt": attempt},
+            )
+            await asyncio.sleep(delay)
+
+
+def create_resilience_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    http_transport: HttpTransportManager,
+    metrics_manager: MetricsManager,
+    trace_manager: TraceManager,
+) -> ResilienceManager:
+    """Factory function — MANDATORY. Never call ResilienceManager directly."""
+    return ResilienceManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        http_transport=http_transport,
+        metrics_manager=metrics_manager,
+        trace_manager=trace_manager,
+    )
+
+
+__all__ = [
+    "ResilienceManager",
+    "create_resilience_manager",
+    "CircuitBreaker",
+    "CircuitOpenError",
+]
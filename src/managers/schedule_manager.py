@@ -0,0 +1,218 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Learned streaming schedules for puck-bot. Builds a weekly (168 hour-slot)
+histogram of observed sessions per stream and sorts streams into polling
+tiers: hot streams (live now, likely-live window, or not enough history
+yet) are polled every cycle, cold streams at a reduced rate.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+from src.models.stream_status import StreamStatus
+
+SCHEDULE_FILE = "/app/data/schedule_model.json"
+WEEK_SLOTS = 7 * 24  # One slot per hour of the week (UTC)
+SESSION_DECAY = 0.95  # Older sessions fade so schedule changes are learned
+MAX_SESSION_HOURS = 24  # Cap for sessions with a bogus start time
+
+TIER_HOT = "hot"
+TIER_COLD = "cold"
+
+
+def _slot(ts: float) -> int:
+    """Hour-of-week slot (0 = Monday 00:00 UTC) for a Unix timestamp."""
+    dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+    return dt.weekday() * 24 + dt.hour
+
+
+class ScheduleManager:
+    """Learns weekly go-live patterns and decides which streams are due."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        schedule_file: str = SCHEDULE_FILE,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("schedule_manager")
+        self._schedule_file = Path(schedule_file)
+        # key -> {"slots": [float] * 168, "sessions": float}
+        self._models: dict[str, dict] = {}
+        self._live_since: dict[str, float] = {}
+        self._last_polled: dict[str, float] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load learned schedules. Handles missing/corrupt files gracefully."""
+        if not self._schedule_file.exists():
+            self._log.debug("🔍 No schedule model file — learning from scratch")
+            return
+        try:
+            with open(self._schedule_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for key, model in data.get("streams", {}).items():
+                slots = [float(v) for v in model["slots"]]
+                if len(slots) == WEEK_SLOTS:
+                    self._models[key] = {"slots": slots, "sessions": float(model["sessions"])}
+            self._log.debug(f"🔍 Loaded schedule model for {len(self._models)} stream(s)")
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError) as e:
+            self._log.warning(f"⚠️ Could not load schedule model: {e} — learning from scratch")
+            self._models = {}
+
+    def persist(self) -> None:
+        """Write learned schedules to disk."""
+        try:
+            self._schedule_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "streams": {
+                    key: {
+                        "slots": [round(v, 4) for v in model["slots"]],
+                        "sessions": round(model["sessions"], 4),
+                    }
+                    for key, model in self._models.items()
+                }
+            }
+            with open(self._schedule_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError as e:
+            self._log.error(f"❌ Failed to persist schedule model: {e}")
+
+    # -------------------------------------------------------------------------
+    # Learning
+    # -------------------------------------------------------------------------
+    def record_session(self, key: str, started_at: float, ended_at: float) -> None:
+        """Add one observed session to a stream's weekly histogram."""
+        ended_at = max(ended_at, started_at)
+        started_at = max(started_at, ended_at - MAX_SESSION_HOURS * 3600)
+        model = self._models.setdefault(key, {"slots": [0.0] * WEEK_SLOTS, "sessions": 0.0})
+        model["slots"] = [v * SESSION_DECAY for v in model["slots"]]
+        model["sessions"] = model["sessions"] * SESSION_DECAY + 1.0
+
+        touched = {_slot(ts) for ts in range(int(started_at), int(ended_at) + 1, 3600)}
+        touched.add(_slot(ended_at))
+        for slot in touched:
+            model["slots"][slot] += 1.0
+
+    def observe(self, went_live: list[StreamStatus], went_offline: list[StreamStatus]) -> None:
+        """Learn from a batch of transitions."""
+        now = time.time()
+        for status in went_live:
+            self._live_since[status.key] = (
+                status.started_at.timestamp() if status.started_at else now
+            )
+        recorded = False
+        for status in went_offline:
+            started = self._live_since.pop(status.key, None)
+            if started is None and status.started_at:
+                started = status.started_at.timestamp()
+            if started is not None:
+                self.record_session(status.key, started, now)
+                recorded = True
+        if recorded:
+            self.persist()
+
+    def forget(self, keys: set[str]) -> None:
+        """Drop models for streams no longer tracked."""
+        dropped = [key for key in self._models if key not in keys]
+        for key in dropped:
+            del self._models[key]
+        if dropped:
+            self.persist()
+
+    # -------------------------------------------------------------------------
+    # Tiers
+    # -------------------------------------------------------------------------
+    def likelihood(self, key: str, when: Optional[float] = None) -> Optional[float]:
+        """Share of past sessions touching the hour window around `when`.
+
+        None until enough sessions have been observed to trust the model.
+        """
+        model = self._models.get(key)
+        if not model or model["sessions"] < self._config.snapshot.schedule_min_sessions:
+            return None
+        slot = _slot(when if when is not None else time.time())
+        window = self._config.snapshot.schedule_window_hours
+        hits = max(
+            model["slots"][(slot + offset) % WEEK_SLOTS]
+            for offset in range(-window, window + 1)
+        )
+        return hits / model["sessions"]
+
+    def tier(self, key: str, is_live: bool) -> str:
+        """Polling tier for a stream right now."""
+        if is_live or not self._config.snapshot.schedule_enabled:
+            return TIER_HOT
+        p = self.likelihood(key)
+        if p is None or p >= self._config.snapshot.schedule_hot_threshold:
+            return TIER_HOT
+        return TIER_COLD
+
+    def due(self, keys: list[str], live_keys: set[str], interval: float) -> list[str]:
+        """Filter keys to those due a check this cycle.
+
+        Hot streams are always due; cold streams once every
+        schedule.cold_poll_multiplier × interval seconds.
+        """
+        now = time.time()
+        cold_interval = interval * self._config.snapshot.schedule_cold_poll_multiplier
+        due: list[str] = []
+        for key in keys:
+            if self.tier(key, key in live_keys) == TIER_HOT:
+                due.append(key)
+            elif now - self._last_polled.get(key, 0.0) >= cold_interval - 1:
+                due.append(key)
+        return due
+
+    def mark_polled(self, keys: set[str]) -> None:
+        """Record that keys received a definitive answer just now."""
+        now = time.time()
+        for key in keys:
+            self._last_polled[key] = now
+
+    def tier_counts(self, keys: list[str], live_keys: set[str]) -> dict[str, int]:
+        """Number of streams in each tier (exposed as a metric)."""
+        counts = {TIER_HOT: 0, TIER_COLD: 0}
+        for key in keys:
+            counts[self.tier(key, key in live_keys)] += 1
+        return counts
+
+
+def create_schedule_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    schedule_file: str = SCHEDULE_FILE,
+) -> ScheduleManager:
+    """Factory function — MANDATORY. Never call ScheduleManager directly."""
+    return ScheduleManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        schedule_file=schedule_file,
+    )
+
+
+__all__ = ["ScheduleManager", "create_schedule_manager", "TIER_HOT", "TIER_COLD"]
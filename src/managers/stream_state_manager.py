@@ -13,10 +13,14 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Stream state manager for puck-bot. Persists stream live/offline state to
 JSON for restart survival, and compares current API results against previous
-state to detect WENT_LIVE and WENT_OFFLINE transitions.
+state to detect WENT_LIVE and WENT_OFFLINE transitions. A live stream only
+goes offline after a grace period of consecutive misses (or elapsed time),
+so a single dropped response doesn't churn roles and announcements. Keeps a
+member-level index of live streams so roles follow the member, not the
+individual platform.
 ----------------------------------------------------------------------------
-FILE VERSION: v1.1.0
-LAST MODIFIED: 2026-02-26
+FILE VERSION: v1.6.0
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
@@ -24,11 +28,15 @@ Repository: https://github.com/the-alphabet-cartel/puck
 """
 
 import json
+import time
 from pathlib import Path
 from typing import Optional
 
 from src.managers.config_manager import ConfigManager
 from src.managers.logging_config_manager import LoggingConfigManager
+from src.managers.metrics_manager import MetricsManager
+from src.managers.trace_manager import TraceManager
+from src.models.roster_diff import RosterDiff, roster_entries
 from src.models.stream_status import StreamStatus
 
 STATE_FILE = "/app/data/stream_state.json"
@@ -41,12 +49,20 @@ class StreamStateManager:
         self,
         config_manager: ConfigManager,
         logging_manager: LoggingConfigManager,
+        metrics_manager: MetricsManager,
+        trace_manager: TraceManager,
         state_file: str = STATE_FILE,
     ) -> None:
         self._config = config_manager
         self._log = logging_manager.get_logger("stream_state_manager")
+        self._metrics = metrics_manager
+        self._tracer = trace_manager
         self._state_file = Path(state_file)
         self._previous: dict[str, StreamStatus] = {}
+        # Offline hysteresis: key -> (consecutive misses, first miss time)
+        self._misses: dict[str, tuple[int, float]] = {}
+        # Member aggregation: fluxer_user_id -> keys currently live
+        self._member_live: dict[str, set[str]] = {}
         self._load_state()
 
     def _load_state(self) -> None:
@@ -63,6 +79,7 @@ class StreamStateManager:
         except (json.JSONDecodeError, OSError, KeyError) as e:
             self._log.warning(f"⚠️ Could not load state file: {e} — starting fresh")
             self._previous = {}
+        self._index_members()
 
     def persist(self, current: dict[str, StreamStatus]) -> None:
         """Write current state to JSON file for restart survival."""
@@ -73,16 +90,31 @@ class StreamStateManager:
                     key: status.to_dict() for key, status in current.items()
                 }
             }
-            with open(self._state_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with self._tracer.span("state_write"), self._metrics.timer("puck_state_write_seconds"):
+                with open(self._state_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
             self._previous = current.copy()
+            self._index_members()
         except OSError as e:
             self._log.error(f"❌ Failed to persist state: {e}")
 
+    def _index_members(self) -> None:
+        """Rebuild the fluxer_user_id -> live keys index from current state."""
+        index: dict[str, set[str]] = {}
+        for key, status in self._previous.items():
+            if status.is_live and status.fluxer_user_id:
+                index.setdefault(status.fluxer_user_id, set()).add(key)
+        self._member_live = index
+
+    def live_members(self) -> dict[str, set[str]]:
+        """Members live on at least one platform, mapped to their live keys."""
+        return {fuid: set(keys) for fuid, keys in self._member_live.items()}
+
     def compare(
         self,
         current_live: list[StreamStatus],
         tracked_streams: list[dict],
+        checked_keys: Optional[set[str]] = None,
     ) -> tuple[list[StreamStatus], list[StreamStatus]]:
         """
         Compare current API results against previous state.
@@ -90,23 +122,22 @@ class StreamStateManager:
         Args:
             current_live: StreamStatus objects for currently live streams
             tracked_streams: Full list of tracked stream configs
+            checked_keys: Stream keys actually checked this time. Only these
+                can go offline; other tracked keys keep their previous state.
+                Defaults to every tracked key.
 
         Returns:
             (went_live, went_offline) — lists of StreamStatus objects
         """
         # Build a set of currently live stream keys (platform:username)
-        current_keys: dict[str, StreamStatus] = {}
-        for status in current_live:
-            key = f"{status.platform}:{status.platform_username}"
-            current_keys[key] = status
+        current_keys: dict[str, StreamStatus] = {
+            status.key: status for status in current_live
+        }
 
         # Build set of all tracked stream keys
-        all_tracked_keys: set[str] = set()
-        for stream_cfg in tracked_streams:
-            if stream_cfg.get("twitch_username"):
-                all_tracked_keys.add(f"twitch:{stream_cfg['twitch_username'].lower()}")
-            if stream_cfg.get("youtube_channel_id"):
-                all_tracked_keys.add(f"youtube:{stream_cfg['youtube_channel_id']}")
+        all_tracked_keys = set(roster_entries(tracked_streams))
+        if checked_keys is None:
+            checked_keys = all_tracked_keys
 
         previous_live_keys = {
             k for k, v in self._previous.items() if v.is_live
@@ -124,8 +155,20 @@ class StreamStateManager:
                     f"on {status.platform} — {status.stream_title}"
                 )
 
+        # Seen live again — any pending miss streak is forgiven
+        for key in current_keys:
+            self._misses.pop(key, None)
+
+        in_grace: set[str] = set()
         for key in previous_live_keys:
-            if key not in current_keys and key in all_tracked_keys:
+            if (
+                key not in current_keys
+                and key in all_tracked_keys
+                and key in checked_keys
+            ):
+                if not self._grace_expired(key):
+                    in_grace.add(key)
+                    continue
                 prev = self._previous[key]
                 prev.is_live = False
                 went_offline.append(prev)
@@ -133,20 +176,85 @@ class StreamStateManager:
                     f"ℹ️ ⚫ WENT OFFLINE: {prev.display_name} on {prev.platform}"
                 )
 
-        # Build full current state (live + tracked-but-offline)
+        # Build full current state (live + tracked-but-offline + unchecked)
         full_state: dict[str, StreamStatus] = {}
         for key, status in current_keys.items():
             full_state[key] = status
         for key in all_tracked_keys:
             if key not in full_state and key in self._previous:
-                offline = self._previous[key]
-                offline.is_live = False
-                full_state[key] = offline
+                previous = self._previous[key]
+                if key in checked_keys and key not in in_grace:
+                    previous.is_live = False
+                full_state[key] = previous
 
         # Persist and update previous
         self.persist(full_state)
         return went_live, went_offline
 
+    def _grace_expired(self, key: str) -> bool:
+        """Record a checked miss for a live stream; True once it counts as offline.
+
+        Offline after polling.offline_grace_misses consecutive misses or
+        polling.offline_grace_seconds since the first miss, whichever comes
+        first. Unchecked cycles (API errors) neither count nor reset.
+        """
+        snapshot = self._config.snapshot
+        now = time.time()
+        misses, first_miss = self._misses.get(key, (0, now))
+        misses += 1
+        if misses >= snapshot.offline_grace_misses or now - first_miss >= snapshot.offline_grace_seconds:
+            self._misses.pop(key, None)
+            return True
+        self._misses[key] = (misses, first_miss)
+        self._log.debug(
+            f"🔍 {key} missing ({misses}/{snapshot.offline_grace_misses}) — "
+            f"holding live state"
+        )
+        return False
+
+    def apply_roster_diff(
+        self, diff: RosterDiff
+    ) -> tuple[list[StreamStatus], list[tuple[StreamStatus, str]]]:
+        """
+        Migrate persisted state after a tracked_streams.json hot-reload.
+
+        Removed keys are dropped from state. Changed keys keep their live
+        state but pick up the new fluxer_user_id.
+
+        Returns:
+            (removed_live, reassigned_live) — removed streams that were live,
+            and (status, old_fluxer_user_id) for live streams whose member
+            mapping changed. Both need role/embed cleanup by the caller.
+        """
+        if diff.is_empty:
+            return [], []
+
+        state = self._previous.copy()
+        removed_live: list[StreamStatus] = []
+        reassigned_live: list[tuple[StreamStatus, str]] = []
+
+        for entry in diff.removed:
+            status = state.pop(entry.key, None)
+            if status is not None and status.is_live:
+                removed_live.append(status)
+
+        for old_entry, new_entry in diff.changed:
+            status = state.get(new_entry.key)
+            if status is None:
+                continue
+            old_fuid = status.fluxer_user_id or old_entry.fluxer_user_id
+            status.fluxer_user_id = new_entry.fluxer_user_id
+            if status.is_live and old_fuid != new_entry.fluxer_user_id:
+                reassigned_live.append((status, old_fuid))
+
+        self.persist(state)
+        self._log.debug(
+            f"🔍 Applied roster diff to state ({diff.summary()}) — "
+            f"{len(removed_live)} live removal(s), "
+            f"{len(reassigned_live)} live reassignment(s)"
+        )
+        return removed_live, reassigned_live
+
     def get_previous_state(self) -> dict[str, StreamStatus]:
         """Return the previous state dict (for reconciliation)."""
         return self._previous.copy()
@@ -155,12 +263,16 @@ class StreamStateManager:
 def create_stream_state_manager(
     config_manager: ConfigManager,
     logging_manager: LoggingConfigManager,
+    metrics_manager: MetricsManager,
+    trace_manager: TraceManager,
     state_file: str = STATE_FILE,
 ) -> StreamStateManager:
     """Factory function — MANDATORY. Never call StreamStateManager directly."""
     return StreamStateManager(
         config_manager=config_manager,
         logging_manager=logging_manager,
+        metrics_manager=metrics_manager,
+        trace_manager=trace_manager,
         state_file=state_file,
     )
 
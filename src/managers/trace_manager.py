@@ -0,0 +1,216 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Poll-cycle tracing for puck-bot. Each poll cycle becomes a trace, and the
+stages and upstream calls inside it become spans (carried across tasks by
+contextvars). Recent cycles are kept in an in-memory ring buffer for the
+!puckstats command, and can optionally be appended to an OTLP/JSON file
+off the event loop.
+Spans marked as stages also feed the poll-stage metrics histogram.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+import contextvars
+import json
+import os
+import secrets
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+from src.managers.metrics_manager import MetricsManager
+from src.models.trace import CycleTrace, Span
+
+TRACE_EXPORT_FILE = "/app/data/traces.otlp.jsonl"
+MAX_SPANS_PER_CYCLE = 500  # An RSS fan-out over a large roster stays bounded
+
+_current_trace: contextvars.ContextVar[Optional[CycleTrace]] = contextvars.ContextVar(
+    "puck_current_trace", default=None
+)
+_current_span: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "puck_current_span", default=None
+)
+
+
+class TraceManager:
+    """Records per-stage spans for poll cycles into a ring buffer."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        metrics_manager: MetricsManager,
+        export_file: str = TRACE_EXPORT_FILE,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("trace_manager")
+        self._metrics = metrics_manager
+        self._export_file = Path(export_file)
+        self._recent: deque[CycleTrace] = deque(
+            maxlen=config_manager.snapshot.trace_buffer_cycles
+        )
+        self._tasks: set[asyncio.Task] = set()
+        # One writer at a time — rotation must not race an append
+        self._write_lock = asyncio.Lock()
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def cycle(self, name: str = "poll_cycle") -> Iterator[CycleTrace]:
+        """Trace one poll cycle; spans opened inside attach to it."""
+        trace = CycleTrace(trace_id=secrets.token_hex(16))
+        root = Span(span_id=secrets.token_hex(8), parent_id=None, name=name, start_ns=time.time_ns())
+        trace.spans.append(root)
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(root.span_id)
+        started = time.perf_counter()
+        try:
+            yield trace
+        finally:
+            root.duration = time.perf_counter() - started
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+            self._metrics.observe("puck_poll_cycle_seconds", root.duration)
+            self._recent.append(trace)
+            if self._config.snapshot.trace_export_enabled:
+                task = asyncio.create_task(self._export(trace))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    @contextmanager
+    def span(self, name: str, stage: bool = False, **attributes: Any) -> Iterator[dict[str, Any]]:
+        """Time the enclosed block as a span of the current cycle.
+
+        Yields the span's attribute dict so callers can add results (status
+        codes, counts). Outside a traced cycle only the stage metric, if
+        requested, is recorded. stage=True also observes
+        puck_poll_stage_seconds{stage=name}.
+        """
+        trace = _current_trace.get()
+        started = time.perf_counter()
+        if trace is None or len(trace.spans) >= MAX_SPANS_PER_CYCLE:
+            if trace is not None:
+                trace.dropped += 1
+            try:
+                yield attributes
+            finally:
+                if stage:
+                    self._metrics.observe(
+                        "puck_poll_stage_seconds", time.perf_counter() - started, stage=name
+                    )
+            return
+
+        span = Span(
+            span_id=secrets.token_hex(8),
+            parent_id=_current_span.get(),
+            name=name,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        trace.spans.append(span)
+        token = _current_span.set(span.span_id)
+        try:
+            yield span.attributes
+        except BaseException as e:
+            span.attributes["error"] = type(e).__name__
+            raise
+        finally:
+            span.duration = time.perf_counter() - started
+            _current_span.reset(token)
+            if stage:
+                self._metrics.observe("puck_poll_stage_seconds", span.duration, stage=name)
+
+    # -------------------------------------------------------------------------
+    # OTLP File Export
+    # -------------------------------------------------------------------------
+    async def _export(self, trace: CycleTrace) -> None:
+        """Serialise and append one cycle off the event loop."""
+        async with self._write_lock:
+            await asyncio.to_thread(self._write, trace)
+
+    def _write(self, trace: CycleTrace) -> None:
+        """Append one OTLP/JSON line, rotating once the file passes the size cap."""
+        max_bytes = self._config.snapshot.trace_export_max_mb * 1024 * 1024
+        try:
+            self._export_file.parent.mkdir(parents=True, exist_ok=True)
+            if self._export_file.exists() and self._export_file.stat().st_size >= max_bytes:
+                os.replace(self._export_file, self._export_file.with_suffix(".jsonl.1"))
+            with open(self._export_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(trace.to_otlp("puck-bot"), separators=(",", ":")) + "\n")
+        except OSError as e:
+            self._log.warning(f"⚠️ Could not export trace: {e}")
+
+    async def aclose(self) -> None:
+        """Wait for pending trace exports."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+    def recent(self, count: int) -> list[CycleTrace]:
+        """Most recent cycles, newest first."""
+        return list(reversed(self._recent))[:count]
+
+    def slowest_stages(self, count: int) -> list[dict[str, Any]]:
+        """Span names across the buffer, ranked by their slowest occurrence."""
+        durations: dict[str, list[float]] = {}
+        for trace in self._recent:
+            for span in trace.spans[1:]:
+                durations.setdefault(span.name, []).append(span.duration)
+        rows = []
+        for name, values in durations.items():
+            values.sort()
+            rows.append({
+                "name": name,
+                "count": len(values),
+                "p50": values[len(values) // 2],
+                "max": values[-1],
+                "total": sum(values),
+            })
+        rows.sort(key=lambda r: r["max"], reverse=True)
+        return rows[:count]
+
+    @property
+    def buffered_cycles(self) -> int:
+        return len(self._recent)
+
+
+def create_trace_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    metrics_manager: MetricsManager,
+    export_file: str = TRACE_EXPORT_FILE,
+) -> TraceManager:
+    """Factory function — MANDATORY. Never call TraceManager directly."""
+    return TraceManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        metrics_manager=metrics_manager,
+        export_file=export_file,
+    )
+
+
+__all__ = ["TraceManager", "create_trace_manager"]
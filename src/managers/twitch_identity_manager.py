@@ -0,0 +1,180 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Persistent Twitch identity cache for puck-bot. Maps configured Twitch
+logins to immutable Helix user IDs (plus display name and avatar) so
+detection survives streamer renames. Entries expire after a TTL and are
+re-resolved in the background by TwitchManager. Logins Helix does not
+know are remembered for a while too, so a typo is not re-sent every cycle.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+from src.models.twitch_identity import TwitchIdentity
+
+IDENTITY_FILE = "/app/data/twitch_identities.json"
+MISS_TTL_SECONDS = 3600  # How long an unknown login is not looked up again
+
+
+class TwitchIdentityManager:
+    """Caches login → TwitchIdentity on disk with a TTL."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        identity_file: str = IDENTITY_FILE,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("twitch_identity")
+        self._identity_file = Path(identity_file)
+        self._identities: dict[str, TwitchIdentity] = {}
+        self._misses: dict[str, float] = {}  # Unknown login -> when Helix said so
+        self._load()
+
+    def _load(self) -> None:
+        """Load cached identities. Handles missing/corrupt files gracefully."""
+        if not self._identity_file.exists():
+            self._log.debug("🔍 No identity cache file — resolving fresh")
+            return
+        try:
+            with open(self._identity_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for login, entry in data.get("identities", {}).items():
+                self._identities[login] = TwitchIdentity.from_dict(entry)
+            self._misses = {
+                login: float(checked_at) for login, checked_at in data.get("misses", {}).items()
+            }
+            self._log.debug(f"🔍 Loaded {len(self._identities)} cached Twitch identit(ies)")
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, ValueError) as e:
+            self._log.warning(f"⚠️ Could not load identity cache: {e} — resolving fresh")
+            self._identities = {}
+            self._misses = {}
+
+    def persist(self) -> None:
+        """Write the cache to disk."""
+        try:
+            self._identity_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "identities": {
+                    login: identity.to_dict()
+                    for login, identity in self._identities.items()
+                },
+                "misses": self._misses,
+            }
+            with open(self._identity_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            self._log.error(f"❌ Failed to persist identity cache: {e}")
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+    def _ttl_seconds(self) -> float:
+        return self._config.snapshot.twitch_identity_ttl_hours * 3600
+
+    def get(self, login: str) -> Optional[TwitchIdentity]:
+        """Cached identity for a configured login (stale entries included)."""
+        return self._identities.get(login.lower())
+
+    def by_user_id(self) -> dict[str, str]:
+        """Map user_id → configured login for every cached identity."""
+        return {identity.user_id: login for login, identity in self._identities.items()}
+
+    def missing(self, logins: list[str]) -> list[str]:
+        """Configured logins with no cached identity, skipping recent misses."""
+        cutoff = time.time() - MISS_TTL_SECONDS
+        return [
+            login for login in logins
+            if login.lower() not in self._identities
+            and self._misses.get(login.lower(), 0.0) < cutoff
+        ]
+
+    def stale(self, logins: list[str]) -> list[str]:
+        """Configured logins whose cached identity is older than the TTL."""
+        cutoff = time.time() - self._ttl_seconds()
+        return [
+            login for login in logins
+            if (identity := self._identities.get(login.lower()))
+            and identity.resolved_at < cutoff
+        ]
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+    def store(self, login: str, identity: TwitchIdentity) -> None:
+        """Record an identity for a configured login, logging renames."""
+        login = login.lower()
+        previous = self._identities.get(login)
+        if previous and previous.user_id == identity.user_id and previous.login != identity.login:
+            self._log.warning(
+                f"⚠️ Twitch user {login} renamed to {identity.login} — still tracked by "
+                f"ID {identity.user_id}; update tracked_streams.json when convenient"
+            )
+        self._identities[login] = identity
+        self._misses.pop(login, None)
+
+    def mark_missing(self, logins: list[str], checked_at: float) -> None:
+        """Remember logins Helix returned no user for."""
+        for login in logins:
+            self._misses[login.lower()] = checked_at
+
+    def mark_checked(self, login: str, checked_at: float) -> None:
+        """Restart the TTL of an identity Helix no longer returns.
+
+        Deleted or suspended accounts keep their last-known identity and
+        are checked again after another TTL instead of every cycle.
+        """
+        identity = self._identities.get(login.lower())
+        if identity is not None:
+            identity.resolved_at = checked_at
+
+    def prune(self, logins: list[str]) -> None:
+        """Drop identities for logins no longer on the roster."""
+        keep = {login.lower() for login in logins}
+        dropped = [login for login in self._identities if login not in keep]
+        for login in dropped:
+            del self._identities[login]
+        stale_misses = [login for login in self._misses if login not in keep]
+        for login in stale_misses:
+            del self._misses[login]
+        if dropped or stale_misses:
+            self.persist()
+
+
+def create_twitch_identity_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    identity_file: str = IDENTITY_FILE,
+) -> TwitchIdentityManager:
+    """Factory function — MANDATORY. Never call TwitchIdentityManager directly."""
+    return TwitchIdentityManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        identity_file=identity_file,
+    )
+
+
+__all__ = ["TwitchIdentityManager", "create_twitch_identity_manager"]
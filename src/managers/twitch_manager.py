@@ -12,28 +12,130 @@ MISSION - NEVER TO BE VIOLATED:
 
 ============================================================================
 Twitch API manager for puck-bot. Handles OAuth client credentials auth and
-batch stream status checks via the Twitch Helix API.
+batch stream status checks via the Twitch Helix API. Helix calls go through
+a rate-limit-aware scheduler that tracks the app's token bucket from the
+Ratelimit-* response headers and prioritises stream detection. Configured
+logins are resolved to immutable user IDs via /helix/users and detection
+queries by user_id, so streamer renames don't drop out of tracking. The
+app token is renewed and validated in the background well before expiry,
+so detection never waits on the token endpoint.
 ----------------------------------------------------------------------------
-FILE VERSION: v1.1.0
-LAST MODIFIED: 2026-02-26
+FILE VERSION: v1.9.2
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
 ============================================================================
 """
 
+import asyncio
 import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
 
 from src.managers.config_manager import ConfigManager
 from src.managers.logging_config_manager import LoggingConfigManager
+from src.managers.resilience_manager import CircuitOpenError, ResilienceManager
+from src.managers.twitch_identity_manager import TwitchIdentityManager
+from src.models.check_result import PlatformCheckResult
 from src.models.stream_status import StreamStatus
+from src.models.twitch_identity import TwitchIdentity
 
 HELIX_BASE_URL = "https://api.twitch.tv/helix"
 TOKEN_URL = "https://id.twitch.tv/oauth2/token"
+VALIDATE_URL = "https://id.twitch.tv/oauth2/validate"
+TOKEN_REFRESH_MARGIN_SECONDS = 900  # Renew this long before expiry
+TOKEN_VALIDATE_INTERVAL_SECONDS = 3600  # Twitch asks apps to validate hourly
+TOKEN_RETRY_SECONDS = 60  # Background retry delay after a failed refresh
+TOKEN_MIN_REMAINING_SECONDS = 600  # Don't warm-start with a token about to expire
+
+# Helix request priorities — lower number wins when the bucket runs low
+PRIORITY_DETECTION = 0   # /streams — live detection
+PRIORITY_ENRICHMENT = 1  # /users, /games — nice to have
+DEFAULT_BUCKET_SIZE = 800  # Helix app-token default points per minute
+ENRICHMENT_RESERVE = 0.2   # Fraction of the bucket enrichment may not touch
+
+
+class HelixRateLimiter:
+    """Tracks the Helix token bucket from response headers and paces requests.
+
+    Detection requests may drain the bucket to zero; enrichment requests stop
+    at a reserve so they can never starve detection. Once the remaining
+    points fall into the reserve, detection requests are spaced evenly over
+    the time left until reset instead of bursting into a 429.
+    """
+
+    def __init__(self) -> None:
+        self.limit: int = DEFAULT_BUCKET_SIZE
+        self.remaining: int = DEFAULT_BUCKET_SIZE
+        self.reset_at: float = 0.0  # Unix epoch seconds
+        self.throttled_total: int = 0
+        self.waiting: int = 0  # Requests currently held back by pacing
+        self._last_sent: float = 0.0
+
+    def _refill_if_reset(self) -> None:
+        if self.reset_at and time.time() >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = 0.0
+
+    def _reserve(self) -> int:
+        return int(self.limit * ENRICHMENT_RESERVE)
+
+    def _delay(self, priority: int) -> float:
+        """Seconds to wait before a request of this priority may be sent."""
+        self._refill_if_reset()
+        reset_in = max(0.05, self.reset_at - time.time()) if self.reset_at else 1.0
+        floor = 0 if priority == PRIORITY_DETECTION else self._reserve()
+        if self.remaining <= floor:
+            return reset_in
+        if self.remaining <= self._reserve() and self.reset_at:
+            spacing = reset_in / self.remaining
+            return max(0.0, self._last_sent + spacing - time.time())
+        return 0.0
+
+    async def acquire(self, priority: int = PRIORITY_DETECTION) -> None:
+        """Wait until a request of this priority may be sent, then spend a point."""
+        while True:
+            delay = self._delay(priority)
+            if delay <= 0:
+                self.remaining -= 1
+                self._last_sent = time.time()
+                return
+            self.throttled_total += 1
+            self.waiting += 1
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self.waiting -= 1
+            if not self.reset_at and self.remaining <= 0:
+                # No reset known — assume the bucket has refilled
+                self.remaining = self.limit
+
+    def update(self, headers: httpx.Headers) -> None:
+        """Sync bucket state from Ratelimit-Limit/Remaining/Reset headers."""
+        try:
+            if "Ratelimit-Limit" in headers:
+                self.limit = int(headers["Ratelimit-Limit"])
+            if "Ratelimit-Remaining" in headers:
+                self.remaining = int(headers["Ratelimit-Remaining"])
+            if "Ratelimit-Reset" in headers:
+                self.reset_at = float(headers["Ratelimit-Reset"])
+        except ValueError:
+            pass
+
+    def headroom(self) -> dict[str, Any]:
+        """Bucket headroom snapshot (exposed as a metric)."""
+        self._refill_if_reset()
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_in_seconds": max(0.0, self.reset_at - time.time()) if self.reset_at else 0.0,
+            "headroom_ratio": self.remaining / self.limit if self.limit else 0.0,
+            "throttled_total": self.throttled_total,
+            "waiting": self.waiting,
+        }
 
 
 class TwitchManager:
@@ -43,42 +145,57 @@ class TwitchManager:
         self,
         config_manager: ConfigManager,
         logging_manager: LoggingConfigManager,
+        resilience_manager: ResilienceManager,
+        identity_manager: TwitchIdentityManager,
     ) -> None:
         self._config = config_manager
         self._log = logging_manager.get_logger("twitch_manager")
+        self._resilience = resilience_manager
+        self._identities = identity_manager
         self._client_id = config_manager.get_twitch_client_id()
         self._client_secret = config_manager.get_twitch_client_secret()
         self._access_token: Optional[str] = None
         self._token_expires_at: float = 0.0
-        self._http: Optional[httpx.AsyncClient] = None
-
-    async def _get_http_client(self) -> httpx.AsyncClient:
-        """Get or create the shared HTTP client."""
-        if self._http is None or self._http.is_closed:
-            self._http = httpx.AsyncClient(timeout=15.0)
-        return self._http
-
-    async def close(self) -> None:
-        """Close the HTTP client gracefully."""
-        if self._http and not self._http.is_closed:
-            await self._http.aclose()
+        self._rate_limiter = HelixRateLimiter()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._token_task: Optional[asyncio.Task] = None
+        self._token_lock = asyncio.Lock()  # Single-flight token requests
+        self._token_validated_at: float = 0.0
+        self._unknown_logins: set[str] = set()  # Already warned about
 
     # -------------------------------------------------------------------------
     # OAuth Client Credentials
     # -------------------------------------------------------------------------
     async def _ensure_token(self) -> bool:
-        """Ensure we have a valid app access token, refreshing if needed."""
+        """Ensure we have a valid app access token, refreshing if needed.
+
+        Normally a no-op — the background refresher keeps the token fresh.
+        """
         if self._access_token and time.time() < self._token_expires_at - 60:
             return True
+        return await self._refresh_token(stale=self._access_token)
 
+    async def _refresh_token(self, stale: Optional[str]) -> bool:
+        """Request a new app token unless another caller already replaced `stale`.
+
+        Concurrent callers share one in-flight request.
+        """
+        async with self._token_lock:
+            if self._access_token and self._access_token != stale:
+                return True
+            return await self._request_token()
+
+    async def _request_token(self) -> bool:
         if not self._client_id or not self._client_secret:
             self._log.error("❌ Twitch client_id or client_secret not configured")
             return False
 
         try:
-            http = await self._get_http_client()
-            resp = await http.post(
+            resp = await self._resilience.request(
+                "twitch_auth",
+                "POST",
                 TOKEN_URL,
+                idempotent=True,  # Client-credentials grants are safe to repeat
                 data={
                     "client_id": self._client_id,
                     "client_secret": self._client_secret,
@@ -89,64 +206,280 @@ class TwitchManager:
             data = resp.json()
             self._access_token = data["access_token"]
             self._token_expires_at = time.time() + data.get("expires_in", 3600)
+            self._token_validated_at = time.time()
             self._log.success("Twitch OAuth token acquired")
             return True
         except httpx.HTTPError as e:
             self._log.error(f"❌ Twitch OAuth token request failed: {e}")
             return False
 
+    async def _validate_token(self) -> bool:
+        """Check the token against /oauth2/validate, renewing it if revoked.
+
+        Returns False if validation could not be completed.
+        """
+        token = self._access_token
+        if not token:
+            return False
+        try:
+            resp = await self._resilience.request(
+                "twitch_auth",
+                "GET",
+                VALIDATE_URL,
+                headers={"Authorization": f"OAuth {token}"},
+            )
+        except httpx.HTTPError as e:
+            self._log.debug(f"🔍 Twitch token validation skipped: {e}")
+            return False
+
+        if resp.status_code == 401:
+            self._log.warning("⚠️ Twitch token no longer valid — renewing in background")
+            return await self._refresh_token(stale=token)
+        if not resp.is_success:
+            return False
+        expires_in = resp.json().get("expires_in")
+        if expires_in:
+            self._token_expires_at = time.time() + int(expires_in)
+        self._token_validated_at = time.time()
+        self._log.debug(
+            f"🔍 Twitch token valid ({(self._token_expires_at - time.time()) / 3600:.1f}h left)"
+        )
+        return True
+
+    async def _token_loop(self) -> None:
+        """Renew the token ahead of expiry and validate it on a schedule."""
+        while True:
+            try:
+                refresh_at = self._token_expires_at - TOKEN_REFRESH_MARGIN_SECONDS
+                validate_at = self._token_validated_at + TOKEN_VALIDATE_INTERVAL_SECONDS
+                await asyncio.sleep(max(0.0, min(refresh_at, validate_at) - time.time()))
+
+                if not self._access_token or time.time() >= refresh_at:
+                    ok = await self._refresh_token(stale=self._access_token)
+                else:
+                    ok = await self._validate_token()
+            except Exception as e:
+                # e.g. a malformed token response — keep the refresher alive
+                self._log.error(f"❌ Background token refresh failed: {e}")
+                ok = False
+            if not ok:
+                await asyncio.sleep(TOKEN_RETRY_SECONDS)
+
+    async def start(self) -> None:
+        """Start the background token refresher."""
+        if self._token_task is None or self._token_task.done():
+            self._token_task = asyncio.create_task(self._token_loop())
+
+    # -------------------------------------------------------------------------
+    # Warm Start
+    # -------------------------------------------------------------------------
+    def export_warm_state(self) -> dict:
+        """App access token and expiry for the warm-start snapshot."""
+        return {
+            "access_token": self._access_token,
+            "expires_at": self._token_expires_at,
+        }
+
+    def restore_warm_state(self, data: dict) -> None:
+        """Reuse a persisted app token that still has useful life left."""
+        token = data.get("access_token")
+        expires_at = float(data.get("expires_at", 0))
+        if not token or expires_at - time.time() < TOKEN_MIN_REMAINING_SECONDS:
+            return
+        self._access_token = token
+        self._token_expires_at = expires_at
+        self._token_validated_at = 0.0  # Validate on the refresher's first pass
+        self._log.debug(
+            f"🔍 Reusing persisted Twitch token ({(expires_at - time.time()) / 3600:.1f}h left)"
+        )
+
+    # -------------------------------------------------------------------------
+    # Helix Requests
+    # -------------------------------------------------------------------------
+    async def _helix_get(
+        self,
+        path: str,
+        params: list[tuple[str, str]],
+        priority: int = PRIORITY_DETECTION,
+    ) -> Optional[httpx.Response]:
+        """GET a Helix endpoint through the rate limiter.
+
+        Refreshes the token once on 401. Returns None if no valid token
+        could be obtained; transport errors propagate to the caller.
+        """
+        if not await self._ensure_token():
+            return None
+
+        for attempt in range(2):
+            token = self._access_token
+            await self._rate_limiter.acquire(priority)
+            resp = await self._resilience.request(
+                "twitch",
+                "GET",
+                f"{HELIX_BASE_URL}/{path}",
+                params=params,
+                headers={
+                    "Client-ID": self._client_id,
+                    "Authorization": f"Bearer {token}",
+                },
+            )
+            self._rate_limiter.update(resp.headers)
+
+            if resp.status_code == 401 and attempt == 0:
+                # Rare fallback — the background refresher should get there first
+                self._log.warning("⚠️ Twitch token rejected — refreshing")
+                if not await self._refresh_token(stale=token):
+                    return None
+                continue
+            return resp
+        return resp
+
+    def rate_limit_headroom(self) -> dict[str, Any]:
+        """Current Helix bucket headroom (limit, remaining, reset, ratio)."""
+        return self._rate_limiter.headroom()
+
+    # -------------------------------------------------------------------------
+    # Identity Resolution
+    # -------------------------------------------------------------------------
+    async def _fetch_users(
+        self,
+        param: str,
+        values: list[str],
+        priority: int,
+    ) -> Optional[list[dict]]:
+        """Fetch /helix/users by login or id in batches of 100. None if no token."""
+        users: list[dict] = []
+        for i in range(0, len(values), 100):
+            batch = values[i : i + 100]
+            resp = await self._helix_get("users", [(param, v) for v in batch], priority)
+            if resp is None:
+                return None
+            resp.raise_for_status()
+            users.extend(resp.json().get("data", []))
+        return users
+
+    async def resolve_identities(self, logins: list[str]) -> None:
+        """Resolve logins with no cached identity. Needed before detection."""
+        missing = self._identities.missing(logins)
+        if not missing:
+            return
+        try:
+            users = await self._fetch_users("login", missing, PRIORITY_DETECTION)
+        except httpx.HTTPError as e:
+            self._log.warning(f"⚠️ Twitch identity lookup failed: {e} — querying by login")
+            return
+        if users is None:
+            return
+        now = time.time()
+        for user in users:
+            self._identities.store(user.get("login", ""), TwitchIdentity.from_helix(user, now))
+        found = {u.get("login", "").lower() for u in users}
+        unknown = {login.lower() for login in missing} - found
+        self._identities.mark_missing(sorted(unknown), now)
+        new_unknown = unknown - self._unknown_logins
+        self._unknown_logins = (self._unknown_logins - found) | unknown
+        if new_unknown:
+            self._log.warning(f"⚠️ Twitch login(s) not found: {', '.join(sorted(new_unknown))}")
+        self._identities.persist()
+
+    async def _refresh_stale(self, logins: list[str]) -> None:
+        """Re-resolve stale identities by user ID, picking up renames."""
+        by_id = {
+            identity.user_id: login
+            for login in logins
+            if (identity := self._identities.get(login))
+        }
+        try:
+            users = await self._fetch_users("id", list(by_id), PRIORITY_ENRICHMENT)
+        except httpx.HTTPError as e:
+            self._log.debug(f"🔍 Background identity refresh failed: {e}")
+            return
+        if users is None:
+            return
+        now = time.time()
+        for user in users:
+            login = by_id.pop(str(user.get("id", "")), None)
+            if login:
+                self._identities.store(login, TwitchIdentity.from_helix(user, now))
+        # IDs Helix no longer returns (deleted or suspended accounts)
+        for login in by_id.values():
+            self._identities.mark_checked(login, now)
+        self._identities.persist()
+        self._log.debug(
+            f"🔍 Refreshed {len(users)} Twitch identit(ies)"
+            + (f", {len(by_id)} no longer returned by Helix" if by_id else "")
+        )
+
+    def _schedule_refresh(self, logins: list[str]) -> None:
+        """Start a background refresh for stale identities (single flight)."""
+        if self._refresh_task and not self._refresh_task.done():
+            return
+        stale = self._identities.stale(logins)
+        if stale:
+            self._refresh_task = asyncio.create_task(self._refresh_stale(stale))
+
+    def identity(self, login: str) -> Optional[TwitchIdentity]:
+        """Cached identity (display name, avatar) for a configured login."""
+        return self._identities.get(login)
+
+    def prune_identities(self, logins: list[str]) -> None:
+        """Forget cached identities for logins no longer tracked."""
+        self._identities.prune(logins)
+
+    def stop(self) -> None:
+        """Cancel background token and identity work."""
+        for task in (self._token_task, self._refresh_task):
+            if task and not task.done():
+                task.cancel()
+
     # -------------------------------------------------------------------------
     # Stream Status Checking
     # -------------------------------------------------------------------------
     async def check_streams(
         self, usernames: list[str]
-    ) -> list[StreamStatus]:
+    ) -> PlatformCheckResult:
         """
         Check live status for a batch of Twitch usernames.
 
-        Twitch Helix supports up to 100 user_login params per request.
-        Returns a StreamStatus for each username that is currently live.
-        Usernames NOT in the response are offline.
+        Usernames are resolved to user IDs first and queried by user_id
+        (falling back to user_login for any that can't be resolved), up to
+        100 per request. Results are keyed by the configured username even
+        if the streamer has since renamed.
+
+        The result lists a StreamStatus for each username that is currently
+        live, plus the keys of every username whose batch was answered.
+        Usernames in an answered batch but NOT in the response are offline;
+        usernames in a failed batch are left out so they keep last-known state.
         """
+        result = PlatformCheckResult()
         if not usernames:
-            return []
+            return result
 
-        if not await self._ensure_token():
-            self._log.warning("⚠️ Skipping Twitch check — no valid token")
-            return []
+        if not self._resilience.is_available("twitch"):
+            self._log.debug("🔍 Twitch circuit open — serving last-known state")
+            return result
 
-        http = await self._get_http_client()
-        headers = {
-            "Client-ID": self._client_id,
-            "Authorization": f"Bearer {self._access_token}",
-        }
-
-        live_statuses: list[StreamStatus] = []
+        usernames = [name.lower() for name in usernames]
+        await self.resolve_identities(usernames)
+        self._schedule_refresh(usernames)
+        login_for_id = self._identities.by_user_id()
 
         # Batch in groups of 100 (Helix limit)
         for i in range(0, len(usernames), 100):
             batch = usernames[i : i + 100]
-            params = [("user_login", name) for name in batch]
+            params = []
+            for name in batch:
+                identity = self._identities.get(name)
+                if identity:
+                    params.append(("user_id", identity.user_id))
+                else:
+                    params.append(("user_login", name))
 
             try:
-                resp = await http.get(
-                    f"{HELIX_BASE_URL}/streams",
-                    params=params,
-                    headers=headers,
-                )
-
-                if resp.status_code == 401:
-                    self._log.warning("⚠️ Twitch token expired — refreshing")
-                    self._access_token = None
-                    if await self._ensure_token():
-                        headers["Authorization"] = f"Bearer {self._access_token}"
-                        resp = await http.get(
-                            f"{HELIX_BASE_URL}/streams",
-                            params=params,
-                            headers=headers,
-                        )
-                    else:
-                        continue
+                resp = await self._helix_get("streams", params, PRIORITY_DETECTION)
+                if resp is None:
+                    self._log.warning("⚠️ Skipping Twitch check — no valid token")
+                    break
 
                 resp.raise_for_status()
                 data = resp.json()
@@ -161,11 +494,15 @@ class TwitchManager:
                     if thumbnail:
                         thumbnail = thumbnail.replace("{width}", "640").replace("{height}", "360")
 
-                    live_statuses.append(StreamStatus(
+                    login = stream.get("user_login", "").lower()
+                    configured = login_for_id.get(str(stream.get("user_id", "")), login)
+                    identity = self._identities.get(configured)
+
+                    result.live.append(StreamStatus(
                         fluxer_user_id="",  # Mapped by stream_monitor
                         display_name=stream.get("user_name", ""),
                         platform="twitch",
-                        platform_username=stream.get("user_login", "").lower(),
+                        platform_username=configured,
                         is_live=True,
                         stream_title=stream.get("title"),
                         game_or_category=stream.get("game_name"),
@@ -173,29 +510,45 @@ class TwitchManager:
                         thumbnail_url=thumbnail,
                         stream_url=f"https://twitch.tv/{stream.get('user_login', '')}",
                         started_at=started_at,
+                        avatar_url=identity.profile_image_url if identity else None,
                     ))
+                result.checked_keys.update(f"twitch:{name.lower()}" for name in batch)
 
                 self._log.debug(
-                    f"🔍 Twitch batch {i // 100 + 1}: "
-                    f"{len(data.get('data', []))} live / {len(batch)} checked"
+                    "🔍 Twitch batch %d: %d live / %d checked",
+                    i // 100 + 1, len(data.get("data", [])), len(batch),
+                    extra={"platform": "twitch"},
                 )
 
+            except CircuitOpenError:
+                self._log.debug("🔍 Twitch circuit open — remaining batches keep last-known state")
+                break
             except httpx.HTTPError as e:
                 self._log.error(f"❌ Twitch API request failed: {e}")
                 continue
 
-        return live_statuses
+        return result
 
 
 def create_twitch_manager(
     config_manager: ConfigManager,
     logging_manager: LoggingConfigManager,
+    resilience_manager: ResilienceManager,
+    identity_manager: TwitchIdentityManager,
 ) -> TwitchManager:
     """Factory function — MANDATORY. Never call TwitchManager directly."""
     return TwitchManager(
         config_manager=config_manager,
         logging_manager=logging_manager,
+        resilience_manager=resilience_manager,
+        identity_manager=identity_manager,
     )
 
 
-__all__ = ["TwitchManager", "create_twitch_manager"]
+__all__ = [
+    "TwitchManager",
+    "create_twitch_manager",
+    "HelixRateLimiter",
+    "PRIORITY_DETECTION",
+    "PRIORITY_ENRICHMENT",
+]
@@ -0,0 +1,179 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Warm-start snapshot for puck-bot. Managers register a section (export and
+restore callables); the snapshot is written periodically and at shutdown
+to /app/data and restored at boot, so a restart skips the cold OAuth
+exchange, channel rename and guild lookups. The file holds a live app
+token, so it is written atomically with owner-only permissions.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+
+WARM_START_FILE = "/app/data/warm_start.json"
+SNAPSHOT_VERSION = 1
+
+
+class WarmStartManager:
+    """Collects, persists and restores warm-start sections."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+        snapshot_file: str = WARM_START_FILE,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("warm_start")
+        self._snapshot_file = Path(snapshot_file)
+        self._sections: dict[str, tuple[Callable[[], dict], Callable[[dict], None]]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.restored: bool = False
+
+    # -------------------------------------------------------------------------
+    # Registration
+    # -------------------------------------------------------------------------
+    def register(
+        self,
+        name: str,
+        export: Callable[[], dict[str, Any]],
+        restore: Callable[[dict[str, Any]], None],
+    ) -> None:
+        """Register a section. Call before restore()."""
+        self._sections[name] = (export, restore)
+
+    # -------------------------------------------------------------------------
+    # Restore
+    # -------------------------------------------------------------------------
+    def restore(self) -> bool:
+        """Restore every registered section from a fresh-enough snapshot."""
+        if not self._config.snapshot.warm_start_enabled:
+            return False
+        if not self._snapshot_file.exists():
+            self._log.debug("🔍 No warm-start snapshot — cold start")
+            return False
+        try:
+            with open(self._snapshot_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            self._log.warning(f"⚠️ Could not read warm-start snapshot: {e} — cold start")
+            return False
+
+        if data.get("version") != SNAPSHOT_VERSION:
+            self._log.info("ℹ️ Warm-start snapshot format changed — cold start")
+            return False
+        age = time.time() - float(data.get("saved_at", 0))
+        max_age = self._config.snapshot.warm_start_max_age_seconds
+        if age > max_age:
+            self._log.info(f"ℹ️ Warm-start snapshot is {age:.0f}s old (max {max_age}s) — cold start")
+            return False
+
+        sections = data.get("sections", {})
+        restored = []
+        for name, (_, restore) in self._sections.items():
+            if name not in sections:
+                continue
+            try:
+                restore(sections[name])
+                restored.append(name)
+            except (KeyError, TypeError, ValueError) as e:
+                self._log.warning(f"⚠️ Skipping warm-start section {name}: {e}")
+
+        self.restored = bool(restored)
+        self._log.success(
+            f"Warm start from {age:.0f}s-old snapshot ({', '.join(restored) or 'nothing'})"
+        )
+        return self.restored
+
+    # -------------------------------------------------------------------------
+    # Save
+    # -------------------------------------------------------------------------
+    def save(self) -> None:
+        """Write every registered section atomically with 0600 permissions."""
+        if not self._config.snapshot.warm_start_enabled:
+            return
+        sections: dict[str, Any] = {}
+        for name, (export, _) in self._sections.items():
+            try:
+                sections[name] = export()
+            except Exception as e:
+                self._log.warning(f"⚠️ Could not export warm-start section {name}: {e}")
+        data = {"version": SNAPSHOT_VERSION, "saved_at": time.time(), "sections": sections}
+
+        tmp_path = self._snapshot_file.with_suffix(".tmp")
+        try:
+            self._snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o600)  # O_CREAT mode is ignored for an existing file
+            os.replace(tmp_path, self._snapshot_file)
+            self._log.debug(f"🔍 Saved warm-start snapshot ({', '.join(sections)})")
+        except OSError as e:
+            self._log.error(f"❌ Failed to save warm-start snapshot: {e}")
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.snapshot.warm_start_save_interval_seconds)
+            self.save()
+
+    async def start(self) -> None:
+        """Start periodic saving."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic saving and write a final snapshot."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.save()
+
+
+def create_warm_start_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+    snapshot_file: str = WARM_START_FILE,
+) -> WarmStartManager:
+    """Factory function — MANDATORY. Never call WarmStartManager directly."""
+    return WarmStartManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+        snapshot_file=snapshot_file,
+    )
+
+
+__all__ = ["WarmStartManager", "create_warm_start_manager"]
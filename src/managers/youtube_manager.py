@@ -12,31 +12,53 @@ MISSION - NEVER TO BE VIOLATED:
 
 ============================================================================
 YouTube API manager for puck-bot. Handles YouTube Data API v3 live stream
-checks with RSS pre-filtering for quota conservation.
+checks with RSS pre-filtering for quota conservation. New RSS entries are
+classified with batched videos.list lookups (1 unit per 50 videos), which
+also builds an index of upcoming broadcasts so scheduled streams get a
+targeted check around their scheduledStartTime. Streams already known to
+be live are verified by video ID alone (no RSS, no search.list), cheaply
+enough to run every base cycle. API calls draw from a pool of keys, each
+with its own quota ledger, failing over on 403.
 ----------------------------------------------------------------------------
-FILE VERSION: v1.1.0
-LAST MODIFIED: 2026-02-26
+FILE VERSION: v1.10.4
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
 ============================================================================
 """
 
+import asyncio
+import logging
+import time
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Any, Optional
 
 import httpx
 
 from src.managers.config_manager import ConfigManager
 from src.managers.logging_config_manager import LoggingConfigManager
+from src.managers.metrics_manager import MetricsManager
+from src.managers.trace_manager import TraceManager
+from src.managers.resilience_manager import ResilienceManager
+from src.managers.youtube_quota_manager import YouTubeQuotaManager
+from src.models.check_result import PlatformCheckResult
 from src.models.stream_status import StreamStatus
 
 RSS_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
 API_BASE_URL = "https://www.googleapis.com/youtube/v3"
 RSS_RECENCY_HOURS = 24
-DAILY_QUOTA_LIMIT = 10000
 SEARCH_COST = 100  # units per search.list call
+VIDEOS_COST = 1  # units per videos.list call (up to 50 IDs)
+VIDEOS_BATCH = 50
+RSS_ENTRIES_CHECKED = 5  # Only classify the most recent feed entries
+SCHEDULE_LEAD_SECONDS = 300  # Start checking 5 min before a scheduled start
+SCHEDULE_GRACE_SECONDS = 7200  # Keep checking 2 h after (streams start late)
+ATOM_NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "yt": "http://www.youtube.com/xml/schemas/2015",
+}
 
 
 class YouTubeManager:
@@ -46,130 +68,302 @@ class YouTubeManager:
         self,
         config_manager: ConfigManager,
         logging_manager: LoggingConfigManager,
+        resilience_manager: ResilienceManager,
+        quota_manager: YouTubeQuotaManager,
+        metrics_manager: MetricsManager,
+        trace_manager: TraceManager,
     ) -> None:
         self._config = config_manager
         self._log = logging_manager.get_logger("youtube_manager")
-        self._api_key = config_manager.get_youtube_api_key()
-        self._http: Optional[httpx.AsyncClient] = None
-        self._daily_quota_used: int = 0
-        self._quota_reset_date: Optional[str] = None
-        self._quota_exhausted: bool = False
-
-    async def _get_http_client(self) -> httpx.AsyncClient:
-        """Get or create the shared HTTP client."""
-        if self._http is None or self._http.is_closed:
-            self._http = httpx.AsyncClient(timeout=15.0)
-        return self._http
-
-    async def close(self) -> None:
-        """Close the HTTP client gracefully."""
-        if self._http and not self._http.is_closed:
-            await self._http.aclose()
-
-    def _check_quota_reset(self) -> None:
-        """Reset daily quota counter if a new day has started (Pacific time)."""
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        if self._quota_reset_date != today:
-            self._daily_quota_used = 0
-            self._quota_exhausted = False
-            self._quota_reset_date = today
-            self._log.debug("🔍 YouTube quota counter reset for new day")
+        self._resilience = resilience_manager
+        self._quota = quota_manager
+        self._metrics = metrics_manager
+        self._tracer = trace_manager
+        # Broadcast index built from RSS + videos.list
+        self._classified: dict[str, str] = {}  # video_id -> liveBroadcastContent
+        self._upcoming: dict[str, dict[str, float]] = {}  # channel -> {video_id: scheduled ts}
+        self._live_videos: dict[str, set[str]] = {}  # channel -> live video IDs
+
+    # -------------------------------------------------------------------------
+    # Warm Start
+    # -------------------------------------------------------------------------
+    def export_warm_state(self) -> dict:
+        """Quota ledger and broadcast index for the warm-start snapshot."""
+        return {
+            "quota": self._quota.export_warm_state(),
+            "live_videos": {cid: sorted(v) for cid, v in self._live_videos.items() if v},
+            "upcoming": self._upcoming,
+        }
+
+    def restore_warm_state(self, data: dict) -> None:
+        """Resume the broadcast index and today's quota ledger."""
+        for channel_id, video_ids in data.get("live_videos", {}).items():
+            self._live_videos[channel_id] = set(video_ids)
+            for video_id in video_ids:
+                self._classified[video_id] = "live"
+        for channel_id, upcoming in data.get("upcoming", {}).items():
+            self._upcoming[channel_id] = {v: float(ts) for v, ts in upcoming.items()}
+            for video_id in upcoming:
+                self._classified[video_id] = "upcoming"
+
+        self._quota.restore_warm_state(data.get("quota", {}))
 
     # -------------------------------------------------------------------------
     # RSS Pre-Check (free, no quota)
     # -------------------------------------------------------------------------
-    async def _rss_has_recent_activity(self, channel_id: str) -> bool:
+    async def _rss_entries(self, channel_id: str) -> Optional[list[tuple[str, datetime]]]:
         """
-        Check YouTube RSS feed for recent video activity.
+        Fetch a channel's RSS feed as [(video_id, published)], newest first.
 
-        Returns True if any video was published in the last RSS_RECENCY_HOURS,
-        meaning it's worth spending API quota to check for a live stream.
-        Returns True on any error (fail-open to avoid missing live streams).
+        Returns None on any error so callers can fail open.
         """
-        http = await self._get_http_client()
         url = RSS_URL.format(channel_id=channel_id)
 
         try:
-            resp = await http.get(url)
+            resp = await self._resilience.request("youtube_rss", "GET", url)
             if resp.status_code != 200:
-                self._log.debug(f"🔍 RSS check for {channel_id} returned {resp.status_code} — assuming active")
-                return True
+                self._log.debug(
+                    "🔍 RSS check for %s returned %d — assuming active", channel_id, resp.status_code,
+                    extra={"platform": "youtube", "stream": f"youtube:{channel_id}"},
+                )
+                return None
 
             root = ET.fromstring(resp.text)
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
-            entries = root.findall("atom:entry", ns)
-
-            if not entries:
-                return False
-
-            cutoff = datetime.now(timezone.utc) - timedelta(hours=RSS_RECENCY_HOURS)
-            for entry in entries[:5]:  # Only check most recent entries
-                published = entry.find("atom:published", ns)
+            entries: list[tuple[str, datetime]] = []
+            for entry in root.findall("atom:entry", ATOM_NS):
+                video_id = entry.find("yt:videoId", ATOM_NS)
+                published = entry.find("atom:published", ATOM_NS)
+                if video_id is None or not video_id.text:
+                    continue
+                pub_dt = datetime.now(timezone.utc)
                 if published is not None and published.text:
-                    pub_dt = datetime.fromisoformat(
-                        published.text.replace("Z", "+00:00")
-                    )
-                    if pub_dt > cutoff:
-                        return True
-            return False
+                    pub_dt = datetime.fromisoformat(published.text.replace("Z", "+00:00"))
+                entries.append((video_id.text, pub_dt))
+            return entries
 
         except Exception as e:
-            self._log.debug(f"🔍 RSS pre-check failed for {channel_id}: {e} — assuming active")
-            return True  # Fail-open
+            self._log.debug(
+                "🔍 RSS pre-check failed for %s: %s — assuming active", channel_id, e,
+                extra={"platform": "youtube", "stream": f"youtube:{channel_id}"},
+            )
+            return None
+
+    @staticmethod
+    def _has_recent_activity(entries: Optional[list[tuple[str, datetime]]]) -> bool:
+        """
+        True if any video was published in the last RSS_RECENCY_HOURS,
+        meaning it's worth spending search quota to check for a live stream.
+        True when the feed couldn't be read (fail-open).
+        """
+        if entries is None:
+            return True
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=RSS_RECENCY_HOURS)
+        return any(published > cutoff for _, published in entries[:RSS_ENTRIES_CHECKED])
 
     # -------------------------------------------------------------------------
     # YouTube Data API v3 Live Check
     # -------------------------------------------------------------------------
-    async def _api_check_live(self, channel_id: str) -> Optional[StreamStatus]:
+    async def _api_get(
+        self, endpoint: str, params: dict[str, Any], cost: int
+    ) -> Optional[httpx.Response]:
+        """GET a Data API endpoint using the next key with headroom.
+
+        A 403 takes that key out of rotation for the day and retries on the
+        next one. Returns None once no key can answer.
         """
-        Check if a YouTube channel is currently live via the Data API v3.
+        if not self._quota.configured:
+            self._log.warning("⚠️ YouTube API key not configured — skipping")
+            return None
+
+        while True:
+            ledger = self._quota.acquire(cost)
+            if ledger is None:
+                self._log.debug("🔍 YouTube quota exhausted on every key — skipping API call")
+                return None
+
+            resp = await self._resilience.request(
+                "youtube_api",
+                "GET",
+                f"{API_BASE_URL}/{endpoint}",
+                params={**params, "key": ledger.key},
+            )
+            self._quota.charge(ledger, cost)
+
+            if resp.status_code == 403:
+                self._quota.mark_exhausted(ledger, self._forbidden_reason(resp))
+                continue
+
+            resp.raise_for_status()
+            return resp
 
-        Costs 100 quota units per call. Returns StreamStatus if live, None if not.
+    @staticmethod
+    def _forbidden_reason(resp: httpx.Response) -> str:
+        """Human-readable reason from a Data API 403 body."""
+        try:
+            errors = resp.json().get("error", {}).get("errors", [])
+            reason = errors[0].get("reason", "") if errors else ""
+        except ValueError:
+            reason = ""
+        return f"returned 403 ({reason})" if reason else "returned 403"
+
+    async def _videos_list(self, video_ids: list[str]) -> Optional[dict[str, dict]]:
         """
-        self._check_quota_reset()
+        Batched videos.list lookup (snippet + liveStreamingDetails).
 
-        if self._quota_exhausted:
-            self._log.debug("🔍 YouTube quota exhausted — skipping API call")
-            return None
+        Returns {video_id: item} — IDs missing from the result were deleted
+        or made private. None if any batch could not be answered.
+        """
+        items: dict[str, dict] = {}
+        for i in range(0, len(video_ids), VIDEOS_BATCH):
+            batch = video_ids[i : i + VIDEOS_BATCH]
+            try:
+                resp = await self._api_get(
+                    "videos",
+                    {"part": "snippet,liveStreamingDetails", "id": ",".join(batch)},
+                    VIDEOS_COST,
+                )
+            except httpx.HTTPError as e:
+                self._log.error(f"❌ YouTube videos.list request failed: {e}")
+                return None
+            if resp is None:
+                return None
+            for item in resp.json().get("items", []):
+                items[item.get("id", "")] = item
+        return items
+
+    @staticmethod
+    def _status_from_video(channel_id: str, item: dict) -> StreamStatus:
+        """Build a live StreamStatus from a videos.list item."""
+        snippet = item.get("snippet", {})
+        details = item.get("liveStreamingDetails", {})
+        video_id = item.get("id", "")
+        started_at = None
+        if details.get("actualStartTime"):
+            started_at = datetime.fromisoformat(
+                details["actualStartTime"].replace("Z", "+00:00")
+            )
+        return StreamStatus(
+            fluxer_user_id="",  # Mapped by stream_monitor
+            display_name=snippet.get("channelTitle", ""),
+            platform="youtube",
+            platform_username=channel_id,
+            is_live=True,
+            stream_title=snippet.get("title"),
+            game_or_category=None,
+            viewer_count=int(details.get("concurrentViewers", 0) or 0),
+            thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
+            stream_url=f"https://youtube.com/watch?v={video_id}",
+            started_at=started_at,
+        )
 
-        if not self._api_key:
-            self._log.warning("⚠️ YouTube API key not configured — skipping")
-            return None
+    # -------------------------------------------------------------------------
+    # Upcoming Broadcast Index
+    # -------------------------------------------------------------------------
+    def _index_video(self, channel_id: str, video_id: str, item: Optional[dict]) -> None:
+        """Record a video's broadcast state; track it if it's upcoming.
+
+        Videos missing from the lookup (private, processing, deleted) stay
+        unclassified, so the next YouTube cycle looks them up again.
+        """
+        content = (item or {}).get("snippet", {}).get("liveBroadcastContent", "none")
+        details = (item or {}).get("liveStreamingDetails", {})
+        if details.get("actualEndTime"):
+            content = "none"
+        if item is None:
+            self._classified.pop(video_id, None)
+        else:
+            self._classified[video_id] = content
+        live = self._live_videos.setdefault(channel_id, set())
+        if content == "live":
+            live.add(video_id)
+        else:
+            live.discard(video_id)
+        upcoming = self._upcoming.setdefault(channel_id, {})
+        scheduled = details.get("scheduledStartTime")
+        ts = (
+            datetime.fromisoformat(scheduled.replace("Z", "+00:00")).timestamp()
+            if scheduled else None
+        )
+        # Past the grace window the feed re-check still covers a late start
+        if content == "upcoming" and ts is not None and time.time() <= ts + SCHEDULE_GRACE_SECONDS:
+            if video_id not in upcoming:
+                self._log.info(
+                    f"ℹ️ Indexed upcoming YouTube broadcast {video_id} for {channel_id} "
+                    f"at {datetime.fromtimestamp(ts, tz=timezone.utc):%Y-%m-%d %H:%M} UTC"
+                )
+            upcoming[video_id] = ts
+        else:
+            upcoming.pop(video_id, None)
+
+    def _in_window(self, channel_id: str, now: float) -> list[str]:
+        """Upcoming video IDs whose scheduled start is near `now`. Prunes stale ones."""
+        upcoming = self._upcoming.get(channel_id, {})
+        for video_id in [v for v, ts in upcoming.items() if now > ts + SCHEDULE_GRACE_SECONDS]:
+            del upcoming[video_id]
+        return [
+            video_id for video_id, ts in upcoming.items()
+            if ts - SCHEDULE_LEAD_SECONDS <= now
+        ]
+
+    def live_channels(self, channel_ids: list[str]) -> list[str]:
+        """Channels with a video known to be live.
+
+        The monitor checks these every base cycle — a batched videos.list
+        lookup of liveStreamingDetails.actualEndTime at 1 unit per 50 videos.
+        """
+        return [cid for cid in channel_ids if self._live_videos.get(cid)]
 
-        http = await self._get_http_client()
+    def scheduled_channels(self, channel_ids: list[str]) -> list[str]:
+        """Channels with a scheduled broadcast starting around now.
 
+        The monitor checks these every base cycle, off the YouTube cadence.
+        """
+        now = time.time()
+        return [cid for cid in channel_ids if self._in_window(cid, now)]
+
+    # -------------------------------------------------------------------------
+    # search.list Fallback (100 units)
+    # -------------------------------------------------------------------------
+    async def _api_check_live(
+        self, channel_id: str
+    ) -> tuple[bool, Optional[StreamStatus]]:
+        """
+        Check if a YouTube channel is currently live via the Data API v3.
+
+        Costs 100 quota units per call. Returns (checked, status): status is
+        a StreamStatus if live, None if not. checked is False when no
+        definitive answer was obtained (quota, breaker, request failure).
+        """
         try:
-            resp = await http.get(
-                f"{API_BASE_URL}/search",
-                params={
+            resp = await self._api_get(
+                "search",
+                {
                     "part": "snippet",
                     "channelId": channel_id,
                     "eventType": "live",
                     "type": "video",
-                    "key": self._api_key,
                 },
+                SEARCH_COST,
             )
+            if resp is None:
+                return False, None
 
-            self._daily_quota_used += SEARCH_COST
-
-            if resp.status_code == 403:
-                self._log.warning("⚠️ YouTube API quota exhausted — switching to RSS-only mode")
-                self._quota_exhausted = True
-                return None
-
-            resp.raise_for_status()
             data = resp.json()
             items = data.get("items", [])
 
             if not items:
-                return None
+                return True, None
 
             item = items[0]
             snippet = item.get("snippet", {})
             video_id = item.get("id", {}).get("videoId", "")
             thumbnail = snippet.get("thumbnails", {}).get("high", {}).get("url", "")
+            if video_id:
+                # Verify continuation cheaply via videos.list from now on
+                self._classified[video_id] = "live"
+                self._live_videos.setdefault(channel_id, set()).add(video_id)
 
-            return StreamStatus(
+            return True, StreamStatus(
                 fluxer_user_id="",  # Mapped by stream_monitor
                 display_name=snippet.get("channelTitle", ""),
                 platform="youtube",
@@ -185,53 +379,158 @@ class YouTubeManager:
 
         except httpx.HTTPError as e:
             self._log.error(f"❌ YouTube API request failed for {channel_id}: {e}")
-            return None
+            return False, None
 
     # -------------------------------------------------------------------------
     # Public Interface
     # -------------------------------------------------------------------------
     async def check_streams(
         self, channel_ids: list[str]
-    ) -> list[StreamStatus]:
+    ) -> PlatformCheckResult:
         """
         Check live status for YouTube channels.
 
-        Uses RSS pre-check to avoid spending API quota unnecessarily.
+        Each channel's RSS feed (free) is read, and every entry not yet
+        settled as "none" (new, unanswered or still upcoming) plus any
+        upcoming broadcast inside its scheduled window is classified with
+        one batched videos.list call, together with videos that were live
+        last time. Upcoming broadcasts are re-read every YouTube cycle
+        whatever their schedule, so early, late and unscheduled starts are
+        still caught. Channels with a known-live video skip the feed entirely.
+        A channel is live if one of those videos is live; otherwise it is
+        checked-and-offline without touching search.list. Only when the
+        feed or the lookup fails does a channel fall back to the RSS
+        recency check + search.list (100 units).
+
+        Channels without any answer (quota exhausted, circuit open,
+        request failure) are left out of checked_keys so they keep their
+        last-known state.
         """
+        result = PlatformCheckResult()
         if not channel_ids:
-            return []
-
-        live_statuses: list[StreamStatus] = []
-        checked_api = 0
-
+            return result
+
+        now = time.time()
+        # Known-live channels are verified by video ID — their feed is skipped
+        known_live = set(self.live_channels(channel_ids))
+        to_read = [cid for cid in channel_ids if cid not in known_live]
+        feeds: dict[str, Optional[list[tuple[str, datetime]]]] = {
+            cid: [] for cid in known_live
+        }
+        if to_read:
+            with self._tracer.span("youtube_rss", stage=True, channels=len(to_read)):
+                feeds.update(zip(
+                    to_read,
+                    await asyncio.gather(*(self._rss_entries(cid) for cid in to_read)),
+                ))
+
+        # Step 1: Classify new feed entries + scheduled broadcasts (1 unit / 50)
+        # (API time across steps 1 and 3 is reported as one stage)
+        api_seconds = 0.0
+        owners: dict[str, str] = {}
+        for channel_id, entries in feeds.items():
+            for video_id, _ in (entries or [])[:RSS_ENTRIES_CHECKED]:
+                if self._classified.get(video_id) != "none":
+                    owners[video_id] = channel_id  # New, unanswered or upcoming
+            for video_id in self._in_window(channel_id, now):
+                owners[video_id] = channel_id
+            for video_id in self._live_videos.get(channel_id, ()):
+                owners[video_id] = channel_id  # Re-verify streams that were live
+        videos: Optional[dict[str, dict]] = {}
+        if owners:
+            started = time.perf_counter()
+            with self._tracer.span("youtube_videos_list", videos=len(owners)):
+                videos = await self._videos_list(list(owners))
+            api_seconds += time.perf_counter() - started
+        if videos is not None:
+            for video_id, channel_id in owners.items():
+                self._index_video(channel_id, video_id, videos.get(video_id))
+            self._prune_classified(feeds)
+        videos_by_channel: dict[str, list[str]] = {}
+        for video_id, channel_id in owners.items():
+            videos_by_channel.setdefault(channel_id, []).append(video_id)
+
+        # Step 2: Decide per channel
+        fallback: list[str] = []
         for channel_id in channel_ids:
-            # Step 1: Free RSS pre-check
-            has_activity = await self._rss_has_recent_activity(channel_id)
-            if not has_activity:
-                self._log.debug(f"🔍 RSS: No recent activity for {channel_id} — skipping API")
+            entries = feeds[channel_id]
+            lookup_failed = videos is None and channel_id in videos_by_channel
+            if lookup_failed and channel_id in known_live:
+                continue  # Keep last-known live state until the lookup works again
+            if entries is None or lookup_failed:
+                fallback.append(channel_id)
                 continue
-
-            # Step 2: API check (costs quota)
-            status = await self._api_check_live(channel_id)
+            key = f"youtube:{channel_id}"
+            result.checked_keys.add(key)
+            for video_id in videos_by_channel.get(channel_id, ()):
+                item = (videos or {}).get(video_id)
+                if self._classified.get(video_id) == "live" and item:
+                    result.live.append(self._status_from_video(channel_id, item))
+                    break
+
+        # Step 3: Fallback — RSS recency + search.list (100 units)
+        checked_api = 0
+        for channel_id in fallback:
+            if not self._has_recent_activity(feeds[channel_id]):
+                self._log.debug(
+                    "🔍 RSS: No recent activity for %s — skipping API", channel_id,
+                    extra={"platform": "youtube", "stream": f"youtube:{channel_id}"},
+                )
+                result.checked_keys.add(f"youtube:{channel_id}")
+                continue
+            started = time.perf_counter()
+            with self._tracer.span("youtube_search", channel=channel_id):
+                checked, status = await self._api_check_live(channel_id)
+            api_seconds += time.perf_counter() - started
             checked_api += 1
+            if checked:
+                result.checked_keys.add(f"youtube:{channel_id}")
             if status:
-                live_statuses.append(status)
-
-        self._log.debug(
-            f"🔍 YouTube: {len(live_statuses)} live / {checked_api} API calls / "
-            f"{len(channel_ids)} total channels / ~{self._daily_quota_used} quota used today"
-        )
-        return live_statuses
+                result.live.append(status)
+
+        if owners or checked_api:
+            self._metrics.observe("puck_poll_stage_seconds", api_seconds, stage="youtube_api")
+        if self._log.isEnabledFor(logging.DEBUG):
+            # Skip the quota ledger walk entirely when DEBUG is off
+            self._log.debug(
+                "🔍 YouTube: %d live / %d video(s) looked up / %d search call(s) / "
+                "%d total channels / ~%d quota used today",
+                len(result.live), len(owners), checked_api, len(channel_ids),
+                self._quota.used_today,
+                extra={"platform": "youtube", "live": len(result.live)},
+            )
+        return result
+
+    def _prune_classified(self, feeds: dict[str, Optional[list[tuple[str, datetime]]]]) -> None:
+        """Forget classifications for videos that fell out of every checked feed."""
+        if len(self._classified) < 1000:
+            return
+        keep = {
+            video_id
+            for entries in feeds.values()
+            for video_id, _ in (entries or [])[:RSS_ENTRIES_CHECKED]
+        }
+        keep.update(v for upcoming in self._upcoming.values() for v in upcoming)
+        keep.update(v for live in self._live_videos.values() for v in live)
+        self._classified = {v: c for v, c in self._classified.items() if v in keep}
 
 
 def create_youtube_manager(
     config_manager: ConfigManager,
     logging_manager: LoggingConfigManager,
+    resilience_manager: ResilienceManager,
+    quota_manager: YouTubeQuotaManager,
+    metrics_manager: MetricsManager,
+    trace_manager: TraceManager,
 ) -> YouTubeManager:
     """Factory function — MANDATORY. Never call YouTubeManager directly."""
     return YouTubeManager(
         config_manager=config_manager,
         logging_manager=logging_manager,
+        resilience_manager=resilience_manager,
+        quota_manager=quota_manager,
+        metrics_manager=metrics_manager,
+        trace_manager=trace_manager,
     )
 
 
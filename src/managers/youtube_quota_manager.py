@@ -0,0 +1,194 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+YouTube API key pool for puck-bot. Holds every configured Data API key with
+its own daily quota ledger and exhaustion state, picks keys by smooth
+weighted round-robin (weight = remaining quota) and fails over to the next
+key with headroom when one is exhausted. Ledgers reset at midnight Pacific,
+when Google resets Data API quota.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+from zoneinfo import ZoneInfo
+
+from src.managers.config_manager import ConfigManager
+from src.managers.logging_config_manager import LoggingConfigManager
+
+QUOTA_TZ = ZoneInfo("America/Los_Angeles")  # Google resets quota at midnight PT
+
+
+@dataclass
+class ApiKeyLedger:
+    """One API key and today's usage against it."""
+
+    key: str = field(repr=False)
+    fingerprint: str                           # Safe to log and persist
+    daily_limit: int
+    used: int = 0
+    exhausted: bool = False
+    current_weight: int = 0                    # Smooth weighted round-robin state
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.daily_limit - self.used)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "used": self.used,
+            "remaining": self.remaining,
+            "exhausted": self.exhausted,
+        }
+
+
+def _fingerprint(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+
+
+def _quota_day() -> str:
+    """The current Data API quota day (Pacific date)."""
+    return datetime.now(QUOTA_TZ).strftime("%Y-%m-%d")
+
+
+class YouTubeQuotaManager:
+    """Selects YouTube API keys and tracks per-key daily quota."""
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logging_manager: LoggingConfigManager,
+    ) -> None:
+        self._config = config_manager
+        self._log = logging_manager.get_logger("youtube_quota")
+        limit = config_manager.snapshot.youtube_daily_quota_per_key
+        self._ledgers: list[ApiKeyLedger] = [
+            ApiKeyLedger(key=key, fingerprint=_fingerprint(key), daily_limit=limit)
+            for key in config_manager.get_youtube_api_keys()
+        ]
+        self._reset_date: Optional[str] = None
+        if len(self._ledgers) > 1:
+            self._log.info(f"ℹ️ YouTube key pool: {len(self._ledgers)} keys")
+
+    def _check_reset(self) -> None:
+        """Reset every ledger if a new quota day has started (midnight Pacific)."""
+        today = _quota_day()
+        if self._reset_date != today:
+            for ledger in self._ledgers:
+                ledger.used = 0
+                ledger.exhausted = False
+                ledger.current_weight = 0
+            self._reset_date = today
+            self._log.debug("🔍 YouTube quota ledgers reset for new day")
+
+    # -------------------------------------------------------------------------
+    # Selection
+    # -------------------------------------------------------------------------
+    @property
+    def configured(self) -> bool:
+        return bool(self._ledgers)
+
+    @property
+    def exhausted(self) -> bool:
+        """True when no key has headroom left today."""
+        self._check_reset()
+        return not any(not l.exhausted and l.remaining > 0 for l in self._ledgers)
+
+    def acquire(self, cost: int) -> Optional[ApiKeyLedger]:
+        """Pick the next key with at least `cost` units left, or None."""
+        self._check_reset()
+        candidates = [l for l in self._ledgers if not l.exhausted and l.remaining >= cost]
+        if not candidates:
+            return None
+        total = 0
+        for ledger in candidates:
+            ledger.current_weight += ledger.remaining
+            total += ledger.remaining
+        chosen = max(candidates, key=lambda l: l.current_weight)
+        chosen.current_weight -= total
+        return chosen
+
+    def charge(self, ledger: ApiKeyLedger, cost: int) -> None:
+        ledger.used += cost
+
+    def mark_exhausted(self, ledger: ApiKeyLedger, reason: str) -> None:
+        """Take a key out of rotation for the rest of the day."""
+        ledger.exhausted = True
+        if self.exhausted:
+            self._log.warning(
+                f"⚠️ YouTube key {ledger.fingerprint} {reason} — all keys exhausted, "
+                f"switching to RSS-only mode"
+            )
+        else:
+            self._log.warning(
+                f"⚠️ YouTube key {ledger.fingerprint} {reason} — failing over to next key"
+            )
+
+    # -------------------------------------------------------------------------
+    # Reporting + Warm Start
+    # -------------------------------------------------------------------------
+    @property
+    def used_today(self) -> int:
+        self._check_reset()
+        return sum(l.used for l in self._ledgers)
+
+    def ledgers(self) -> list[dict[str, Any]]:
+        """Per-key usage (exposed as a metric). Keys are fingerprinted."""
+        self._check_reset()
+        return [l.to_dict() for l in self._ledgers]
+
+    def export_warm_state(self) -> dict:
+        return {
+            "reset_date": self._reset_date,
+            "keys": {
+                l.fingerprint: {"used": l.used, "exhausted": l.exhausted}
+                for l in self._ledgers
+            },
+        }
+
+    def restore_warm_state(self, data: dict) -> None:
+        """Resume today's per-key ledgers so a restart doesn't forget spent units."""
+        today = _quota_day()
+        if data.get("reset_date") != today:
+            return
+        self._reset_date = today
+        keys = data.get("keys", {})
+        for ledger in self._ledgers:
+            saved = keys.get(ledger.fingerprint)
+            if saved:
+                ledger.used = int(saved.get("used", 0))
+                ledger.exhausted = bool(saved.get("exhausted", False))
+        self._log.debug(f"🔍 Restored YouTube quota ledgers: {self.used_today} used today")
+
+
+def create_youtube_quota_manager(
+    config_manager: ConfigManager,
+    logging_manager: LoggingConfigManager,
+) -> YouTubeQuotaManager:
+    """Factory function — MANDATORY. Never call YouTubeQuotaManager directly."""
+    return YouTubeQuotaManager(
+        config_manager=config_manager,
+        logging_manager=logging_manager,
+    )
+
+
+__all__ = ["YouTubeQuotaManager", "create_youtube_quota_manager", "ApiKeyLedger"]
@@ -0,0 +1,43 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Platform check result model. Separates "checked and offline" from "could
+not be checked" so an upstream outage serves last-known state instead of
+flipping every stream offline.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+from dataclasses import dataclass, field
+
+from src.models.stream_status import StreamStatus
+
+
+@dataclass
+class PlatformCheckResult:
+    """Outcome of one platform check across a set of tracked streams."""
+
+    live: list[StreamStatus] = field(default_factory=list)
+    checked_keys: set[str] = field(default_factory=set)    # Keys with a definitive answer
+
+    def merge(self, other: "PlatformCheckResult") -> None:
+        self.live.extend(other.live)
+        self.checked_keys.update(other.checked_keys)
+
+
+__all__ = ["PlatformCheckResult"]
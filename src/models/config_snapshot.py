@@ -0,0 +1,170 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Immutable, typed configuration snapshot. ConfigManager compiles the
+three-layer config stack into one of these at load and on hot-reload, so
+hot paths read plain attributes instead of re-parsing strings per call.
+----------------------------------------------------------------------------
+FILE VERSION: v1.15.1
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+# Snapshot attribute -> (section, key, type, hard fallback)
+SNAPSHOT_FIELDS: dict[str, tuple[str, str, type, Any]] = {
+    "token": ("bot", "token", str, ""),
+    "command_prefix": ("bot", "command_prefix", str, "!"),
+    "twitch_client_id": ("twitch", "client_id", str, ""),
+    "twitch_client_secret": ("twitch", "client_secret", str, ""),
+    "twitch_identity_ttl_hours": ("twitch", "identity_ttl_hours", int, 24),
+    "youtube_api_key": ("youtube", "api_key", str, ""),
+    "poll_interval": ("polling", "interval_seconds", int, 90),
+    "offline_grace_misses": ("polling", "offline_grace_misses", int, 2),
+    "offline_grace_seconds": ("polling", "offline_grace_seconds", int, 300),
+    "youtube_poll_multiplier": ("youtube", "poll_multiplier", int, 3),
+    "youtube_daily_quota_per_key": ("youtube", "daily_quota_per_key", int, 10000),
+    "guild_id": ("fluxer", "guild_id", str, ""),
+    "live_role_id": ("fluxer", "live_role_id", str, ""),
+    "announcement_channel_id": ("fluxer", "announcement_channel_id", str, ""),
+    "channel_name_live": ("fluxer", "channel_name_live", str, "🟢 Live Now"),
+    "channel_name_idle": ("fluxer", "channel_name_idle", str, "Live Now"),
+    "http2": ("http", "http2", bool, False),
+    "http_max_connections": ("http", "max_connections", int, 20),
+    "http_max_keepalive_connections": ("http", "max_keepalive_connections", int, 10),
+    "http_keepalive_expiry_seconds": ("http", "keepalive_expiry_seconds", int, 60),
+    "dns_cache_ttl_seconds": ("http", "dns_cache_ttl_seconds", int, 300),
+    "breaker_failure_threshold": ("resilience", "breaker_failure_threshold", int, 5),
+    "breaker_reset_seconds": ("resilience", "breaker_reset_seconds", int, 60),
+    "max_retries": ("resilience", "max_retries", int, 2),
+    "backoff_base_seconds": ("resilience", "backoff_base_seconds", float, 0.5),
+    "backoff_max_seconds": ("resilience", "backoff_max_seconds", float, 8.0),
+    "cycle_deadline_seconds": ("resilience", "cycle_deadline_seconds", int, 60),
+    "warm_start_enabled": ("warm_start", "enabled", bool, True),
+    "warm_start_save_interval_seconds": ("warm_start", "save_interval_seconds", int, 300),
+    "warm_start_max_age_seconds": ("warm_start", "max_age_seconds", int, 3600),
+    "schedule_enabled": ("schedule", "enabled", bool, True),
+    "schedule_cold_poll_multiplier": ("schedule", "cold_poll_multiplier", int, 4),
+    "schedule_min_sessions": ("schedule", "min_sessions", int, 4),
+    "schedule_hot_threshold": ("schedule", "hot_threshold", float, 0.15),
+    "schedule_window_hours": ("schedule", "window_hours", int, 1),
+    "metrics_enabled": ("metrics", "enabled", bool, False),
+    "metrics_host": ("metrics", "host", str, "0.0.0.0"),
+    "metrics_port": ("metrics", "port", int, 9464),
+    "slo_target_seconds": ("slo", "target_seconds", int, 180),
+    "slo_window_size": ("slo", "window_size", int, 500),
+    "trace_buffer_cycles": ("tracing", "buffer_cycles", int, 50),
+    "trace_export_enabled": ("tracing", "export_enabled", bool, False),
+    "trace_export_max_mb": ("tracing", "export_max_mb", int, 10),
+    "capture_enabled": ("capture", "enabled", bool, False),
+    "capture_max_mb": ("capture", "max_mb", int, 50),
+    "loop_monitor_enabled": ("loop_monitor", "enabled", bool, True),
+    "loop_lag_interval_ms": ("loop_monitor", "interval_ms", int, 250),
+    "loop_stall_threshold_ms": ("loop_monitor", "stall_threshold_ms", int, 250),
+    "profile_default_cycles": ("profiling", "default_cycles", int, 3),
+    "profile_max_cycles": ("profiling", "max_cycles", int, 20),
+    "profile_keep_files": ("profiling", "keep_files", int, 30),
+    "profile_top_allocations": ("profiling", "top_allocations", int, 25),
+    "log_repeat_window_seconds": ("logging", "repeat_window_seconds", int, 60),
+    "log_debug_sample_every": ("logging", "debug_sample_every", int, 10),
+    "health_enabled": ("health", "enabled", bool, True),
+    "health_host": ("health", "host", str, "0.0.0.0"),
+    "health_port": ("health", "port", int, 9465),
+    "health_stale_after_seconds": ("health", "stale_after_seconds", int, 600),
+    "health_restart_after_seconds": ("health", "restart_after_seconds", int, 600),
+    "health_gateway_grace_seconds": ("health", "gateway_grace_seconds", int, 120),
+}
+
+# Snapshot attributes whose values are masked in reload logs and errors
+SENSITIVE_FIELDS = {"token", "twitch_client_secret", "youtube_api_key"}
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Validated, typed view of the merged puck-bot configuration."""
+
+    token: str = field(default="", repr=False)
+    command_prefix: str = "!"
+    twitch_client_id: str = ""
+    twitch_client_secret: str = field(default="", repr=False)
+    twitch_identity_ttl_hours: int = 24
+    youtube_api_key: str = field(default="", repr=False)
+    poll_interval: int = 90
+    offline_grace_misses: int = 2
+    offline_grace_seconds: int = 300
+    youtube_poll_multiplier: int = 3
+    youtube_daily_quota_per_key: int = 10000
+    guild_id: str = ""
+    live_role_id: str = ""
+    announcement_channel_id: str = ""
+    channel_name_live: str = "🟢 Live Now"
+    channel_name_idle: str = "Live Now"
+    http2: bool = False
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry_seconds: int = 60
+    dns_cache_ttl_seconds: int = 300
+    breaker_failure_threshold: int = 5
+    breaker_reset_seconds: int = 60
+    max_retries: int = 2
+    backoff_base_seconds: float = 0.5
+    backoff_max_seconds: float = 8.0
+    cycle_deadline_seconds: int = 60
+    warm_start_enabled: bool = True
+    warm_start_save_interval_seconds: int = 300
+    warm_start_max_age_seconds: int = 3600
+    schedule_enabled: bool = True
+    schedule_cold_poll_multiplier: int = 4
+    schedule_min_sessions: int = 4
+    schedule_hot_threshold: float = 0.15
+    schedule_window_hours: int = 1
+    metrics_enabled: bool = False
+    metrics_host: str = "0.0.0.0"
+    metrics_port: int = 9464
+    slo_target_seconds: int = 180
+    slo_window_size: int = 500
+    trace_buffer_cycles: int = 50
+    trace_export_enabled: bool = False
+    trace_export_max_mb: int = 10
+    capture_enabled: bool = False
+    capture_max_mb: int = 50
+    loop_monitor_enabled: bool = True
+    loop_lag_interval_ms: int = 250
+    loop_stall_threshold_ms: int = 250
+    profile_default_cycles: int = 3
+    profile_max_cycles: int = 20
+    profile_keep_files: int = 30
+    profile_top_allocations: int = 25
+    log_repeat_window_seconds: int = 60
+    log_debug_sample_every: int = 10
+    health_enabled: bool = True
+    health_host: str = "0.0.0.0"
+    health_port: int = 9465
+    health_stale_after_seconds: int = 600
+    health_restart_after_seconds: int = 600
+    health_gateway_grace_seconds: int = 120
+
+    def changed_fields(self, other: "ConfigSnapshot") -> list[str]:
+        """Return names of fields whose values differ from other."""
+        return [
+            name for name in SNAPSHOT_FIELDS
+            if getattr(self, name) != getattr(other, name)
+        ]
+
+
+__all__ = ["ConfigSnapshot", "SNAPSHOT_FIELDS", "SENSITIVE_FIELDS"]
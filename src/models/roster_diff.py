@@ -0,0 +1,100 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Roster diff models. Flattens tracked_streams.json entries into per-platform
+stream keys and computes added/removed/changed sets between two rosters so
+hot-reloads only touch the streams that actually changed.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class RosterEntry:
+    """A single tracked platform account mapped to a Fluxer member."""
+
+    platform: str                              # "twitch" or "youtube"
+    platform_username: str                     # Twitch username or YouTube channel ID
+    fluxer_user_id: str
+    display_name: str
+
+    @property
+    def key(self) -> str:
+        """State key used across Puck: "platform:username"."""
+        return f"{self.platform}:{self.platform_username}"
+
+
+def roster_entries(streams: list[dict[str, Any]]) -> dict[str, RosterEntry]:
+    """Flatten tracked stream configs into {stream_key: RosterEntry}."""
+    entries: dict[str, RosterEntry] = {}
+    for stream in streams:
+        fuid = str(stream.get("fluxer_user_id") or "")
+        name = str(stream.get("display_name") or "")
+        if stream.get("twitch_username"):
+            entry = RosterEntry("twitch", stream["twitch_username"].lower(), fuid, name)
+            entries[entry.key] = entry
+        if stream.get("youtube_channel_id"):
+            entry = RosterEntry("youtube", stream["youtube_channel_id"], fuid, name)
+            entries[entry.key] = entry
+    return entries
+
+
+@dataclass
+class RosterDiff:
+    """Difference between two tracked-stream rosters, keyed by stream key."""
+
+    added: list[RosterEntry] = field(default_factory=list)
+    removed: list[RosterEntry] = field(default_factory=list)
+    changed: list[tuple[RosterEntry, RosterEntry]] = field(default_factory=list)  # (old, new)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    @classmethod
+    def between(
+        cls,
+        old_streams: list[dict[str, Any]],
+        new_streams: list[dict[str, Any]],
+    ) -> "RosterDiff":
+        """Compute the diff from old_streams to new_streams."""
+        old = roster_entries(old_streams)
+        new = roster_entries(new_streams)
+        diff = cls()
+        for key, entry in new.items():
+            previous = old.get(key)
+            if previous is None:
+                diff.added.append(entry)
+            elif previous != entry:
+                diff.changed.append((previous, entry))
+        for key, entry in old.items():
+            if key not in new:
+                diff.removed.append(entry)
+        return diff
+
+    def summary(self) -> str:
+        return (
+            f"+{len(self.added)} added / -{len(self.removed)} removed / "
+            f"~{len(self.changed)} changed"
+        )
+
+
+__all__ = ["RosterEntry", "RosterDiff", "roster_entries"]
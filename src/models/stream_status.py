@@ -14,8 +14,8 @@ MISSION - NEVER TO BE VIOLATED:
 Data models for stream status tracking. Defines the StreamStatus dataclass
 used throughout Puck to represent a tracked user's live/offline state.
 ----------------------------------------------------------------------------
-FILE VERSION: v1.0.0
-LAST MODIFIED: 2026-02-26
+FILE VERSION: v1.2.0
+LAST MODIFIED: 2026-10-19
 BOT: puck-bot
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/puck
@@ -42,10 +42,16 @@ class StreamStatus:
     thumbnail_url: Optional[str] = None
     stream_url: Optional[str] = None
     started_at: Optional[datetime] = None
+    avatar_url: Optional[str] = None           # Cached profile image (Twitch)
     last_checked: datetime = field(
         default_factory=lambda: datetime.now(timezone.utc)
     )
 
+    @property
+    def key(self) -> str:
+        """State key used across Puck: "platform:username"."""
+        return f"{self.platform}:{self.platform_username}"
+
     def to_dict(self) -> dict:
         """Serialize to dict for JSON persistence."""
         return {
@@ -60,6 +66,7 @@ class StreamStatus:
             "thumbnail_url": self.thumbnail_url,
             "stream_url": self.stream_url,
             "started_at": self.started_at.isoformat() if self.started_at else None,
+            "avatar_url": self.avatar_url,
             "last_checked": self.last_checked.isoformat(),
         }
 
@@ -84,6 +91,7 @@ class StreamStatus:
             thumbnail_url=data.get("thumbnail_url"),
             stream_url=data.get("stream_url"),
             started_at=started_at,
+            avatar_url=data.get("avatar_url"),
             last_checked=last_checked,
         )
 
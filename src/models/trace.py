@@ -0,0 +1,89 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Poll-cycle trace models. A CycleTrace is one poll cycle; its spans are the
+stages and calls inside it, linked by parent span ID. Serializes to the
+OTLP/JSON trace format so exported files load into standard tooling.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class Span:
+    """One timed stage or call inside a cycle."""
+
+    span_id: str                               # 16 hex chars
+    parent_id: Optional[str]
+    name: str
+    start_ns: int                              # Wall clock, Unix nanoseconds
+    duration: float = 0.0                      # Seconds (monotonic)
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def to_otlp(self, trace_id: str) -> dict[str, Any]:
+        return {
+            "traceId": trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.start_ns + int(self.duration * 1e9)),
+            "attributes": [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in self.attributes.items()
+            ],
+        }
+
+
+@dataclass
+class CycleTrace:
+    """All spans recorded during one poll cycle; spans[0] is the root."""
+
+    trace_id: str                              # 32 hex chars
+    spans: list[Span] = field(default_factory=list)
+    dropped: int = 0                           # Spans over the per-cycle cap
+
+    @property
+    def root(self) -> Span:
+        return self.spans[0]
+
+    def children(self, parent: Span) -> list[Span]:
+        return [s for s in self.spans if s.parent_id == parent.span_id]
+
+    def to_otlp(self, service_name: str) -> dict[str, Any]:
+        """One OTLP/JSON ExportTraceServiceRequest for this cycle."""
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service_name}}
+                    ]
+                },
+                "scopeSpans": [{
+                    "scope": {"name": "puck"},
+                    "spans": [span.to_otlp(self.trace_id) for span in self.spans],
+                }],
+            }]
+        }
+
+
+__all__ = ["Span", "CycleTrace"]
@@ -0,0 +1,72 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Twitch identity model. Ties a configured Twitch login to the streamer's
+immutable Helix user ID plus the cached profile data embeds can reuse.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class TwitchIdentity:
+    """A resolved Twitch account, keyed in the cache by its configured login."""
+
+    user_id: str                               # Immutable Helix user ID
+    login: str                                 # Current login (may differ after a rename)
+    display_name: str
+    profile_image_url: Optional[str] = None
+    resolved_at: float = 0.0                   # Unix epoch seconds
+
+    def to_dict(self) -> dict:
+        """Serialize to dict for JSON persistence."""
+        return {
+            "user_id": self.user_id,
+            "login": self.login,
+            "display_name": self.display_name,
+            "profile_image_url": self.profile_image_url,
+            "resolved_at": self.resolved_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TwitchIdentity":
+        """Deserialize from dict (JSON persistence)."""
+        return cls(
+            user_id=str(data["user_id"]),
+            login=data["login"],
+            display_name=data.get("display_name", data["login"]),
+            profile_image_url=data.get("profile_image_url"),
+            resolved_at=float(data.get("resolved_at", 0.0)),
+        )
+
+    @classmethod
+    def from_helix(cls, user: dict, resolved_at: float) -> "TwitchIdentity":
+        """Build from one entry of a /helix/users response."""
+        return cls(
+            user_id=str(user["id"]),
+            login=user.get("login", "").lower(),
+            display_name=user.get("display_name") or user.get("login", ""),
+            profile_image_url=user.get("profile_image_url") or None,
+            resolved_at=resolved_at,
+        )
+
+
+__all__ = ["TwitchIdentity"]
@@ -0,0 +1,82 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Minimal GET-only HTTP/1.1 listener behind the /metrics and /healthz
+endpoints. Each path maps to a callable returning (status line, body);
+anything else is a 404. One request per connection, headers ignored.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+from typing import Callable, Optional
+
+# Path -> callable returning (status line, body), e.g. ("200 OK", b"...")
+Routes = dict[str, Callable[[], tuple[str, bytes]]]
+
+READ_TIMEOUT = 5  # Seconds to wait for the request line and each header
+
+
+class HttpListener:
+    """Serves a fixed table of GET routes on one host and port."""
+
+    def __init__(self, routes: Routes, content_type: str, not_found: bytes = b"not found\n") -> None:
+        self._routes = routes
+        self._content_type = content_type
+        self._not_found = not_found
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer one request from the route table."""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=READ_TIMEOUT)
+            while (await asyncio.wait_for(reader.readline(), timeout=READ_TIMEOUT)) not in (b"\r\n", b"\n", b""):
+                pass  # Headers are not needed
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?")[0] if len(parts) >= 2 and parts[0] == "GET" else ""
+            route = self._routes.get(path)
+            status, body = route() if route is not None else ("404 Not Found", self._not_found)
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {self._content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode("latin-1") + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError, UnicodeDecodeError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str, port: int) -> None:
+        """Bind and start serving. Raises OSError if the port can't be bound."""
+        if self._server is None:
+            self._server = await asyncio.start_server(self._handle, host, port)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+
+__all__ = ["HttpListener", "Routes"]
@@ -0,0 +1,88 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Regression tests for the circuit breaker's half-open trial slot.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+from pathlib import Path
+
+import httpx
+
+from src.managers.config_manager import create_config_manager
+from src.managers.http_transport_manager import create_http_transport_manager
+from src.managers.logging_config_manager import create_logging_config_manager
+from src.managers.metrics_manager import create_metrics_manager
+from src.managers.resilience_manager import CircuitBreaker, create_resilience_manager
+from src.managers.trace_manager import create_trace_manager
+
+CONFIG_PATH = Path(__file__).resolve().parents[1] / "src" / "config" / "puck_config.json"
+URL = "https://api.twitch.tv/helix/streams"
+
+
+def _resilience(tmp_path: Path, statuses: list[int]):
+    """A resilience manager whose upstream answers with `statuses`, in order.
+
+    The list is consumed as requests arrive, so it can be filled after the
+    config is loaded.
+    """
+    streams = tmp_path / "tracked_streams.json"
+    streams.write_text('{"streams": []}', encoding="utf-8")
+    config = create_config_manager(config_path=str(CONFIG_PATH), streams_path=str(streams))
+    logging_mgr = create_logging_config_manager(log_level="CRITICAL", app_name="puck-test")
+    metrics = create_metrics_manager(config, logging_mgr)
+    tracer = create_trace_manager(
+        config, logging_mgr, metrics, export_file=str(tmp_path / "traces.jsonl")
+    )
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(statuses.pop(0), headers={"Retry-After": "0"})
+    )
+    http = create_http_transport_manager(config, logging_mgr, transport=transport)
+    return config, create_resilience_manager(config, logging_mgr, http, metrics, tracer)
+
+
+def test_half_open_trial_ending_in_429_releases_the_slot(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        statuses: list[int] = []
+        config, resilience = _resilience(tmp_path, statuses)
+        snapshot = config.snapshot
+        attempts = snapshot.max_retries + 1
+        statuses += (
+            [503] * attempts * snapshot.breaker_failure_threshold  # Open the breaker
+            + [429] * attempts                                     # Trial: throttled
+            + [200]                                                # Next trial
+        )
+        breaker = resilience.breaker("twitch")
+
+        for _ in range(snapshot.breaker_failure_threshold):
+            await resilience.request("twitch", "GET", URL)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        breaker._opened_at -= snapshot.breaker_reset_seconds  # Reset window elapsed
+        response = await resilience.request("twitch", "GET", URL)
+        assert response.status_code == 429
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+        # Without the slot released this raised CircuitOpenError forever
+        response = await resilience.request("twitch", "GET", URL)
+        assert response.status_code == 200
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())
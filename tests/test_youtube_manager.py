@@ -0,0 +1,123 @@
+"""
+============================================================================
+Bragi: Bot Infrastructure for The Alphabet Cartel
+The Alphabet Cartel - https://fluxer.gg/yGJfJH5C | alphabetcartel.net
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Welcome  → Greet and orient new members to our chosen family
+    Moderate → Support staff with tools that keep our space safe
+    Support  → Connect members to resources, information, and each other
+    Sustain  → Run reliably so our community always has what it needs
+
+============================================================================
+Regression tests for YouTube broadcasts that go live outside their
+scheduled window, or that videos.list could not classify at first.
+----------------------------------------------------------------------------
+FILE VERSION: v1.0.0
+LAST MODIFIED: 2026-10-19
+BOT: puck-bot
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/puck
+============================================================================
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+import httpx
+import pytest
+
+from src.managers.config_manager import create_config_manager
+from src.managers.http_transport_manager import create_http_transport_manager
+from src.managers.logging_config_manager import create_logging_config_manager
+from src.managers.metrics_manager import create_metrics_manager
+from src.managers.resilience_manager import create_resilience_manager
+from src.managers.trace_manager import create_trace_manager
+from src.managers.youtube_manager import create_youtube_manager
+from src.managers.youtube_quota_manager import create_youtube_quota_manager
+
+CONFIG_PATH = Path(__file__).resolve().parents[1] / "src" / "config" / "puck_config.json"
+CHANNEL = "UCpuckTestChannel000000"
+VIDEO = "vid00000001"
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _item(content: str, scheduled: Optional[datetime]) -> dict:
+    details = {"scheduledStartTime": _iso(scheduled)} if scheduled else {}
+    if content == "live":
+        details["actualStartTime"] = _iso(datetime.now(timezone.utc))
+    return {
+        "id": VIDEO,
+        "snippet": {"channelTitle": "Puck Test", "title": "Stream", "liveBroadcastContent": content},
+        "liveStreamingDetails": details,
+    }
+
+
+def _youtube(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, videos: dict[str, dict]):
+    """A YouTube manager whose feed lists VIDEO and whose videos.list serves `videos`."""
+    key_file = tmp_path / "youtube_api_key"
+    key_file.write_text("test-key", encoding="utf-8")
+    monkeypatch.setenv("YOUTUBE_API_KEY_FILE", str(key_file))
+    streams = tmp_path / "tracked_streams.json"
+    streams.write_text('{"streams": []}', encoding="utf-8")
+
+    feed = (
+        '<feed xmlns="http://www.w3.org/2005/Atom" '
+        'xmlns:yt="http://www.youtube.com/xml/schemas/2015">'
+        f"<entry><yt:videoId>{VIDEO}</yt:videoId>"
+        f"<published>{_iso(datetime.now(timezone.utc) - timedelta(days=2))}</published></entry>"
+        "</feed>"
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/videos.xml"):
+            return httpx.Response(200, text=feed)
+        if request.url.path.endswith("/videos"):
+            ids = request.url.params["id"].split(",")
+            return httpx.Response(200, json={"items": [videos[v] for v in ids if v in videos]})
+        return httpx.Response(200, json={"items": []})  # search.list: nothing live
+
+    config = create_config_manager(config_path=str(CONFIG_PATH), streams_path=str(streams))
+    logging_mgr = create_logging_config_manager(log_level="CRITICAL", app_name="puck-test")
+    metrics = create_metrics_manager(config, logging_mgr)
+    tracer = create_trace_manager(
+        config, logging_mgr, metrics, export_file=str(tmp_path / "traces.jsonl")
+    )
+    http = create_http_transport_manager(config, logging_mgr, transport=httpx.MockTransport(handler))
+    resilience = create_resilience_manager(config, logging_mgr, http, metrics, tracer)
+    quota = create_youtube_quota_manager(config, logging_mgr)
+    return create_youtube_manager(config, logging_mgr, resilience, quota, metrics, tracer)
+
+
+@pytest.mark.parametrize(
+    "before",
+    [
+        pytest.param(_item("upcoming", datetime.now(timezone.utc) + timedelta(hours=1)), id="early-start"),
+        pytest.param(_item("upcoming", datetime.now(timezone.utc) - timedelta(hours=3)), id="late-start"),
+        pytest.param(_item("upcoming", None), id="no-schedule"),
+        pytest.param(None, id="missing-from-lookup"),
+    ],
+)
+def test_broadcast_going_live_outside_its_window_is_detected(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, before: Optional[dict]
+) -> None:
+    async def scenario() -> None:
+        videos: dict[str, dict] = {VIDEO: before} if before else {}
+        youtube = _youtube(tmp_path, monkeypatch, videos)
+
+        result = await youtube.check_streams([CHANNEL])
+        assert f"youtube:{CHANNEL}" in result.checked_keys
+        assert not result.live
+        assert youtube.scheduled_channels([CHANNEL]) == []  # Outside any window
+
+        videos[VIDEO] = _item("live", None)
+        result = await youtube.check_streams([CHANNEL])
+        assert [s.platform_username for s in result.live] == [CHANNEL]
+
+    asyncio.run(scenario())